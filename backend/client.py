@@ -1,9 +1,11 @@
 """FastAPI client for logging game sessions to the database."""
 
+import json
 import sys
+import time
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 import httpx
 
@@ -12,15 +14,62 @@ sys.path.append(str(Path(__file__).parent.parent))
 from logging_utils import get_logger
 
 from .db.models import Session
-from .server.schemas import SessionCreate, SessionUpdate
+from .server.schemas import (
+    MAX_BEST_SCORE_LOOKUP_PLAYERS,
+    MAX_BULK_SESSIONS,
+    PlayersBestScoresRequest,
+    SessionCheckpoint,
+    SessionCreate,
+    SessionsBulkCreate,
+    SessionUpdate,
+)
+from .server.wire_format import (
+    SESSION_MEDIA_TYPE,
+    decode_payload,
+    encode_session,
+    encode_session_update,
+)
+
+
+def _to_session(data: Any) -> Session:
+    """Build a Session from a JSON object, passing decoded binary sessions through."""
+    return data if isinstance(data, Session) else Session(**data)
+
+
+def apply_leaderboard_event(
+    leaderboard: list[Session], event: str, data: dict
+) -> list[Session]:
+    """Apply a /leaderboard/stream snapshot or diff event to a leaderboard."""
+    if event == "snapshot":
+        return [Session(**session) for session in data["sessions"]]
+    updated = leaderboard[: data["size"]]
+    for change in data["changed"]:
+        index = change["rank"] - 1
+        session = Session(**change["session"])
+        if index < len(updated):
+            updated[index] = session
+        else:
+            updated.append(session)
+    return updated
 
 
 class FastAPIClient:
     """Client for communicating with the FastAPI server."""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        """Initialize the client with the server base URL."""
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        max_retries: int = 2,
+        use_binary: bool = False,
+    ):
+        """Initialize the client with the server base URL.
+
+        With use_binary, session payloads use the compact binary wire format
+        instead of JSON.
+        """
         self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.use_binary = use_binary
         self.client = httpx.Client(timeout=10.0)
         self.logger = get_logger(__name__)
 
@@ -46,23 +95,67 @@ class FastAPIClient:
         endpoint: str,
         operation_name: str,
         json_data: Optional[dict] = None,
-    ) -> Optional[dict]:
-        """Make an HTTP request with common error handling."""
-        try:
-            response = self.client.request(
-                method, f"{self.base_url}{endpoint}", json=json_data
-            )
-            response.raise_for_status()
-            return response.json()
-        except (httpx.RequestError, httpx.HTTPStatusError) as e:
-            self.logger.error(f"Failed to {operation_name}: {e}")
-            return None
+        idempotency_key: Optional[str] = None,
+        content: Optional[bytes] = None,
+    ) -> Optional[Any]:
+        """Make an HTTP request with common error handling.
+
+        Returns decoded JSON, or Session model(s) for binary session responses.
+        A binary request body is passed as content instead of json_data.
+
+        Connection errors and 5xx responses are retried for requests that are
+        safe to repeat: reads, checkpoints, and writes carrying an idempotency key.
+        The same key is sent on every attempt so the server applies the write once.
+        """
+        headers = {}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        if self.use_binary:
+            headers["Accept"] = f"{SESSION_MEDIA_TYPE}, application/json"
+        if content is not None:
+            headers["Content-Type"] = SESSION_MEDIA_TYPE
+        can_retry = method in ("GET", "PATCH") or idempotency_key is not None
+        attempts = 1 + (self.max_retries if can_retry else 0)
+
+        for attempt in range(attempts):
+            try:
+                response = self.client.request(
+                    method,
+                    f"{self.base_url}{endpoint}",
+                    json=json_data,
+                    content=content,
+                    headers=headers,
+                )
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "")
+                if content_type.startswith(SESSION_MEDIA_TYPE):
+                    return decode_payload(response.content)
+                # Some endpoints (e.g. checkpoints) reply 204 with an empty body
+                return response.json() if response.content else {}
+            except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                is_retryable = isinstance(e, httpx.RequestError) or (
+                    e.response.status_code >= 500
+                )
+                if is_retryable and attempt + 1 < attempts:
+                    self.logger.warning(f"Retrying {operation_name} after error: {e}")
+                    time.sleep(0.1 * 2**attempt)
+                    continue
+                self.logger.error(f"Failed to {operation_name}: {e}")
+                return None
 
     def create_session(
-        self, player_name: str, earned: float = 0.0, spent: float = 0.0
+        self,
+        player_name: str,
+        earned: float = 0.0,
+        spent: float = 0.0,
+        session_id: Optional[str] = None,
     ) -> Optional[Session]:
-        """Create a new game session."""
-        session_id = str(uuid.uuid4())
+        """Create a new game session.
+
+        The idempotency key is derived from the session ID, so replaying a create
+        with the same session_id can never produce a duplicate session.
+        """
+        session_id = session_id or str(uuid.uuid4())
         session_data = SessionCreate(
             player_name=player_name,
             session_id=session_id,
@@ -72,32 +165,100 @@ class FastAPIClient:
         )
 
         response_data = self._make_request(
-            "POST", "/sessions/", "create session", session_data.dict()
+            "POST",
+            "/sessions/",
+            "create session",
+            None if self.use_binary else session_data.dict(),
+            idempotency_key=f"create-{session_id}",
+            content=encode_session(session_data) if self.use_binary else None,
         )
-        return Session(**response_data) if response_data else None
+        return _to_session(response_data) if response_data else None
+
+    def create_sessions_bulk(self, sessions: list[SessionCreate]) -> int:
+        """Create many finished sessions, sent in batches of MAX_BULK_SESSIONS.
+
+        Sessions whose ID already exists are skipped, so resending is harmless.
+        Returns the number of sessions created.
+        """
+        created = 0
+        for start in range(0, len(sessions), MAX_BULK_SESSIONS):
+            batch = SessionsBulkCreate(
+                sessions=sessions[start : start + MAX_BULK_SESSIONS]
+            )
+            response_data = self._make_request(
+                "POST",
+                "/sessions/bulk",
+                "create sessions in bulk",
+                batch.model_dump(mode="json"),
+            )
+            if not response_data:
+                break
+            created += response_data["created"]
+        return created
 
     def update_session(
-        self, session_id: str, earned: float, spent: float
+        self,
+        session_id: str,
+        earned: float,
+        spent: float,
+        idempotency_key: Optional[str] = None,
+        input_trace: Optional[bytes] = None,
     ) -> Optional[Session]:
-        """Update an existing session with final scores."""
+        """Update an existing session with final scores.
+
+        Pass the same idempotency_key when replaying an update to apply it once.
+        With the game's input_trace the server replays the game and only accepts
+        the scores if they match.
+        """
         session_update = SessionUpdate(
             earned=earned, spent=spent, net_income=earned - spent
         )
+        if input_trace is not None:
+            session_update.input_trace = input_trace
 
         response_data = self._make_request(
             "PUT",
             f"/sessions/{session_id}",
             "update session",
-            session_update.dict(exclude_unset=True),
+            None
+            if self.use_binary
+            else session_update.model_dump(mode="json", exclude_unset=True),
+            idempotency_key=idempotency_key or str(uuid.uuid4()),
+            content=encode_session_update(session_update) if self.use_binary else None,
+        )
+        return _to_session(response_data) if response_data else None
+
+    def checkpoint_session(self, session_id: str, earned: float, spent: float) -> bool:
+        """Send a live score checkpoint for an in-progress session."""
+        checkpoint = SessionCheckpoint(earned=earned, spent=spent)
+
+        response_data = self._make_request(
+            "PATCH",
+            f"/sessions/{session_id}/checkpoint",
+            "checkpoint session",
+            checkpoint.dict(),
+        )
+        return response_data is not None
+
+    def get_live_sessions(
+        self, window_seconds: int = 30, limit: int = 10
+    ) -> list[Session]:
+        """Get sessions with a recent live checkpoint, best scores first."""
+        response_data = self._make_request(
+            "GET",
+            f"/sessions/live?window_seconds={window_seconds}&limit={limit}",
+            "get live sessions",
+        )
+        return (
+            [_to_session(session) for session in response_data] if response_data else []
         )
-        return Session(**response_data) if response_data else None
 
     def get_session(self, session_id: str) -> Optional[Session]:
         """Get a session by session ID."""
         response_data = self._make_request(
             "GET", f"/sessions/{session_id}", "get session"
         )
-        return Session(**response_data) if response_data else None
+        return _to_session(response_data) if response_data else None
 
     def get_sessions_by_player(self, player_name: str) -> list[Session]:
         """Get all sessions for a specific player."""
@@ -105,7 +266,7 @@ class FastAPIClient:
             "GET", f"/sessions/player/{player_name}", "get sessions for player"
         )
         return (
-            [Session(**session) for session in response_data] if response_data else []
+            [_to_session(session) for session in response_data] if response_data else []
         )
 
     def get_leaderboard(self, limit: int = 10) -> list[Session]:
@@ -114,12 +275,58 @@ class FastAPIClient:
             "GET", f"/leaderboard/?limit={limit}", "get leaderboard"
         )
         return (
-            [Session(**session) for session in response_data] if response_data else []
+            [_to_session(session) for session in response_data] if response_data else []
         )
 
+    def stream_leaderboard(self) -> Iterator[list[Session]]:
+        """Follow the live leaderboard, yielding the top entries after every change.
+
+        Blocks between updates; stop iterating to disconnect.
+        """
+        leaderboard: list[Session] = []
+        event = None
+        try:
+            with self.client.stream(
+                "GET",
+                f"{self.base_url}/leaderboard/stream",
+                timeout=httpx.Timeout(10.0, read=None),
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line.startswith("event: "):
+                        event = line.removeprefix("event: ")
+                    elif line.startswith("data: "):
+                        data = json.loads(line.removeprefix("data: "))
+                        leaderboard = apply_leaderboard_event(leaderboard, event, data)
+                        yield leaderboard
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            self.logger.error(f"Failed to stream leaderboard: {e}")
+
     def get_player_best_score(self, player_name: str) -> Optional[Session]:
         """Get the best score for a specific player."""
         response_data = self._make_request(
             "GET", f"/leaderboard/player/{player_name}", "get player best score"
         )
-        return Session(**response_data) if response_data else None
+        return _to_session(response_data) if response_data else None
+
+    def get_players_best_scores(self, player_names: list[str]) -> dict[str, Session]:
+        """Get the best score for each of several players in one request.
+
+        Lists longer than the server accepts are split into a few requests.
+        Players without any sessions are missing from the returned mapping.
+        """
+        best_scores: dict[str, Session] = {}
+        for start in range(0, len(player_names), MAX_BEST_SCORE_LOOKUP_PLAYERS):
+            request = PlayersBestScoresRequest(
+                player_names=player_names[start : start + MAX_BEST_SCORE_LOOKUP_PLAYERS]
+            )
+            response_data = self._make_request(
+                "POST",
+                "/leaderboard/players",
+                "get players best scores",
+                request.dict(),
+            )
+            for session in response_data or []:
+                session = _to_session(session)
+                best_scores[session.player_name] = session
+        return best_scores
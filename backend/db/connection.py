@@ -5,6 +5,7 @@ from typing import Generator
 
 # SQLite database path - use absolute path to avoid issues when running from different directories
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), "nyc_pizza.db")
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
 
 
 @contextmanager
@@ -26,3 +27,32 @@ def get_db_dependency() -> Generator[sqlite3.Connection, None, None]:
     """FastAPI dependency that provides a fresh database connection per request."""
     with get_db_connection() as conn:
         yield conn
+
+
+def apply_migrations() -> None:
+    """Apply pending SQL migrations in filename order.
+
+    Applied migrations are recorded in the schema_migrations table so that
+    non-idempotent statements (e.g. ALTER TABLE) only ever run once.
+    """
+    with get_db_connection() as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version VARCHAR PRIMARY KEY,
+                applied_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL
+            )
+        """
+        )
+        applied = {
+            row["version"]
+            for row in conn.execute("SELECT version FROM schema_migrations")
+        }
+        for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+            if not filename.endswith(".sql") or filename in applied:
+                continue
+            with open(os.path.join(MIGRATIONS_DIR, filename)) as migration_file:
+                conn.executescript(migration_file.read())
+            conn.execute(
+                "INSERT INTO schema_migrations (version) VALUES (?)", (filename,)
+            )
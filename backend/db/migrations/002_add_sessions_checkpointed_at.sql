@@ -0,0 +1,8 @@
+-- Migration: Add live checkpoint timestamp to sessions
+-- Created: 2026-10-19
+-- Description: Tracks when a session last received a live score checkpoint
+
+ALTER TABLE sessions ADD COLUMN checkpointed_at DATETIME;
+
+-- Index used by the live scores view
+CREATE INDEX IF NOT EXISTS idx_sessions_checkpointed_at ON sessions(checkpointed_at);
@@ -0,0 +1,17 @@
+-- Migration: Create idempotency keys table
+-- Created: 2026-10-19
+-- Description: Stores recent responses to session writes so retried requests can be replayed
+
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    idempotency_key VARCHAR NOT NULL,
+    method VARCHAR NOT NULL,
+    path VARCHAR NOT NULL,
+    request_hash VARCHAR NOT NULL,
+    status_code INTEGER NOT NULL,
+    response_body TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    PRIMARY KEY (idempotency_key, method, path)
+);
+
+-- Index used to expire and cap stored keys
+CREATE INDEX IF NOT EXISTS idx_idempotency_keys_created_at ON idempotency_keys(created_at);
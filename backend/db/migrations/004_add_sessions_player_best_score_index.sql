@@ -0,0 +1,5 @@
+-- Migration: Add player best score index
+-- Created: 2026-10-19
+-- Description: Lets per-player best score lookups read one index range instead of sorting
+
+CREATE INDEX IF NOT EXISTS idx_sessions_player_name_net_income ON sessions(player_name, net_income DESC);
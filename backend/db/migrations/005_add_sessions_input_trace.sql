@@ -0,0 +1,5 @@
+-- Migration: Add input trace to sessions
+-- Created: 2026-10-19
+-- Description: Keeps the replay-verified input trace of a finished game so it can be re-scored later
+
+ALTER TABLE sessions ADD COLUMN input_trace BLOB;
@@ -0,0 +1,5 @@
+-- Migration: Add ranked flag to sessions
+-- Created: 2026-10-19
+-- Description: Keeps unverified bulk-created sessions (bot league runs) off the leaderboard
+
+ALTER TABLE sessions ADD COLUMN ranked BOOLEAN DEFAULT 1 NOT NULL;
@@ -0,0 +1,5 @@
+-- Migration: Add server-issued game seed to sessions
+-- Created: 2026-10-19
+-- Description: The order seed a session's game must be played with, so an input trace only verifies for the session it was issued to
+
+ALTER TABLE sessions ADD COLUMN game_seed INTEGER;
@@ -13,6 +13,9 @@ class Session(BaseModel):
     earned: float = 0.0
     spent: float = 0.0
     net_income: float = 0.0
+    # Order seed issued by the server at creation; the game must be played
+    # with it for its input trace to verify
+    game_seed: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -32,4 +35,5 @@ class Session(BaseModel):
             earned=row["earned"],
             spent=row["spent"],
             net_income=row["net_income"],
+            game_seed=row["game_seed"],
         )
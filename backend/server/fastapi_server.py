@@ -1,23 +1,143 @@
 import sqlite3
-from typing import List
+from contextlib import asynccontextmanager
+from typing import List, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from backend.db.connection import get_db_dependency
+from backend.db.connection import (
+    apply_migrations,
+    get_db_connection,
+    get_db_dependency,
+)
 from backend.db.models import Session
-from backend.server.schemas import SessionCreate, SessionUpdate
+from backend.server.idempotency_handler import IdempotencyHandler, hash_request_body
+from backend.server.leaderboard_broadcaster import LeaderboardBroadcaster
+from backend.server.negotiation import (
+    accepts_binary,
+    negotiated_body_openapi,
+    session_create_body,
+    session_response,
+    session_update_body,
+)
+from backend.server.replay_verifier import ReplayVerifier
+from backend.server.schemas import (
+    PlayersBestScoresRequest,
+    SessionCheckpoint,
+    SessionCreate,
+    SessionsBulkCreate,
+    SessionsBulkCreateResult,
+    SessionUpdate,
+)
 from backend.server.sessions_handler import SessionsHandler
+from gameplay.input_trace import InputTraceError
+from gameplay.simulation import new_seed
 from logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Bring the database schema up to date and start replay workers before serving requests"""
+    apply_migrations()
+    replay_verifier.start()
+    yield
+    replay_verifier.shutdown()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="NYC Pizza Game API",
     description="API for managing game sessions",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Pushes top-K leaderboard changes to /leaderboard/stream subscribers
+leaderboard_broadcaster = LeaderboardBroadcaster()
+
+# Re-simulates submitted input traces in worker processes
+replay_verifier = ReplayVerifier()
+
+
+def replay_idempotent_request(
+    handler: IdempotencyHandler,
+    idempotency_key: str,
+    request: Request,
+    request_hash: str,
+) -> Optional[Response]:
+    """Return the original response if this request is a retry of a stored one"""
+    stored = handler.get_response(idempotency_key, request.method, request.url.path)
+    if stored is None:
+        return None
+    if stored.request_hash != request_hash:
+        logger.warning(
+            f"Idempotency-Key reused with a different body: {idempotency_key}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Idempotency-Key was already used for a different request",
+        )
+    logger.info(f"Replaying stored response for Idempotency-Key: {idempotency_key}")
+    if accepts_binary(request):
+        return session_response(
+            request,
+            Session.model_validate_json(stored.response_body),
+            stored.status_code,
+        )
+    return Response(
+        content=stored.response_body,
+        status_code=stored.status_code,
+        media_type="application/json",
+    )
+
+
+def reject_final_session(session_id: str):
+    """Refuse a score write to a session whose final score was replay-verified"""
+    logger.warning(f"Rejected write to final session: {session_id}")
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Session score is final and was verified by replay",
+    )
+
+
+async def verify_replayed_score(
+    session_update: SessionUpdate, game_seed: Optional[int]
+) -> SessionUpdate:
+    """Replay the update's input trace and reject a score that doesn't match it"""
+    if game_seed is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Session has no game seed to verify an input trace against",
+        )
+    try:
+        replayed = await replay_verifier.replay(session_update.input_trace, game_seed)
+    except InputTraceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid input trace: {e}",
+        )
+    for field in ("earned", "spent", "net_income"):
+        submitted = getattr(session_update, field)
+        expected = getattr(replayed, field)
+        if submitted is not None and submitted != expected:
+            logger.warning(
+                f"Rejected score: submitted {field} {submitted}, replay gives {expected}"
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Submitted {field} does not match the replayed game",
+            )
+    # Fill in anything the client left out from the replay
+    return session_update.model_copy(
+        update={
+            "earned": replayed.earned,
+            "spent": replayed.spent,
+            "net_income": replayed.net_income,
+        }
+    )
+
 
 @app.get("/")
 async def root():
@@ -26,14 +146,34 @@ async def root():
     return {"message": "NYC Pizza Game API is running!"}
 
 
-@app.post("/sessions/", response_model=Session, status_code=status.HTTP_201_CREATED)
+@app.post(
+    "/sessions/",
+    response_model=Session,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=negotiated_body_openapi(SessionCreate),
+)
 async def create_new_session(
-    session: SessionCreate, db: sqlite3.Connection = Depends(get_db_dependency)
+    request: Request,
+    session: SessionCreate = Depends(session_create_body),
+    idempotency_key: Optional[str] = Header(default=None),
+    db: sqlite3.Connection = Depends(get_db_dependency),
 ):
-    """Create a new game session"""
+    """Create a new game session.
+
+    The server issues the session's game seed; the game must be played with
+    it for its input trace to verify.
+    """
     logger.info(
         f"Creating new session for player: {session.player_name}, session_id: {session.session_id}"
     )
+    idempotency = IdempotencyHandler(db)
+    if idempotency_key:
+        request_hash = hash_request_body(session.model_dump_json())
+        replay = replay_idempotent_request(
+            idempotency, idempotency_key, request, request_hash
+        )
+        if replay is not None:
+            return replay
     try:
         handler = SessionsHandler(db)
         # Check if session_id already exists
@@ -45,9 +185,29 @@ async def create_new_session(
                 detail="Session ID already exists",
             )
 
-        created_session = handler.create_session(session)
+        # The session and its idempotency record commit together, so a retry
+        # after a crash either finds both or applies the write again
+        with db:
+            created_session = handler.create_session(
+                session, game_seed=new_seed(), commit=False
+            )
+            if idempotency_key:
+                idempotency.save_response(
+                    idempotency_key,
+                    request.method,
+                    request.url.path,
+                    request_hash,
+                    status.HTTP_201_CREATED,
+                    created_session.model_dump_json(),
+                    commit=False,
+                )
+        leaderboard_broadcaster.session_written(
+            handler, created_session.session_id, created_session.net_income
+        )
         logger.info(f"Successfully created session: {session.session_id}")
-        return created_session
+        return session_response(request, created_session, status.HTTP_201_CREATED)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in create_new_session: {e}", exc_info=True)
         raise HTTPException(
@@ -56,19 +216,57 @@ async def create_new_session(
         )
 
 
+@app.post(
+    "/sessions/bulk",
+    response_model=SessionsBulkCreateResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_sessions_bulk(
+    bulk: SessionsBulkCreate,
+    db: sqlite3.Connection = Depends(get_db_dependency),
+):
+    """Create many finished sessions at once, e.g. bot league results.
+
+    Sessions whose ID already exists are skipped, so a batch can be resent.
+    Their scores aren't replay-verified, so they are kept off the leaderboard.
+    """
+    handler = SessionsHandler(db)
+    created = handler.create_sessions(bulk.sessions)
+    logger.info(f"Bulk created {created} of {len(bulk.sessions)} sessions")
+    return SessionsBulkCreateResult(created=created)
+
+
 @app.get("/sessions/", response_model=List[Session])
 async def read_sessions(
-    skip: int = 0, limit: int = 100, db: sqlite3.Connection = Depends(get_db_dependency)
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    db: sqlite3.Connection = Depends(get_db_dependency),
 ):
     """Get all sessions with pagination"""
     handler = SessionsHandler(db)
     sessions = handler.get_all_sessions(skip=skip, limit=limit)
-    return sessions
+    return session_response(request, sessions)
+
+
+@app.get("/sessions/live", response_model=List[Session])
+async def read_live_sessions(
+    request: Request,
+    window_seconds: int = 30,
+    limit: int = 10,
+    db: sqlite3.Connection = Depends(get_db_dependency),
+):
+    """Get sessions with a recent live checkpoint, best scores first"""
+    handler = SessionsHandler(db)
+    sessions = handler.get_live_sessions(window_seconds=window_seconds, limit=limit)
+    return session_response(request, sessions)
 
 
 @app.get("/sessions/{session_id}", response_model=Session)
 async def read_session(
-    session_id: str, db: sqlite3.Connection = Depends(get_db_dependency)
+    session_id: str,
+    request: Request,
+    db: sqlite3.Connection = Depends(get_db_dependency),
 ):
     """Get a specific session by session_id"""
     logger.info(f"Retrieving session: {session_id}")
@@ -79,51 +277,167 @@ async def read_session(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
         )
-    return session
+    return session_response(request, session)
 
 
 @app.get("/sessions/player/{player_name}", response_model=List[Session])
 async def read_sessions_by_player(
-    player_name: str, db: sqlite3.Connection = Depends(get_db_dependency)
+    player_name: str,
+    request: Request,
+    db: sqlite3.Connection = Depends(get_db_dependency),
 ):
     """Get all sessions for a specific player"""
     handler = SessionsHandler(db)
     sessions = handler.get_sessions_by_player_name(player_name)
-    return sessions
+    return session_response(request, sessions)
 
 
-@app.put("/sessions/{session_id}", response_model=Session)
+@app.put(
+    "/sessions/{session_id}",
+    response_model=Session,
+    openapi_extra=negotiated_body_openapi(SessionUpdate),
+)
 async def update_existing_session(
     session_id: str,
-    session_update: SessionUpdate,
+    request: Request,
+    session_update: SessionUpdate = Depends(session_update_body),
+    idempotency_key: Optional[str] = Header(default=None),
     db: sqlite3.Connection = Depends(get_db_dependency),
 ):
-    """Update an existing session"""
+    """Update an existing session.
+
+    When the update carries the game's input trace, the game is replayed with
+    the session's seed and a score that doesn't match the replay is rejected. Once a session's score has
+    been verified this way it is final, and later updates get 409.
+    """
     logger.info(f"Updating session: {session_id}")
+    idempotency = IdempotencyHandler(db)
+    if idempotency_key:
+        request_hash = hash_request_body(
+            session_update.model_dump_json(exclude_unset=True)
+        )
+        replay = replay_idempotent_request(
+            idempotency, idempotency_key, request, request_hash
+        )
+        if replay is not None:
+            return replay
+
     handler = SessionsHandler(db)
-    session = handler.update_session(session_id, session_update)
-    if session is None:
-        logger.warning(f"Session not found for update: {session_id}")
+    if handler.is_session_final(session_id):
+        reject_final_session(session_id)
+    if session_update.input_trace is not None:
+        existing_session = handler.get_session_by_id(session_id)
+        if existing_session is None:
+            logger.warning(f"Session not found for update: {session_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
+            )
+        session_update = await verify_replayed_score(
+            session_update, existing_session.game_seed
+        )
+        logger.info(f"Score verified by replay for session: {session_id}")
+    # The update and its idempotency record commit together
+    with db:
+        # Checked again: another final update may have landed during the replay
+        if handler.is_session_final(session_id):
+            reject_final_session(session_id)
+        session = handler.update_session(session_id, session_update, commit=False)
+        if session is None:
+            logger.warning(f"Session not found for update: {session_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
+            )
+        if idempotency_key:
+            idempotency.save_response(
+                idempotency_key,
+                request.method,
+                request.url.path,
+                request_hash,
+                status.HTTP_200_OK,
+                session.model_dump_json(),
+                commit=False,
+            )
+    leaderboard_broadcaster.session_written(handler, session_id, session.net_income)
+    logger.info(f"Successfully updated session: {session_id}")
+    return session_response(request, session)
+
+
+@app.patch("/sessions/{session_id}/checkpoint", status_code=status.HTTP_204_NO_CONTENT)
+async def checkpoint_session(
+    session_id: str,
+    checkpoint: SessionCheckpoint,
+    db: sqlite3.Connection = Depends(get_db_dependency),
+):
+    """Apply a live score checkpoint to an in-progress session.
+
+    A session whose final score was verified by replay refuses checkpoints
+    with 409.
+    """
+    handler = SessionsHandler(db)
+    if not handler.checkpoint_session(session_id, checkpoint):
+        if handler.is_session_final(session_id):
+            reject_final_session(session_id)
+        logger.warning(f"Session not found for checkpoint: {session_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
         )
-    logger.info(f"Successfully updated session: {session_id}")
-    return session
+    leaderboard_broadcaster.session_written(
+        handler, session_id, checkpoint.earned - checkpoint.spent
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @app.get("/leaderboard/", response_model=List[Session])
 async def get_leaderboard(
-    limit: int = 10, db: sqlite3.Connection = Depends(get_db_dependency)
+    request: Request,
+    limit: int = 10,
+    db: sqlite3.Connection = Depends(get_db_dependency),
 ):
     """Get the leaderboard with top scores"""
     handler = SessionsHandler(db)
     leaderboard = handler.get_leaderboard(limit=limit)
-    return leaderboard
+    return session_response(request, leaderboard)
+
+
+@app.get("/leaderboard/stream")
+async def stream_leaderboard():
+    """Stream the top leaderboard entries as Server-Sent Events.
+
+    Sends a `snapshot` event on connect, then a `diff` event with the changed
+    ranks whenever a session write changes the top entries.
+    """
+    # Snapshots come from the broadcaster's cache; the database is only read
+    # to fill it, so no connection stays open for the life of the stream
+    if not leaderboard_broadcaster.is_loaded:
+        with get_db_connection() as db:
+            leaderboard_broadcaster.ensure_loaded(SessionsHandler(db))
+    return StreamingResponse(
+        leaderboard_broadcaster.stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@app.post("/leaderboard/players", response_model=List[Session])
+async def get_players_best_scores(
+    players: PlayersBestScoresRequest,
+    request: Request,
+    db: sqlite3.Connection = Depends(get_db_dependency),
+):
+    """Get the best score for each of several players in one round trip.
+
+    Players without any sessions are left out of the result.
+    """
+    handler = SessionsHandler(db)
+    best_scores = handler.get_players_best_scores(players.player_names)
+    return session_response(request, best_scores)
 
 
 @app.get("/leaderboard/player/{player_name}", response_model=Session)
 async def get_player_best_score(
-    player_name: str, db: sqlite3.Connection = Depends(get_db_dependency)
+    player_name: str,
+    request: Request,
+    db: sqlite3.Connection = Depends(get_db_dependency),
 ):
     """Get the best score for a specific player"""
     handler = SessionsHandler(db)
@@ -132,7 +446,7 @@ async def get_player_best_score(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="No scores found for player"
         )
-    return best_score
+    return session_response(request, best_score)
 
 
 @app.get("/health")
@@ -0,0 +1,89 @@
+import hashlib
+import sqlite3
+from typing import NamedTuple, Optional
+
+# Keys are only honoured for a day, and the table never grows past this many rows
+IDEMPOTENCY_KEY_TTL_SECONDS = 24 * 60 * 60
+IDEMPOTENCY_MAX_KEYS = 10_000
+
+
+class StoredResponse(NamedTuple):
+    """Response recorded for an idempotency key"""
+
+    request_hash: str
+    status_code: int
+    response_body: str
+
+
+def hash_request_body(body: str) -> str:
+    """Fingerprint a request body so key reuse with a new payload is caught"""
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+class IdempotencyHandler:
+    """Bounded store of recent responses keyed by Idempotency-Key"""
+
+    def __init__(
+        self,
+        db: sqlite3.Connection,
+        ttl_seconds: int = IDEMPOTENCY_KEY_TTL_SECONDS,
+        max_keys: int = IDEMPOTENCY_MAX_KEYS,
+    ):
+        """Initialize with database connection"""
+        self.db = db
+        self.ttl_seconds = ttl_seconds
+        self.max_keys = max_keys
+
+    def get_response(
+        self, idempotency_key: str, method: str, path: str
+    ) -> Optional[StoredResponse]:
+        """Get the unexpired response stored for a key, if any"""
+        cursor = self.db.execute(
+            """
+            SELECT request_hash, status_code, response_body FROM idempotency_keys
+            WHERE idempotency_key = ? AND method = ? AND path = ?
+            AND created_at >= datetime('now', ?)
+        """,
+            (idempotency_key, method, path, f"-{self.ttl_seconds} seconds"),
+        )
+        row = cursor.fetchone()
+        return StoredResponse(*row) if row else None
+
+    def save_response(
+        self,
+        idempotency_key: str,
+        method: str,
+        path: str,
+        request_hash: str,
+        status_code: int,
+        response_body: str,
+        commit: bool = True,
+    ):
+        """Store the response for a key and evict expired or excess keys.
+
+        With commit=False the caller commits, so the record lands in the same
+        transaction as the write it answers.
+        """
+        self.db.execute(
+            """
+            INSERT OR REPLACE INTO idempotency_keys
+            (idempotency_key, method, path, request_hash, status_code, response_body)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            (idempotency_key, method, path, request_hash, status_code, response_body),
+        )
+        self.db.execute(
+            "DELETE FROM idempotency_keys WHERE created_at < datetime('now', ?)",
+            (f"-{self.ttl_seconds} seconds",),
+        )
+        self.db.execute(
+            """
+            DELETE FROM idempotency_keys WHERE rowid IN (
+                SELECT rowid FROM idempotency_keys
+                ORDER BY created_at DESC LIMIT -1 OFFSET ?
+            )
+        """,
+            (self.max_keys,),
+        )
+        if commit:
+            self.db.commit()
@@ -0,0 +1,110 @@
+import asyncio
+import json
+from typing import AsyncIterator, List, Optional, Set
+
+from backend.db.models import Session
+from backend.server.sessions_handler import SessionsHandler
+
+# Number of leaderboard entries pushed to stream subscribers
+LEADERBOARD_STREAM_SIZE = 10
+# Idle streams get an SSE comment this often so proxies keep them open
+KEEPALIVE_SECONDS = 15.0
+# A subscriber this far behind is resynced with a fresh snapshot
+SUBSCRIBER_QUEUE_SIZE = 32
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def leaderboard_diff(old: List[Session], new: List[Session]) -> Optional[dict]:
+    """Describe the ranks that changed between two leaderboards, or None"""
+    changed = [
+        {"rank": rank, "session": session.model_dump(mode="json")}
+        for rank, session in enumerate(new, start=1)
+        if rank > len(old) or old[rank - 1] != session
+    ]
+    if not changed and len(old) == len(new):
+        return None
+    return {"changed": changed, "size": len(new)}
+
+
+class LeaderboardBroadcaster:
+    """In-memory top-K leaderboard fanned out to every stream subscriber.
+
+    Session writes report here. A write that can affect the top K costs
+    one leaderboard query, however many subscribers there are. Each change
+    is serialized once and then shared by all subscriber queues.
+    State is per process, so each server worker streams the writes it handles.
+    """
+
+    def __init__(self, size: int = LEADERBOARD_STREAM_SIZE):
+        self.size = size
+        self._top: Optional[List[Session]] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._top is not None
+
+    def ensure_loaded(self, handler: SessionsHandler):
+        """Load the leaderboard on first use"""
+        if self._top is None:
+            self._top = handler.get_leaderboard(limit=self.size)
+
+    def _can_affect_top(self, session_id: str, net_income: float) -> bool:
+        """Cheap check whether a write could change the top K"""
+        if len(self._top) < self.size:
+            return True
+        if net_income >= self._top[-1].net_income:
+            return True
+        return any(session.session_id == session_id for session in self._top)
+
+    def session_written(
+        self, handler: SessionsHandler, session_id: str, net_income: float
+    ):
+        """Refresh the top K after a session write and push the diff if it changed"""
+        if self._top is None:
+            # No stream has been opened yet, so there is nothing to keep current
+            return
+        if not self._can_affect_top(session_id, net_income):
+            return
+
+        new_top = handler.get_leaderboard(limit=self.size)
+        diff = leaderboard_diff(self._top, new_top)
+        self._top = new_top
+        if diff is not None:
+            self._publish(format_sse("diff", diff))
+
+    def _snapshot_message(self) -> str:
+        sessions = [session.model_dump(mode="json") for session in self._top or []]
+        return format_sse("snapshot", {"sessions": sessions})
+
+    def _publish(self, message: str):
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Too far behind to apply diffs in order: start it over
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._snapshot_message())
+
+    async def stream(self) -> AsyncIterator[str]:
+        """Yield a snapshot, then a diff message for every top-K change"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            yield self._snapshot_message()
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            self._subscribers.discard(queue)
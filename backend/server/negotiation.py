@@ -0,0 +1,90 @@
+"""Content negotiation between JSON and the binary session wire format."""
+
+from typing import Type, TypeVar, Union
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+from backend.db.models import Session
+from backend.server.schemas import SessionCreate, SessionUpdate
+from backend.server.wire_format import (
+    SESSION_MEDIA_TYPE,
+    WireFormatError,
+    decode_payload,
+    encode_session,
+    encode_sessions,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def accepts_binary(request: Request) -> bool:
+    """Check if the client asked for the binary session format"""
+    return SESSION_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def session_response(
+    request: Request,
+    payload: Union[Session, list[Session]],
+    status_code: int = status.HTTP_200_OK,
+):
+    """Return session(s) in the binary format if accepted, otherwise as-is for JSON"""
+    if not accepts_binary(request):
+        return payload
+    content = (
+        encode_sessions(payload)
+        if isinstance(payload, list)
+        else encode_session(payload)
+    )
+    return Response(
+        content=content, status_code=status_code, media_type=SESSION_MEDIA_TYPE
+    )
+
+
+async def parse_body(request: Request, model: Type[ModelT]) -> ModelT:
+    """Parse a request body sent either as JSON or in the binary session format"""
+    body = await request.body()
+    if request.headers.get("content-type", "").startswith(SESSION_MEDIA_TYPE):
+        session_model = model if issubclass(model, Session) else Session
+        try:
+            payload = decode_payload(body, session_model=session_model)
+        except WireFormatError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except ValidationError as e:
+            # Well-formed but invalid fields get the same 422 as a JSON body
+            raise RequestValidationError(e.errors())
+        if not isinstance(payload, model):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Expected a {model.__name__} payload",
+            )
+        return payload
+
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+async def session_create_body(request: Request) -> SessionCreate:
+    """FastAPI dependency for a negotiated SessionCreate body"""
+    return await parse_body(request, SessionCreate)
+
+
+async def session_update_body(request: Request) -> SessionUpdate:
+    """FastAPI dependency for a negotiated SessionUpdate body"""
+    return await parse_body(request, SessionUpdate)
+
+
+def negotiated_body_openapi(model: Type[BaseModel]) -> dict:
+    """OpenAPI request body for endpoints whose body is parsed by parse_body"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": model.model_json_schema()},
+                SESSION_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+            },
+        }
+    }
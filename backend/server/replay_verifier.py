@@ -0,0 +1,119 @@
+"""Server-side re-simulation of submitted games.
+
+A final session update may carry the input trace of the finished game. The
+game is replayed headlessly from the trace with the same rules as the client
+(orders, $10 per delivery, subway fares), and a submitted score that doesn't
+match the replayed one is rejected. Each trace names the layout digest of
+the map it was played on; it is replayed on the map file in MAP_DIRECTORY
+with that digest, and a trace from any other map is rejected. The trace
+must also be played with the seed the server issued to the session, so it
+can't be reused for another session or played with a seed searched for
+offline.
+
+Replays are CPU-bound, so they run in a pool of worker processes: a burst
+of games ending at once is spread over every core and the event loop keeps
+serving requests while they run.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+from constants import GAME_DURATION, MAP_DIRECTORY, SIMULATION_TICK_RATE
+from gameplay.input_trace import InputTrace, InputTraceError
+from map_locations import GameMap
+from map_locations.layout import map_files_by_digest
+
+# Length of a real game; traces of longer or shorter games are rejected
+GAME_DURATION_TICKS = round(GAME_DURATION * SIMULATION_TICK_RATE)
+
+# Map files each worker can replay on, indexed once per process by digest
+_map_files: Optional[Dict[str, Path]] = None
+# Maps built so far, by digest, each with its lookup tables
+_game_maps: Dict[str, GameMap] = {}
+
+
+class ReplayedScore(NamedTuple):
+    """Score reached by replaying a trace"""
+
+    earned: float
+    spent: float
+
+    @property
+    def net_income(self) -> float:
+        return self.earned - self.spent
+
+
+def _game_map_for(map_digest: str) -> GameMap:
+    """Get the map with a layout digest, built and cached on first use"""
+    game_map = _game_maps.get(map_digest)
+    if game_map is None:
+        path = _map_files.get(map_digest)
+        if path is None:
+            raise InputTraceError("Trace was played on a map this server doesn't have")
+        game_map = _game_maps[map_digest] = GameMap.load(path)
+        _ = game_map.nearest_subways
+        _ = game_map.order_table
+    return game_map
+
+
+def _warm_up():
+    """Index the map files and build the default map before the first replay"""
+    global _map_files
+    _map_files = map_files_by_digest(MAP_DIRECTORY)
+    _game_map_for(GameMap.default().layout_digest)
+
+
+def replay_score(trace_data: bytes, seed: int) -> ReplayedScore:
+    """Replay an encoded input trace and return the score it reaches.
+
+    Raises InputTraceError if the trace is malformed, not a full game or
+    not played with seed.
+    """
+    if _map_files is None:
+        _warm_up()
+    trace = InputTrace.from_bytes(trace_data)
+    if trace.seed != seed:
+        raise InputTraceError("Trace was not played with the session's seed")
+    if trace.duration_ticks != GAME_DURATION_TICKS:
+        raise InputTraceError(
+            f"Trace covers {trace.duration_ticks} ticks, "
+            f"a game lasts {GAME_DURATION_TICKS}"
+        )
+    score = trace.replay(_game_map_for(trace.map_digest)).score_tracker
+    return ReplayedScore(float(score.earned), float(score.spent))
+
+
+class ReplayVerifier:
+    """Process pool that replays submitted traces off the event loop"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        """Start the worker processes, if not running yet"""
+        if self._executor is None:
+            # Spawned rather than forked: the server process runs threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up,
+            )
+
+    def shutdown(self):
+        """Stop the worker processes once queued replays finish"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def replay(self, trace_data: bytes, seed: int) -> ReplayedScore:
+        """Replay a trace played with seed in a worker process and return its score"""
+        self.start()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, replay_score, trace_data, seed
+        )
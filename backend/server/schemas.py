@@ -1,21 +1,44 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 from backend.db.models import Session
 
+# Largest player list accepted by POST /leaderboard/players, well within
+# SQLite's limit on query variables
+MAX_BEST_SCORE_LOOKUP_PLAYERS = 500
+# Largest batch accepted by POST /sessions/bulk
+MAX_BULK_SESSIONS = 1000
+
 
 class SessionCreate(Session):
     """Schema for creating a new session"""
 
     # Inherit all fields from Session but make timestamp optional for creation
     timestamp: Optional[datetime] = None
+    # Issued by the server; a game_seed sent on create is ignored
+
+
+class SessionsBulkCreate(BaseModel):
+    """Schema for creating many finished sessions at once"""
+
+    sessions: List[SessionCreate] = Field(min_length=1, max_length=MAX_BULK_SESSIONS)
+
+
+class SessionsBulkCreateResult(BaseModel):
+    """Schema for the outcome of a bulk session create"""
+
+    # Sessions whose ID already existed are skipped and not counted
+    created: int
 
 
 class SessionUpdate(BaseModel):
     """Schema for updating a session"""
 
+    # The input trace travels as base64 in JSON
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
     # All fields optional for updates
     player_name: Optional[str] = None
     session_id: Optional[str] = None
@@ -23,3 +46,21 @@ class SessionUpdate(BaseModel):
     earned: Optional[float] = None
     spent: Optional[float] = None
     net_income: Optional[float] = None
+    # Input trace of the finished game; when sent, the score is replay-verified
+    input_trace: Optional[bytes] = None
+
+
+class SessionCheckpoint(BaseModel):
+    """Schema for a live score checkpoint of an in-progress session"""
+
+    # Absolute running totals, so a lost or repeated checkpoint is harmless
+    earned: float
+    spent: float
+
+
+class PlayersBestScoresRequest(BaseModel):
+    """Schema for looking up the best scores of several players at once"""
+
+    player_names: List[str] = Field(
+        min_length=1, max_length=MAX_BEST_SCORE_LOOKUP_PLAYERS
+    )
@@ -2,7 +2,7 @@ import sqlite3
 from typing import List, Optional
 
 from backend.db.models import Session
-from backend.server.schemas import SessionCreate, SessionUpdate
+from backend.server.schemas import SessionCheckpoint, SessionCreate, SessionUpdate
 
 
 class SessionsHandler:
@@ -12,15 +12,22 @@ class SessionsHandler:
         """Initialize with database connection"""
         self.db = db
 
-    def create_session(self, session: SessionCreate) -> Session:
-        """Create a new session"""
+    def create_session(
+        self, session: SessionCreate, game_seed: int, commit: bool = True
+    ) -> Session:
+        """Create a new session whose game is played with game_seed.
+
+        With commit=False the caller commits, e.g. together with the request's
+        idempotency record.
+        """
         session_data = session.model_dump()
 
         # Insert the session
         _ = self.db.execute(
             """
-            INSERT INTO sessions (player_name, session_id, earned, spent, net_income)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO sessions
+            (player_name, session_id, earned, spent, net_income, game_seed)
+            VALUES (?, ?, ?, ?, ?, ?)
         """,
             (
                 session_data["player_name"],
@@ -28,9 +35,11 @@ class SessionsHandler:
                 session_data["earned"],
                 session_data["spent"],
                 session_data["net_income"],
+                game_seed,
             ),
         )
-        self.db.commit()
+        if commit:
+            self.db.commit()
 
         # Get the created session
         created_session = self.get_session_by_id(session_data["session_id"])
@@ -38,6 +47,33 @@ class SessionsHandler:
             raise RuntimeError("Failed to create session")
         return created_session
 
+    def create_sessions(self, sessions: List[SessionCreate]) -> int:
+        """Create many sessions in one transaction, skipping IDs that already exist.
+
+        Their scores aren't verified, so they are stored unranked and never
+        show on the leaderboard. Returns the number of sessions created.
+        """
+        changes_before = self.db.total_changes
+        self.db.executemany(
+            """
+            INSERT OR IGNORE INTO sessions
+            (player_name, session_id, earned, spent, net_income, ranked)
+            VALUES (?, ?, ?, ?, ?, 0)
+        """,
+            [
+                (
+                    session.player_name,
+                    session.session_id,
+                    session.earned,
+                    session.spent,
+                    session.net_income,
+                )
+                for session in sessions
+            ],
+        )
+        self.db.commit()
+        return self.db.total_changes - changes_before
+
     def get_session_by_id(self, session_id: str) -> Optional[Session]:
         """Get a session by id"""
         cursor = self.db.execute(
@@ -50,9 +86,9 @@ class SessionsHandler:
         return None
 
     def update_session(
-        self, session_id: str, session_update: SessionUpdate
+        self, session_id: str, session_update: SessionUpdate, commit: bool = True
     ) -> Optional[Session]:
-        """Update a session"""
+        """Update a session; with commit=False the caller commits"""
         update_data = session_update.model_dump(exclude_unset=True)
 
         if not update_data:
@@ -69,10 +105,60 @@ class SessionsHandler:
         """
 
         self.db.execute(query, params)
-        self.db.commit()
+        if commit:
+            self.db.commit()
 
         return self.get_session_by_id(session_id)
 
+    def checkpoint_session(
+        self, session_id: str, checkpoint: SessionCheckpoint
+    ) -> bool:
+        """Apply a live score checkpoint.
+
+        Returns False if the session does not exist or is final; a replay-verified
+        score is never overwritten by a checkpoint.
+        """
+        cursor = self.db.execute(
+            """
+            UPDATE sessions
+            SET earned = ?, spent = ?, net_income = ?, checkpointed_at = CURRENT_TIMESTAMP
+            WHERE session_id = ? AND input_trace IS NULL
+        """,
+            (
+                checkpoint.earned,
+                checkpoint.spent,
+                checkpoint.earned - checkpoint.spent,
+                session_id,
+            ),
+        )
+        self.db.commit()
+        return cursor.rowcount > 0
+
+    def is_session_final(self, session_id: str) -> bool:
+        """Check if a session's final score was verified against its input trace"""
+        cursor = self.db.execute(
+            "SELECT input_trace IS NOT NULL FROM sessions WHERE session_id = ?",
+            (session_id,),
+        )
+        row = cursor.fetchone()
+        return bool(row and row[0])
+
+    def get_live_sessions(
+        self, window_seconds: int = 30, limit: int = 10
+    ) -> List[Session]:
+        """Get sessions checkpointed within the last window_seconds, best first"""
+        cursor = self.db.execute(
+            """
+            SELECT * FROM sessions
+            WHERE checkpointed_at >= datetime('now', ?)
+            ORDER BY net_income DESC
+            LIMIT ?
+        """,
+            (f"-{window_seconds} seconds", limit),
+        )
+        rows = cursor.fetchall()
+        return [Session.from_row(row) for row in rows]
+
     def get_all_sessions(self, skip: int = 0, limit: int = 100) -> List[Session]:
         """Get all sessions with pagination"""
         cursor = self.db.execute(
@@ -94,7 +180,7 @@ class SessionsHandler:
     def get_leaderboard(self, limit: int = 10) -> List[Session]:
         """Get top sessions by net income for leaderboard"""
         cursor = self.db.execute(
-            "SELECT * FROM sessions ORDER BY net_income DESC LIMIT ?",
+            "SELECT * FROM sessions WHERE ranked ORDER BY net_income DESC LIMIT ?",
             (limit,),
         )
         rows = cursor.fetchall()
@@ -103,8 +189,30 @@ class SessionsHandler:
     def get_player_best_score(self, player_name: str) -> Optional[Session]:
         """Get the best score for a specific player"""
         cursor = self.db.execute(
-            "SELECT * FROM sessions WHERE player_name = ? ORDER BY net_income DESC LIMIT 1",
+            """
+            SELECT * FROM sessions WHERE player_name = ? AND ranked
+            ORDER BY net_income DESC LIMIT 1
+        """,
             (player_name,),
         )
         row = cursor.fetchone()
         return Session.from_row(row) if row else None
+
+    def get_players_best_scores(self, player_names: List[str]) -> List[Session]:
+        """Get the best score of each listed player in a single query"""
+        unique_names = list(dict.fromkeys(player_names))
+        placeholders = ", ".join("?" for _ in unique_names)
+        cursor = self.db.execute(
+            f"""
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY player_name ORDER BY net_income DESC
+                ) AS best_rank
+                FROM sessions WHERE player_name IN ({placeholders}) AND ranked
+            )
+            WHERE best_rank = 1
+        """,
+            unique_names,
+        )
+        rows = cursor.fetchall()
+        return [Session.from_row(row) for row in rows]
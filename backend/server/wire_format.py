@@ -0,0 +1,246 @@
+"""Compact binary wire format for session payloads.
+
+JSON stays the default; clients opt in by sending/accepting SESSION_MEDIA_TYPE.
+Every payload starts with a one-byte format version and a one-byte kind,
+followed by little-endian fixed-size fields and length-prefixed UTF-8 strings
+and bytes:
+
+    session:        earned f64, spent f64, net_income f64, timestamp i64,
+                    game_seed i64, player_name str, session_id str
+    session list:   count u32, then that many session records
+    session update: field-presence bitmask u8, then only the present fields
+                    in SESSION_UPDATE_FIELDS order; input_trace is u32-length
+                    prefixed bytes
+
+Timestamps are microseconds since the Unix epoch (naive UTC, as stored by
+SQLite), with NO_TIMESTAMP marking a missing value; NO_SEED likewise marks a
+session without a game seed. Version 2 added game_seed.
+
+Every field decodes straight to the type its model declares, so models are
+validated in strict mode, with no coercion, and a session list in one call;
+a payload that is truncated or has bytes left over is rejected.
+"""
+
+import struct
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Type, Union
+
+from pydantic import TypeAdapter
+
+from backend.db.models import Session
+from backend.server.schemas import SessionUpdate
+
+SESSION_MEDIA_TYPE = "application/vnd.nyc-pizza.session"
+
+FORMAT_VERSION = 2
+KIND_SESSION = 1
+KIND_SESSION_LIST = 2
+KIND_SESSION_UPDATE = 3
+
+NO_TIMESTAMP = -(2**63)
+NO_SEED = -(2**63)
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+SESSION_UPDATE_FIELDS = (
+    "player_name",
+    "session_id",
+    "timestamp",
+    "earned",
+    "spent",
+    "net_income",
+    "input_trace",
+)
+
+_HEADER = struct.Struct("<BB")
+_SESSION_NUMBERS = struct.Struct("<dddqq")
+_STR_LENGTH = struct.Struct("<H")
+# Longest string a u16 length prefix can describe
+MAX_STR_BYTES = 2**16 - 1
+_COUNT = struct.Struct("<I")
+_FLAGS = struct.Struct("<B")
+_FLOAT = struct.Struct("<d")
+_INT = struct.Struct("<q")
+
+
+class WireFormatError(ValueError):
+    """Raised when a binary payload is malformed or of an unexpected kind."""
+
+
+def _encode_timestamp(timestamp: Optional[datetime]) -> int:
+    if timestamp is None:
+        return NO_TIMESTAMP
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - EPOCH) // MICROSECOND
+
+
+def _decode_timestamp(value: int) -> Optional[datetime]:
+    return None if value == NO_TIMESTAMP else EPOCH + timedelta(0, 0, value)
+
+
+def _pack_str(parts: list, value: str):
+    encoded = value.encode()
+    if len(encoded) > MAX_STR_BYTES:
+        raise WireFormatError(
+            f"String of {len(encoded)} bytes is longer than {MAX_STR_BYTES}"
+        )
+    parts.append(_STR_LENGTH.pack(len(encoded)))
+    parts.append(encoded)
+
+
+def _unpack_str(data: bytes, offset: int) -> tuple[str, int]:
+    (length,) = _STR_LENGTH.unpack_from(data, offset)
+    offset += _STR_LENGTH.size
+    value = data[offset : offset + length]
+    if len(value) != length:
+        raise WireFormatError("String field runs past the end of the payload")
+    return value.decode(), offset + length
+
+
+def _pack_bytes(parts: list, value: bytes):
+    parts.append(_COUNT.pack(len(value)))
+    parts.append(value)
+
+
+def _unpack_bytes(data: bytes, offset: int) -> tuple[bytes, int]:
+    (length,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    value = data[offset : offset + length]
+    if len(value) != length:
+        raise WireFormatError("Byte field runs past the end of the payload")
+    return value, offset + length
+
+
+def _pack_session(parts: list, session: Session):
+    parts.append(
+        _SESSION_NUMBERS.pack(
+            session.earned,
+            session.spent,
+            session.net_income,
+            _encode_timestamp(session.timestamp),
+            NO_SEED if session.game_seed is None else session.game_seed,
+        )
+    )
+    _pack_str(parts, session.player_name)
+    _pack_str(parts, session.session_id)
+
+
+def _unpack_session_fields(data: bytes, offset: int) -> tuple[dict, int]:
+    earned, spent, net_income, timestamp, game_seed = _SESSION_NUMBERS.unpack_from(
+        data, offset
+    )
+    offset += _SESSION_NUMBERS.size
+    player_name, offset = _unpack_str(data, offset)
+    session_id, offset = _unpack_str(data, offset)
+    fields = {
+        "player_name": player_name,
+        "session_id": session_id,
+        "timestamp": _decode_timestamp(timestamp),
+        "earned": earned,
+        "spent": spent,
+        "net_income": net_income,
+        "game_seed": None if game_seed == NO_SEED else game_seed,
+    }
+    return fields, offset
+
+
+@lru_cache
+def _session_list_adapter(model: Type[Session]) -> TypeAdapter:
+    # Validating the whole list in one call avoids per-record Python overhead
+    return TypeAdapter(list[model])
+
+
+def encode_session(session: Session) -> bytes:
+    """Encode a single session."""
+    parts = [_HEADER.pack(FORMAT_VERSION, KIND_SESSION)]
+    _pack_session(parts, session)
+    return b"".join(parts)
+
+
+def encode_sessions(sessions: list[Session]) -> bytes:
+    """Encode a list of sessions."""
+    parts = [_HEADER.pack(FORMAT_VERSION, KIND_SESSION_LIST)]
+    parts.append(_COUNT.pack(len(sessions)))
+    for session in sessions:
+        _pack_session(parts, session)
+    return b"".join(parts)
+
+
+def encode_session_update(session_update: SessionUpdate) -> bytes:
+    """Encode the fields explicitly set on a session update."""
+    fields_set = session_update.model_fields_set
+    flags = 0
+    parts = [_HEADER.pack(FORMAT_VERSION, KIND_SESSION_UPDATE), b""]
+    for bit, field in enumerate(SESSION_UPDATE_FIELDS):
+        value = getattr(session_update, field)
+        if field not in fields_set or value is None:
+            continue
+        flags |= 1 << bit
+        if field == "timestamp":
+            parts.append(_INT.pack(_encode_timestamp(value)))
+        elif field == "input_trace":
+            _pack_bytes(parts, value)
+        elif isinstance(value, str):
+            _pack_str(parts, value)
+        else:
+            parts.append(_FLOAT.pack(value))
+    parts[1] = _FLAGS.pack(flags)
+    return b"".join(parts)
+
+
+def _decode_session_update(data: bytes, offset: int) -> tuple[SessionUpdate, int]:
+    (flags,) = _FLAGS.unpack_from(data, offset)
+    offset += _FLAGS.size
+    values = {}
+    for bit, field in enumerate(SESSION_UPDATE_FIELDS):
+        if not flags & (1 << bit):
+            continue
+        if field == "timestamp":
+            (raw,) = _INT.unpack_from(data, offset)
+            values[field] = _decode_timestamp(raw)
+            offset += _INT.size
+        elif field == "input_trace":
+            values[field], offset = _unpack_bytes(data, offset)
+        elif field in ("player_name", "session_id"):
+            values[field], offset = _unpack_str(data, offset)
+        else:
+            (values[field],) = _FLOAT.unpack_from(data, offset)
+            offset += _FLOAT.size
+    # Only the decoded fields count as set, so exclude_unset keeps working
+    return SessionUpdate.model_validate(values, strict=True), offset
+
+
+def decode_payload(
+    data: bytes, session_model: Type[Session] = Session
+) -> Union[Session, list[Session], SessionUpdate]:
+    """Decode any binary session payload, returning the model(s) it holds."""
+    try:
+        version, kind = _HEADER.unpack_from(data, 0)
+        if version != FORMAT_VERSION:
+            raise WireFormatError(f"Unsupported wire format version: {version}")
+        offset = _HEADER.size
+        if kind == KIND_SESSION:
+            fields, offset = _unpack_session_fields(data, offset)
+            payload = session_model.model_validate(fields, strict=True)
+        elif kind == KIND_SESSION_LIST:
+            (count,) = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            records = []
+            for _ in range(count):
+                fields, offset = _unpack_session_fields(data, offset)
+                records.append(fields)
+            adapter = _session_list_adapter(session_model)
+            payload = adapter.validate_python(records, strict=True)
+        elif kind == KIND_SESSION_UPDATE:
+            payload, offset = _decode_session_update(data, offset)
+        else:
+            raise WireFormatError(f"Unknown payload kind: {kind}")
+    except (struct.error, UnicodeDecodeError, OverflowError) as e:
+        raise WireFormatError(f"Malformed session payload: {e}") from e
+    if offset != len(data):
+        raise WireFormatError(
+            f"{len(data) - offset} unexpected bytes after the session payload"
+        )
+    return payload
@@ -0,0 +1,4 @@
+"""NYC Pizza Delivery Game - Benchmarks.
+
+Standalone scripts, run with `uv run python -m benchmarks.<name>`.
+"""
@@ -0,0 +1,122 @@
+"""Measure games/sec of the NumPy BatchSimulation and check it against GameSimulation.
+
+Every game is driven by the same greedy policy: head for the current pickup
+or delivery location along the longer axis, press SPACE once in reach, and
+now and then press SPACE anywhere (which rides the subway when next to one).
+The inputs of the first few games are replayed through the scalar
+GameSimulation, and their final states must match exactly.
+
+Usage: python -m benchmarks.batch_simulation_benchmark [n_games]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from gameplay.batch_simulation import DIRECTIONS, NO_DIRECTION, BatchSimulation
+from gameplay.simulation import COLLISION_THRESHOLD_SQUARED, GameSimulation
+
+N_GAMES = 10_000
+CHECKED_GAMES = 50
+RANDOM_PRESS_CHANCE = 0.025
+
+UP, DOWN, LEFT, RIGHT = (DIRECTIONS.index(d) for d in ("up", "down", "left", "right"))
+
+
+def greedy_policy(
+    batch: BatchSimulation, noise: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Direction codes and SPACE presses for every game."""
+    dx = batch.destination_x - batch.x
+    dy = batch.destination_y - batch.y
+    directions = np.where(
+        np.abs(dx) > np.abs(dy),
+        np.where(dx > 0, RIGHT, LEFT),
+        np.where(dy > 0, UP, DOWN),
+    )
+    in_reach = dx * dx + dy * dy < COLLISION_THRESHOLD_SQUARED
+    pressed = in_reach | (noise.random(batch.n_games) < RANDOM_PRESS_CHANCE)
+    return directions, pressed
+
+
+def run_batch(n_games: int, record: int = 0):
+    """Play n_games to the end; return the batch and the first games' inputs."""
+    batch = BatchSimulation(n_games, seeds=range(n_games))
+    noise = np.random.default_rng(0)
+    inputs = []
+
+    batch.start()
+    while not batch.is_over:
+        directions, pressed = greedy_policy(batch, noise)
+        if record:
+            inputs.append((directions[:record].copy(), pressed[:record].copy()))
+        batch.move_direction(directions)
+        batch.handle_space_action(pressed)
+        batch.step()
+    return batch, inputs
+
+
+def replay_scalar(seed: int, game: int, inputs) -> GameSimulation:
+    """Play one game through GameSimulation with recorded batch inputs."""
+    simulation = GameSimulation(seed=seed)
+    simulation.start()
+    for directions, pressed in inputs:
+        if simulation.is_over:
+            break
+        direction = int(directions[game])
+        if direction == NO_DIRECTION:
+            simulation.stop_movement()
+        else:
+            simulation.move_direction(DIRECTIONS[direction])
+        if pressed[game]:
+            simulation.handle_space_action()
+        simulation.step()
+    return simulation
+
+
+def check_against_scalar():
+    batch, inputs = run_batch(CHECKED_GAMES, record=CHECKED_GAMES)
+    for game in range(CHECKED_GAMES):
+        scalar = replay_scalar(game, game, inputs)
+        expected = (
+            scalar.player.center_x,
+            scalar.player.center_y,
+            scalar.player.has_pizza,
+            scalar.score_tracker.earned,
+            scalar.score_tracker.spent,
+            scalar.score_tracker.subway_usage_count,
+            scalar.tick_count,
+        )
+        actual = (
+            float(batch.x[game]),
+            float(batch.y[game]),
+            bool(batch.has_pizza[game]),
+            int(batch.earned[game]),
+            int(batch.spent[game]),
+            int(batch.subway_usage_count[game]),
+            int(batch.tick_count[game]),
+        )
+        if expected != actual:
+            raise AssertionError(f"Game {game} diverged: {expected} != {actual}")
+    print(f"{CHECKED_GAMES} games identical to GameSimulation")
+
+
+def main():
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else N_GAMES
+    check_against_scalar()
+
+    start = time.perf_counter()
+    batch, _ = run_batch(n_games)
+    elapsed = time.perf_counter() - start
+
+    print(f"{n_games} games in {elapsed:.2f}s")
+    print(f"  {n_games / elapsed:.0f} games/s")
+    print(
+        f"  mean score ${batch.score.mean():.2f}, "
+        f"mean subway rides {batch.subway_usage_count.mean():.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
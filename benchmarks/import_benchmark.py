@@ -0,0 +1,58 @@
+"""Time cold imports of the game's packages in fresh interpreters.
+
+Each statement runs in a new Python process, timed from inside it, and the
+best of a few runs is reported. The last line builds the map sprites the
+way importing the game window used to, to show what that cost.
+
+Usage: python -m benchmarks.import_benchmark [runs]
+"""
+
+import subprocess
+import sys
+
+RUNS = 5
+
+STATEMENTS = [
+    ("import map_locations", "import map_locations"),
+    (
+        "load the default GameMap",
+        "from map_locations import GameMap; GameMap.default()",
+    ),
+    ("import gameplay.simulation", "import gameplay.simulation"),
+    ("import gameplay.game", "import gameplay.game"),
+    (
+        "import gameplay.game + build map sprites",
+        "import gameplay.game; from map_locations import MapSprites, default_layout; "
+        "MapSprites.from_layout(default_layout())",
+    ),
+]
+
+_TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_statement(statement: str) -> float:
+    """Seconds a statement takes in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    print(f"cold import times, best of {runs} fresh interpreters:")
+    for label, statement in STATEMENTS:
+        best = min(time_statement(statement) for _ in range(runs))
+        print(f"  {label:<42} {best * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
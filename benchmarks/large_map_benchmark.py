@@ -0,0 +1,93 @@
+"""Time frames on maps of growing size, drawn in chunks vs all at once.
+
+Opens a hidden window (needs an OpenGL 3.3 context) and, for maps from the
+default Manhattan size up to a few hundred streets, scrolls a camera across
+the map for a few hundred frames. It draws through MapChunks, which only
+draws the chunks in view, and, for the smaller maps, draws the whole grid and
+every location instead. Maps come from the city generator at its default
+density. Chunked frame time should stay flat as the map grows.
+
+Usage: python -m benchmarks.large_map_benchmark [frames]
+"""
+
+import sys
+from typing import Callable
+
+import arcade
+
+from benchmarks.location_draw_benchmark import FRAMES, time_frames
+from constants import SCREEN_HEIGHT, SIDEBAR_X
+from map_locations import MapGrid, MapSprites
+from map_locations.generator import CityConfig, generate_city
+from static_drawings import MapChunks, draw_manhattan_grid
+
+# (avenues, streets) of each map; streets are blocks of five numbered streets
+GRIDS = [(11, 25), (22, 50), (44, 100), (88, 220)]
+# Largest map still drawn all at once for comparison
+MAX_FULL_DRAW_BLOCKS = 44 * 100
+
+
+def diagonal_pan(
+    camera: arcade.Camera2D, grid: MapGrid, frames: int
+) -> Callable[[], None]:
+    """Get a function moving the camera one step across the map per call."""
+    left, right, bottom, top = grid.bounds
+    frame = 0
+
+    def pan():
+        nonlocal frame
+        t = frame % frames / frames
+        frame += 1
+        camera.position = (left + (right - left) * t, bottom + (top - bottom) * t)
+
+    return pan
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    window = arcade.Window(1200, 800, "Large map benchmark", visible=False)
+    camera = arcade.Camera2D(viewport=arcade.LBWH(0, 0, SIDEBAR_X, SCREEN_HEIGHT))
+
+    print(f"camera scrolling diagonally across each map, {frames} frames each:")
+    for avenues, streets in GRIDS:
+        grid = MapGrid(avenues, streets)
+        layout = generate_city(CityConfig(avenues, streets))
+        chunks = MapChunks(layout)
+        pan = diagonal_pan(camera, grid, frames)
+
+        def draw_chunked(pan=pan, chunks=chunks):
+            pan()
+            with camera.activate():
+                x, y = camera.position
+                chunks.draw(
+                    x + camera.left,
+                    x + camera.right,
+                    y + camera.bottom,
+                    y + camera.top,
+                )
+
+        locations = len(layout.homes) + len(layout.pizza_shops)
+        print(f"  {avenues} x {streets} blocks, {locations} locations:")
+        # First pass builds chunks as they come into view, the second reuses them
+        for label in ("chunks, building", "chunks, built"):
+            ms, calls = time_frames(window, draw_chunked, frames)
+            print(f"    {label:<18} {calls:5.0f} draw calls/frame, {ms:7.3f} ms/frame")
+        print(f"    {chunks.builds} chunks built of {chunks.columns * chunks.rows}")
+
+        if avenues * streets <= MAX_FULL_DRAW_BLOCKS:
+            sprites = MapSprites.from_layout(layout)
+
+            def draw_everything(pan=pan, grid=grid, sprites=sprites):
+                pan()
+                with camera.activate():
+                    draw_manhattan_grid(grid)
+                    sprites.draw()
+
+            ms, calls = time_frames(window, draw_everything, frames)
+            label = "everything"
+            print(f"    {label:<18} {calls:5.0f} draw calls/frame, {ms:7.3f} ms/frame")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
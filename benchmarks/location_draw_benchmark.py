@@ -0,0 +1,66 @@
+"""Count draw calls and time drawing the map's locations, one by one vs batched.
+
+Opens a hidden window (needs an OpenGL 3.3 context), then draws every
+location for a few hundred frames with each Location.draw() call, and again
+through the MapSprites sprite lists. Draw calls are counted at arcade's one
+GL entry point for drawing, Geometry.render; the speed zones' labels are
+drawn by pyglet in both cases and aren't counted.
+
+Usage: python -m benchmarks.location_draw_benchmark [frames]
+"""
+
+import sys
+import time
+
+import arcade
+
+from gameplay.frame_profiler import DrawCallCounter
+from map_locations import MapSprites, default_layout
+
+FRAMES = 300
+
+
+def time_frames(window: arcade.Window, draw, frames: int) -> tuple[float, float]:
+    """Mean milliseconds per frame and draw calls per frame of a draw function."""
+    # Warm up: atlas uploads and sprite buffers happen on the first draw
+    window.clear()
+    draw()
+    window.ctx.finish()
+
+    with DrawCallCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(frames):
+            window.clear()
+            draw()
+        window.ctx.finish()
+        elapsed = time.perf_counter() - start
+    return elapsed / frames * 1e3, counter.count / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    window = arcade.Window(1200, 800, "Location draw benchmark", visible=False)
+    sprites = MapSprites.from_layout(default_layout())
+    locations = [
+        *sprites.pizza_shops,
+        *sprites.homes,
+        *sprites.speed_multiplier_locations,
+        *sprites.subways,
+    ]
+
+    def draw_each():
+        for location in locations:
+            location.draw()
+
+    print(f"{len(locations)} locations, {frames} frames each:")
+    for label, draw in (
+        ("one draw per location", draw_each),
+        ("sprite lists", sprites.draw),
+    ):
+        ms, calls = time_frames(window, draw, frames)
+        print(f"  {label:<22} {calls:5.0f} draw calls/frame, {ms:6.3f} ms/frame")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Measure memory per location, and bounds and view queries, on a generated city.
+
+Holds every location of a 10^5-location city in each representation and
+measures it with tracemalloc:
+
+- addresses as a plain dataclass with a __dict__, the old Address
+- the slotted, frozen Address
+- GameMap's MapLocation records, not counting their addresses
+- a LocationTable's parallel arrays
+- one arcade.Sprite per location, as drawing every location would need
+
+It then compares the bounds of every location, one address_bounds call at
+a time vs LocationTable.rects(), and the locations in one screen of map,
+scanned vs LocationTable.in_view(). The table's answers are checked
+against the scalar ones first.
+
+Usage: python -m benchmarks.location_memory_benchmark [locations]
+"""
+
+import gc
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+
+from constants import DEFAULT_AVENUES_SPREAD, DEFAULT_STREETS_SPREAD
+from map_locations import Address, GameMap, MapLayout
+from map_locations.address import address_bounds
+from map_locations.generator import CityConfig, generate_city
+from map_locations.location_table import KINDS, LocationTable, layout_addresses
+
+LOCATIONS = 100_000
+
+
+@dataclass
+class DictAddress:
+    """Address as it was before it was slotted, for comparison."""
+
+    avenue_number: int
+    street_number: int
+    name: str | None = None
+    avenues_spread: int = DEFAULT_AVENUES_SPREAD
+    streets_spread: int = DEFAULT_STREETS_SPREAD
+
+
+def measured(build):
+    """Build something and return it with the bytes it allocated and kept."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, kept
+
+
+def all_addresses(layout: MapLayout) -> list[Address]:
+    return [address for kind in KINDS for address in layout_addresses(layout, kind)]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else LOCATIONS
+    layout = generate_city(CityConfig.for_locations(size))
+    addresses = all_addresses(layout)
+    n = len(addresses)
+
+    def copy_addresses(cls):
+        return lambda: [
+            cls(
+                a.avenue_number,
+                a.street_number,
+                a.name,
+                a.avenues_spread,
+                a.streets_spread,
+            )
+            for a in addresses
+        ]
+
+    def game_map_records():
+        game_map = GameMap.from_layout(layout)
+        return [location for kind in KINDS for location in getattr(game_map, kind)]
+
+    def sprites():
+        import arcade
+
+        return [arcade.Sprite() for _ in range(n)]
+
+    rows = [
+        ("dict Address", copy_addresses(DictAddress)),
+        ("slotted Address", copy_addresses(Address)),
+        ("MapLocation records", game_map_records),
+        ("LocationTable", lambda: LocationTable.from_layout(layout)),
+        ("arcade.Sprite", sprites),
+    ]
+    print(f"{n} locations, bytes per location:")
+    for label, build in rows:
+        _, kept = measured(build)
+        print(f"  {label:<20} {kept / n:8.1f}")
+
+    table = LocationTable.from_layout(layout)
+    print(f"  (table columns alone {table.nbytes / n:.1f})")
+
+    # The table's answers must be the scalar ones before they're timed
+    left, right, bottom, top = table.rects()
+    for row, address in enumerate(addresses):
+        edges = (left[row], right[row], bottom[row], top[row])
+        if tuple(float(edge) for edge in edges) != address_bounds(address):
+            raise AssertionError(f"Row {row} bounds differ from {address}")
+    locations = game_map_records()
+    view = layout.grid.bounds[0], layout.grid.bounds[0] + 800, 100, 700
+
+    def scan_view():
+        view_left, view_right, view_bottom, view_top = view
+        return [
+            row
+            for row, location in enumerate(locations)
+            if location.left < view_right
+            and view_left < location.right
+            and location.bottom < view_top
+            and view_bottom < location.top
+        ]
+
+    if scan_view() != table.in_view(*view).tolist():
+        raise AssertionError("in_view differs from the scan")
+
+    fresh_tables = []
+
+    def new_table():
+        fresh_tables[:] = [LocationTable.from_layout(layout)]
+
+    timings = [
+        ("table from layout", new_table, None),
+        (
+            "bounds, address_bounds",
+            lambda: [address_bounds(a) for a in addresses],
+            None,
+        ),
+        ("bounds, table", lambda: fresh_tables[0].rects(), new_table),
+        ("screen of map, scan", scan_view, None),
+        ("screen of map, table", lambda: table.in_view(*view), None),
+    ]
+    print("times:")
+    for label, fn, setup in timings:
+        seconds = min(timeit.repeat(fn, setup=setup or "pass", number=1, repeat=3))
+        print(f"  {label:<24} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Time building and playing generated cities from 10^2 to 10^5 locations.
+
+Each city comes from map_locations.generator at the default density, so only
+its size changes. The benchmark checks that a seed always gives the same map
+file, then times each step from generating the layout to playing on it:
+loading it into a GameMap, the spatial indexes, the nearest-subway table,
+the routing graph, the order table and simulation ticks. Everything runs
+headless; nothing imports arcade.
+
+Usage: python -m benchmarks.map_scale_benchmark [locations...]
+"""
+
+import random
+import sys
+import time
+
+from gameplay.simulation import GameSimulation
+from map_locations import GameMap
+from map_locations.generator import CityConfig, generate_city
+
+SIZES = [100, 1_000, 10_000, 100_000]
+DIRECTIONS = ("up", "down", "left", "right")
+# Ticks played on each map, a few seconds of game
+TICKS = 2_000
+
+
+def timed(fn):
+    """Run fn once, returning its result and the seconds it took."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def play(game_map: GameMap, ticks: int) -> float:
+    """Play a scripted game for some ticks and return ticks per millisecond."""
+    simulation = GameSimulation(game_map, seed=0)
+    driver = random.Random(0)
+    simulation.start()
+    start = time.perf_counter()
+    for tick in range(ticks):
+        if tick % 30 == 0:
+            simulation.move_direction(driver.choice(DIRECTIONS))
+        if tick % 10 == 0:
+            simulation.handle_space_action()
+        simulation.step()
+    return ticks / (time.perf_counter() - start) / 1000
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    steps = ["generate", "load", "index", "subways", "routing", "orders"]
+    print(
+        f"{'locations':>9} {'grid':>11} "
+        + " ".join(f"{step:>9}" for step in steps)
+        + f" {'ticks/ms':>9}"
+    )
+    for size in sizes:
+        config = CityConfig.for_locations(size)
+        layout, generate_s = timed(
+            lambda config=config, size=size: generate_city(config, seed=size)
+        )
+        if generate_city(config, seed=size).to_json() != layout.to_json():
+            raise AssertionError(f"Seed {size} gave two different cities")
+
+        game_map, load_s = timed(lambda layout=layout: GameMap.from_layout(layout))
+        _, index_s = timed(
+            lambda game_map=game_map: [
+                game_map.spatial_index(kind)
+                for kind in ("homes", "pizza_shops", "subways", "speed_zones")
+            ]
+        )
+        _, subways_s = timed(lambda game_map=game_map: game_map.nearest_subways)
+        _, routing_s = timed(lambda game_map=game_map: game_map.routing)
+        _, orders_s = timed(lambda game_map=game_map: game_map.order_table)
+        ticks_per_ms = play(game_map, TICKS)
+
+        locations = len(layout.homes) + len(layout.pizza_shops)
+        seconds = [generate_s, load_s, index_s, subways_s, routing_s, orders_s]
+        print(
+            f"{locations:>9} {f'{config.avenues} x {config.streets}':>11} "
+            + " ".join(f"{s * 1000:>7.0f}ms" for s in seconds)
+            + f" {ticks_per_ms:>9.0f}"
+        )
+    print(f"arcade imported: {'arcade' in sys.modules}")
+
+
+if __name__ == "__main__":
+    main()
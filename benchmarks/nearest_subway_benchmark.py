@@ -0,0 +1,126 @@
+"""Check the nearest-subway table against a brute-force scan and time lookups.
+
+For the Manhattan map and a generated 10k-location map, every pickup and
+delivery location plus a spread of random points is resolved through the
+table and through find_closest_subway, and the answers must be the same
+subway. The check runs again after adding a subway, to make sure the
+table is rebuilt when the map changes.
+
+Usage: python -m benchmarks.nearest_subway_benchmark
+"""
+
+import random
+import time
+import timeit
+
+from gameplay.simulation import find_closest_subway
+from map_locations import Address, GameMap, MapLocation
+
+RANDOM_POINTS = 20_000
+GENERATED_AVENUES = 200
+GENERATED_STREET_BLOCKS = 300
+GENERATED_LOCATIONS = 10_000
+GENERATED_SUBWAY_SHARE = 10  # one location in ten is a subway
+
+
+def generated_map(rng: random.Random) -> GameMap:
+    blocks = rng.sample(
+        range(GENERATED_AVENUES * GENERATED_STREET_BLOCKS), GENERATED_LOCATIONS
+    )
+    locations = [
+        MapLocation.from_address(
+            Address(block % GENERATED_AVENUES + 1, (block // GENERATED_AVENUES + 1) * 5)
+        )
+        for block in blocks
+    ]
+    n_subways = GENERATED_LOCATIONS // GENERATED_SUBWAY_SHARE
+    return GameMap(
+        pizza_shops=locations[n_subways : n_subways * 2],
+        homes=locations[n_subways * 2 :],
+        subways=locations[:n_subways],
+    )
+
+
+def point(x: float, y: float) -> MapLocation:
+    return MapLocation(None, x, x, y, y, x, y)
+
+
+def random_points(game_map: GameMap, rng: random.Random) -> list[tuple[float, float]]:
+    """Points spread over, and a little beyond, the map's locations."""
+    locations = game_map.pizza_shops + game_map.homes + game_map.subways
+    min_x = min(location.left for location in locations) - 200
+    max_x = max(location.right for location in locations) + 200
+    min_y = min(location.bottom for location in locations) - 200
+    max_y = max(location.top for location in locations) + 200
+    return [
+        (rng.uniform(min_x, max_x), rng.uniform(min_y, max_y))
+        for _ in range(RANDOM_POINTS)
+    ]
+
+
+def check(game_map: GameMap, rng: random.Random):
+    table = game_map.nearest_subways
+    for destination in game_map.pizza_shops + game_map.homes:
+        expected = find_closest_subway(game_map.subways, destination)
+        if table.for_location(destination) is not expected:
+            raise AssertionError(f"Wrong subway for {destination.name}")
+    for x, y in random_points(game_map, rng):
+        if table.for_point(x, y) is not find_closest_subway(
+            game_map.subways, point(x, y)
+        ):
+            raise AssertionError(f"Wrong subway for point {(x, y)}")
+
+
+def report(name: str, game_map: GameMap, rng: random.Random):
+    start = time.perf_counter()
+    table = game_map.nearest_subways
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    check(game_map, rng)
+    print(
+        f"\n{name}: {len(game_map.subways)} subways, {len(table)} destinations, "
+        f"table built in {build_ms:.1f} ms, matches brute force"
+    )
+
+    destinations = rng.choices(game_map.pizza_shops + game_map.homes, k=2_000)
+    points = random_points(game_map, rng)[:2_000]
+
+    def per_call_us(fn, args) -> float:
+        seconds = min(timeit.repeat(lambda: [fn(*a) for a in args], number=1, repeat=3))
+        return seconds / len(args) * 1e6
+
+    subways = game_map.subways
+    by_destination = [(destination,) for destination in destinations]
+    table_us = per_call_us(table.for_location, by_destination)
+    scan_us = per_call_us(lambda d: find_closest_subway(subways, d), by_destination)
+    print(f"  destination: table {table_us:>7.2f} us   scan {scan_us:>8.2f} us")
+
+    # Includes building the candidates of each cell on its first lookup
+    table_us = per_call_us(table.for_point, points)
+    scan_us = per_call_us(
+        lambda x, y: find_closest_subway(subways, point(x, y)), points
+    )
+    print(f"  point:       table {table_us:>7.2f} us   scan {scan_us:>8.2f} us")
+
+
+def main():
+    rng = random.Random(0)
+    manhattan = GameMap.default()
+    report("Manhattan", manhattan, rng)
+    report("Generated", generated_map(rng), rng)
+
+    # A subway opening right next to a home must win for that home
+    home = manhattan.homes[0]
+    before = manhattan.nearest_subways
+    new_subway = MapLocation.from_address(home.address)
+    manhattan.add_location("subways", new_subway)
+    if manhattan.nearest_subways is before:
+        raise AssertionError("Table was not rebuilt after the map changed")
+    if manhattan.nearest_subways.for_location(home) is not new_subway:
+        raise AssertionError("Rebuilt table ignores the new subway")
+    check(manhattan, rng)
+    print("\nRebuilt after adding a subway, matches brute force")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Time the order table and compare weighted orders with uniform ones.
+
+Builds the alias table for the Manhattan map, checks that its draws follow
+the pair probabilities, times a draw against two random.choice calls, and
+has the Autopilot play the same seeds with weighted and with uniform orders
+to compare the spread of trip lengths and final scores.
+
+Usage: python -m benchmarks.order_table_benchmark [n_games]
+"""
+
+import random
+import statistics
+import sys
+import time
+import timeit
+
+from gameplay.autopilot import Autopilot
+from gameplay.orders import Order
+from gameplay.simulation import GameSimulation
+from map_locations import GameMap
+
+GAMES = 50
+DRAWS = 200_000
+
+
+class UniformOrderSimulation(GameSimulation):
+    """The game with every (shop, home) pair equally likely."""
+
+    def generate_new_order(self) -> Order:
+        self.current_order = Order.generate_order(
+            self.game_map.pizza_shops, self.game_map.homes, self.rng
+        )
+        return self.current_order
+
+
+def check_draws(game_map: GameMap) -> float:
+    """Largest gap between a pair's drawn frequency and its probability."""
+    table = game_map.order_table
+    rng = random.Random(0)
+    counts = dict.fromkeys(table.pairs, 0)
+    for _ in range(DRAWS):
+        counts[table.sample(rng)] += 1
+    return max(
+        abs(counts[pair] / DRAWS - chance)
+        for pair, chance in zip(table.pairs, table.probabilities())
+    )
+
+
+def play_games(simulation_class, n_games: int, game_map: GameMap):
+    """Play seeded autopilot games; return net incomes and walking times per order."""
+    routing = game_map.routing
+    scores = []
+    trips = []
+    for seed in range(n_games):
+        simulation = simulation_class(game_map, seed=seed)
+        autopilot = Autopilot(simulation)
+        simulation.start()
+        order = None
+        while not simulation.is_over:
+            if simulation.current_order is not order:
+                order = simulation.current_order
+                trips.append(
+                    routing.travel_time(
+                        order.pickup_location, order.delivery_location, False
+                    )
+                )
+            autopilot.update()
+            simulation.step()
+        score = simulation.score_tracker
+        scores.append(score.earned - score.spent)
+    return scores, trips
+
+
+def main():
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else GAMES
+    game_map = GameMap.default()
+    game_map.routing.all_pairs(use_subway=False)
+
+    start = time.perf_counter()
+    table = game_map.order_table
+    build_ms = (time.perf_counter() - start) * 1e3
+    print(f"order table of {len(table)} (shop, home) pairs built in {build_ms:.1f} ms")
+
+    gap = check_draws(game_map)
+    print(f"  {DRAWS} draws within {gap:.4f} of each pair's probability")
+
+    rng = random.Random(0)
+    shops = game_map.pizza_shops
+    homes = game_map.homes
+    alias = min(timeit.repeat(lambda: table.sample(rng), number=DRAWS, repeat=3))
+    uniform = min(
+        timeit.repeat(
+            lambda: (rng.choice(shops), rng.choice(homes)), number=DRAWS, repeat=3
+        )
+    )
+    print(
+        f"  {alias / DRAWS * 1e9:.0f} ns per weighted draw, "
+        f"{uniform / DRAWS * 1e9:.0f} ns per uniform shop and home"
+    )
+
+    for label, simulation_class in (
+        ("uniform", UniformOrderSimulation),
+        ("weighted", GameSimulation),
+    ):
+        scores, trips = play_games(simulation_class, n_games, game_map)
+        print(
+            f"  {label:>8} orders: walk {statistics.mean(trips):.2f}s "
+            f"+/- {statistics.pstdev(trips):.2f}s, "
+            f"autopilot net income ${statistics.mean(scores):.2f} "
+            f"+/- ${statistics.pstdev(scores):.2f} over {n_games} games"
+        )
+
+
+if __name__ == "__main__":
+    main()
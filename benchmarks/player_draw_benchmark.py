@@ -0,0 +1,93 @@
+"""Time drawing the player from a new sprite list per frame vs a persistent one.
+
+Opens a hidden window (needs an OpenGL 3.3 context) and draws the player
+carrying a pizza for a few hundred frames. First it draws the way
+PlayerCharacter.draw used to: a new SpriteList every frame plus a
+draw_circle_filled for the pizza. Then it draws from one persistent sprite
+list, as the window does now. Reports time, draw calls and the Python
+memory each frame allocates at its peak, measured with tracemalloc.
+
+Usage: python -m benchmarks.player_draw_benchmark [frames]
+"""
+
+import sys
+import tracemalloc
+
+import arcade
+
+from benchmarks.location_draw_benchmark import FRAMES, time_frames
+from gameplay.player import (
+    PIZZA_INDICATOR_OFFSET,
+    PIZZA_INDICATOR_RADIUS,
+    PlayerCharacter,
+)
+from gameplay.simulation import GameSimulation
+
+
+def allocated_per_frame(window: arcade.Window, draw, frames: int) -> float:
+    """Mean peak bytes of Python memory a frame allocates above where it started."""
+    draw()
+    tracemalloc.start()
+    total = 0
+    for _ in range(frames):
+        window.clear()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        draw()
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - start
+    tracemalloc.stop()
+    return total / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    window = arcade.Window(1200, 800, "Player draw benchmark", visible=False)
+    simulation = GameSimulation()
+    state = simulation.player
+    state.has_pizza = True
+    player = PlayerCharacter()
+    actors = arcade.SpriteList()
+    actors.extend(player.sprites)
+    frame = 0
+
+    def move():
+        nonlocal frame
+        frame += 1
+        position = (state.center_x + frame % 50, state.center_y)
+        player.sync(state, position, 0.5)
+
+    def draw_rebuilt():
+        move()
+        player_list = arcade.SpriteList()
+        player_list.append(player)
+        player_list.draw()
+        arcade.draw_circle_filled(
+            player.center_x,
+            player.center_y + PIZZA_INDICATOR_OFFSET,
+            PIZZA_INDICATOR_RADIUS,
+            arcade.color.YELLOW,
+        )
+
+    def draw_persistent():
+        move()
+        actors.draw()
+
+    print(f"player with a pizza, {frames} frames each:")
+    for label, draw in (
+        ("new sprite list", draw_rebuilt),
+        ("persistent list", draw_persistent),
+    ):
+        # The old way needs the indicator hidden from the persistent list
+        player.pizza_indicator.visible = draw is draw_persistent
+        ms, calls = time_frames(window, draw, frames)
+        allocated = allocated_per_frame(window, draw, frames)
+        print(
+            f"  {label:<16} {calls:3.0f} draw calls/frame, {ms:6.3f} ms/frame, "
+            f"{allocated / 1024:7.1f} KiB allocated/frame"
+        )
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Record input traces of bot games, then check and time replaying them.
+
+A bot plays like a person at the keyboard: about ten times a second it
+presses the key towards the current pickup or delivery location, lets go
+now and then, and presses SPACE when in reach or to ride the subway. Every
+trace must survive encoding and replay to exactly the live game's final
+state.
+
+Usage: python -m benchmarks.replay_benchmark [n_games]
+"""
+
+import random
+import sys
+import time
+
+from gameplay.input_trace import InputTrace
+from gameplay.simulation import (
+    COLLISION_THRESHOLD_SQUARED,
+    GameSimulation,
+    PlayerInput,
+    replay_inputs,
+)
+from map_locations import GameMap
+
+GAMES = 200
+DECISION_TICKS = 12  # ~10 decisions per second at 120 ticks/s
+PAUSE_CHANCE = 0.1
+SUBWAY_CHANCE = 0.05
+
+
+def play_game(seed: int, game_map: GameMap | None = None) -> GameSimulation:
+    """Play one full game with the bot, recording its inputs."""
+    simulation = GameSimulation(game_map, seed=seed)
+    bot = random.Random(seed)
+    simulation.start()
+
+    held = None
+    while not simulation.is_over:
+        if simulation.tick_count % DECISION_TICKS == 0:
+            player = simulation.player
+            destination = simulation.get_current_destination_location(
+                not player.has_pizza
+            )
+            dx = destination.center_x - player.center_x
+            dy = destination.center_y - player.center_y
+            if dx * dx + dy * dy < COLLISION_THRESHOLD_SQUARED or (
+                bot.random() < SUBWAY_CHANCE
+            ):
+                simulation.apply_input(PlayerInput.SPACE)
+
+            if bot.random() < PAUSE_CHANCE:
+                wanted = PlayerInput.STOP
+            elif abs(dx) > abs(dy):
+                wanted = PlayerInput.RIGHT if dx > 0 else PlayerInput.LEFT
+            else:
+                wanted = PlayerInput.UP if dy > 0 else PlayerInput.DOWN
+            if wanted != held:
+                simulation.apply_input(wanted)
+                held = wanted
+        simulation.step()
+    return simulation
+
+
+def final_state(simulation: GameSimulation) -> tuple:
+    return (
+        simulation.player.center_x,
+        simulation.player.center_y,
+        simulation.player.has_pizza,
+        simulation.score_tracker.earned,
+        simulation.score_tracker.spent,
+        simulation.score_tracker.subway_usage_count,
+        simulation.tick_count,
+    )
+
+
+def main():
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else GAMES
+    # One map for every game, as a long-running verifier would keep
+    game_map = GameMap.default()
+
+    traces = []
+    for seed in range(n_games):
+        live = play_game(seed, game_map)
+        encoded = InputTrace.from_simulation(live).to_bytes()
+        trace = InputTrace.from_bytes(encoded)
+        if final_state(trace.replay(game_map)) != final_state(live):
+            raise AssertionError(f"Replay of game {seed} diverged")
+        traces.append((trace, encoded))
+    print(f"{n_games} games replay identically from their traces")
+
+    sizes = sorted(len(encoded) for _, encoded in traces)
+    events = sum(len(trace.events) for trace, _ in traces) / n_games
+    print(
+        f"  trace size: mean {sum(sizes) / n_games:.0f} B, max {sizes[-1]} B, "
+        f"{events:.0f} inputs per game"
+    )
+
+    start = time.perf_counter()
+    for _, encoded in traces:
+        trace = InputTrace.from_bytes(encoded)
+        replay_inputs(trace.seed, trace.events, game_map, trace.duration)
+    elapsed = time.perf_counter() - start
+    real_time = sum(trace.duration for trace, _ in traces)
+    print(
+        f"  replay: {elapsed / n_games * 1e3:.1f} ms/game, "
+        f"{real_time / elapsed:.0f}x real time"
+    )
+
+
+if __name__ == "__main__":
+    main()
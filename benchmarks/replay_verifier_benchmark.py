@@ -0,0 +1,146 @@
+"""Replay a burst of submitted games through the ReplayVerifier process pool.
+
+Simulates the end-of-game rush: a few hundred traces arrive at once and are
+all verified concurrently. A ticker coroutine runs alongside to measure how
+long the event loop is ever kept from serving other requests.
+
+First, one game goes through the API on a scratch database, played with
+the seed the server issued to its session. This checks that a trace only
+verifies for its own session and that a verified score is final: later
+checkpoints and updates get 409 and leave it unchanged.
+
+Usage: python -m benchmarks.replay_verifier_benchmark [n_games]
+"""
+
+import asyncio
+import base64
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from backend.db import connection
+from backend.server.fastapi_server import app
+from backend.server.replay_verifier import ReplayVerifier, replay_score
+from benchmarks.replay_benchmark import play_game
+from gameplay.input_trace import InputTrace
+from map_locations import GameMap
+
+GAMES = 400
+TICK_SECONDS = 0.005
+
+
+async def measure_loop_lag(done: asyncio.Event) -> float:
+    """Longest delay past its deadline for a coroutine that wakes every few ms."""
+    worst = 0.0
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        worst = max(worst, time.perf_counter() - start - TICK_SECONDS)
+    return worst
+
+
+async def verify_burst(verifier: ReplayVerifier, traces: list[bytes]):
+    done = asyncio.Event()
+    lag = asyncio.create_task(measure_loop_lag(done))
+    start = time.perf_counter()
+    scores = await asyncio.gather(
+        *(verifier.replay(trace, seed) for seed, trace in enumerate(traces))
+    )
+    elapsed = time.perf_counter() - start
+    done.set()
+    return scores, elapsed, await lag
+
+
+def final_update(game) -> dict:
+    """JSON body of the final update of a finished game, with its input trace."""
+    tracker = game.score_tracker
+    trace = InputTrace.from_simulation(game).to_bytes()
+    return {
+        "earned": tracker.earned,
+        "spent": tracker.spent,
+        "net_income": tracker.earned - tracker.spent,
+        "input_trace": base64.b64encode(trace).decode(),
+    }
+
+
+def check_final_score_is_locked(game_map: GameMap):
+    """Submit a verified game through the API, then try to overwrite its score."""
+    database_path = connection.DATABASE_PATH
+    with tempfile.TemporaryDirectory() as directory:
+        connection.DATABASE_PATH = str(Path(directory) / "check.db")
+        try:
+            with TestClient(app) as client:
+                url = "/sessions/final-check"
+                created = client.post(
+                    "/sessions/",
+                    json={"player_name": "check", "session_id": "final-check"},
+                )
+                game = play_game(created.json()["game_seed"], game_map)
+                # The same game can't be claimed by a session issued another seed
+                other = client.post(
+                    "/sessions/",
+                    json={"player_name": "check", "session_id": "other-check"},
+                )
+                reused = client.put("/sessions/other-check", json=final_update(game))
+                verified = client.put(url, json=final_update(game))
+                checkpoint = client.patch(
+                    f"{url}/checkpoint", json={"earned": 9999, "spent": 0}
+                )
+                update = client.put(url, json={"earned": 9999, "net_income": 9999})
+                stored = client.get(url).json()
+        finally:
+            connection.DATABASE_PATH = database_path
+    expected = (201, 201, 400, 200, 409, 409)
+    statuses = (created, other, reused, verified, checkpoint, update)
+    if tuple(response.status_code for response in statuses) != expected:
+        raise AssertionError(
+            f"Expected {expected}, got {[r.status_code for r in statuses]}"
+        )
+    if stored["earned"] != game.score_tracker.earned:
+        raise AssertionError(f"Verified score was overwritten: {stored}")
+    print("trace only verifies for its own session's seed")
+    print("verified score is final: checkpoint and update after it get 409")
+
+
+async def main_async(n_games: int):
+    game_map = GameMap.default()
+    games = [play_game(seed, game_map) for seed in range(n_games)]
+    traces = [InputTrace.from_simulation(game).to_bytes() for game in games]
+    check_final_score_is_locked(game_map)
+
+    start = time.perf_counter()
+    for seed, trace in enumerate(traces):
+        replay_score(trace, seed)
+    inline = time.perf_counter() - start
+    print(f"{n_games} games, one after another: {n_games / inline:.0f} games/s")
+
+    verifier = ReplayVerifier()
+    verifier.start()
+    try:
+        # Wait for the workers to spawn so the burst isn't timing process startup
+        await verifier.replay(traces[0], 0)
+        scores, elapsed, lag = await verify_burst(verifier, traces)
+    finally:
+        verifier.shutdown()
+
+    for game, score in zip(games, scores):
+        tracker = game.score_tracker
+        if (score.earned, score.spent) != (tracker.earned, tracker.spent):
+            raise AssertionError(f"Verified score {score} differs from the live game")
+    print(
+        f"  burst through {verifier.max_workers} workers: "
+        f"{n_games / elapsed:.0f} games/s, all scores match"
+    )
+    print(f"  worst event loop stall during the burst: {lag * 1e3:.1f} ms")
+
+
+def main():
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else GAMES
+    asyncio.run(main_async(n_games))
+
+
+if __name__ == "__main__":
+    main()
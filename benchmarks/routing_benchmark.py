@@ -0,0 +1,106 @@
+"""Time the routing graph and check its travel times against the simulation.
+
+Builds the all-pairs table for the Manhattan map, checks that A* agrees with
+the cached Dijkstra times, then has the Autopilot play games on the fastest
+route to every pickup and delivery (never turning down a subway ride) and
+compares each leg's simulated time with the predicted one.
+
+Usage: python -m benchmarks.routing_benchmark [n_games]
+"""
+
+import statistics
+import sys
+import time
+import timeit
+
+from constants import SIMULATION_TICK_RATE
+from gameplay.autopilot import Autopilot
+from gameplay.simulation import GameSimulation, within_reach
+from map_locations import GameMap
+
+GAMES = 20
+
+
+def check_astar(game_map: GameMap):
+    routing = game_map.routing
+    locations = game_map.pizza_shops + game_map.homes
+    for origin in locations:
+        start = routing.node_at(origin.center_x, origin.center_y)
+        for destination in locations:
+            for use_subway in (True, False):
+                route = routing.fastest_route(start, destination, use_subway)
+                expected = routing.travel_time(origin, destination, use_subway)
+                if abs(route.time - expected) > 1e-9:
+                    raise AssertionError(
+                        f"A* and Dijkstra disagree from {origin.name} to {destination.name}"
+                    )
+
+
+def play_game(seed: int, game_map: GameMap) -> list[tuple[float, float]]:
+    """Play a game on the fastest routes; return (predicted, actual) seconds per leg."""
+    simulation = GameSimulation(game_map, seed=seed)
+    # Never turn down a ride, so the autopilot takes the fastest route exactly
+    autopilot = Autopilot(simulation, subway_min_saving=0.0)
+    routing = game_map.routing
+    player = simulation.player
+    simulation.start()
+
+    legs = []
+    while not simulation.is_over:
+        destination = simulation.get_current_destination_location(
+            is_pickup=not player.has_pizza
+        )
+        start = routing.node_at(player.center_x, player.center_y)
+        predicted = routing.fastest_route(start, destination).time
+        start_tick = simulation.tick_count
+        while not simulation.is_over and not within_reach(
+            player.center_x, player.center_y, destination
+        ):
+            autopilot.update()
+            simulation.step()
+        if simulation.is_over:
+            break
+        legs.append(
+            (predicted, (simulation.tick_count - start_tick) / SIMULATION_TICK_RATE)
+        )
+        # Pick up or deliver
+        autopilot.update()
+    return legs
+
+
+def main():
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else GAMES
+    game_map = GameMap.default()
+
+    start = time.perf_counter()
+    routing = game_map.routing
+    table = routing.all_pairs()
+    build_ms = (time.perf_counter() - start) * 1e3
+    pairs = sum(len(row) for row in table.values())
+    print(
+        f"{len(routing)} grid nodes, all-pairs table of {pairs} trips "
+        f"built in {build_ms:.1f} ms"
+    )
+
+    check_astar(game_map)
+    shop = game_map.pizza_shops[0]
+    home = game_map.homes[-1]
+    start_node = routing.node_at(shop.center_x, shop.center_y)
+    seconds = min(
+        timeit.repeat(
+            lambda: routing.fastest_route(start_node, home), number=200, repeat=3
+        )
+    )
+    print(f"  A* matches Dijkstra everywhere, {seconds / 200 * 1e6:.0f} us/query")
+
+    legs = [leg for seed in range(n_games) for leg in play_game(seed, game_map)]
+    errors = [abs(actual - predicted) for predicted, actual in legs]
+    print(
+        f"  {len(legs)} simulated legs: predicted vs actual time off by "
+        f"{statistics.mean(errors) * 1e3:.0f} ms on average, "
+        f"{max(errors) * 1e3:.0f} ms at most"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measure how fast the headless GameSimulation steps.
+
+A scripted driver changes direction every quarter second and presses SPACE
+several times a second, so ticks cover movement, speed zones, pickups, deliveries and
+subway rides rather than an idle player. The map and its lookup tables are
+built before timing starts, so the figures measure ticking alone.
+"""
+
+import random
+import sys
+import time
+
+from gameplay.simulation import GameSimulation
+from map_locations import GameMap, default_game_map
+
+GAMES = 200
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def play_game(seed: int, game_map: GameMap) -> int:
+    """Play one full game and return the number of ticks simulated."""
+    simulation = GameSimulation(game_map, seed=seed)
+    driver = random.Random(seed)
+    simulation.start()
+
+    ticks = 0
+    while not simulation.is_over:
+        if ticks % 30 == 0:
+            simulation.move_direction(driver.choice(DIRECTIONS))
+        if ticks % 10 == 0:
+            simulation.handle_space_action()
+        simulation.step()
+        ticks += 1
+    return ticks
+
+
+def main():
+    game_map = default_game_map()
+    # Warm up: the first game builds the order table, nearest subways and indexes
+    play_game(GAMES, game_map)
+
+    start = time.perf_counter()
+    ticks = sum(play_game(seed, game_map) for seed in range(GAMES))
+    elapsed = time.perf_counter() - start
+
+    print(f"{GAMES} games, {ticks} ticks in {elapsed:.2f}s")
+    print(f"  {ticks / elapsed / 1000:.0f} ticks/ms")
+    print(f"  {GAMES / elapsed:.0f} games/s")
+    print(f"  arcade imported: {'arcade' in sys.modules}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compare SpatialIndex queries with linear scans on a large generated map.
+
+Locations are scattered over a grid of avenue/street blocks far bigger than
+Manhattan's. Every query type is checked against the linear scan before it
+is timed.
+
+Usage: python -m benchmarks.spatial_index_benchmark [n_locations]
+"""
+
+import random
+import sys
+import timeit
+
+from constants import COLLISION_THRESHOLD, PLAYER_SIZE
+from gameplay.simulation import find_closest_subway, within_reach
+from map_locations import Address, MapLocation
+from map_locations.spatial_index import SpatialIndex
+
+N_LOCATIONS = 12_000
+AVENUES = 200
+STREET_BLOCKS = 300
+QUERIES = 2_000
+
+
+def make_locations(n: int, rng: random.Random) -> list[MapLocation]:
+    blocks = rng.sample(range(AVENUES * STREET_BLOCKS), n)
+    return [
+        MapLocation.from_address(
+            Address(block % AVENUES + 1, (block // AVENUES + 1) * 5)
+        )
+        for block in blocks
+    ]
+
+
+def scan_overlapping(locations, x, y, half_size):
+    for location in locations:
+        if (
+            location.left < x + half_size
+            and x - half_size < location.right
+            and location.bottom < y + half_size
+            and y - half_size < location.top
+        ):
+            return location
+    return None
+
+
+def report(name, index_fn, scan_fn, points):
+    for x, y in points[:200]:
+        if index_fn(x, y) != scan_fn(x, y):
+            raise AssertionError(f"{name} differs from the linear scan at {(x, y)}")
+
+    def run(fn):
+        return lambda: [fn(x, y) for x, y in points]
+
+    index_us = min(timeit.repeat(run(index_fn), number=1, repeat=3)) / len(points)
+    scan_us = min(timeit.repeat(run(scan_fn), number=1, repeat=3)) / len(points)
+    print(
+        f"  {name:<10} index {index_us * 1e6:>8.2f} us   scan {scan_us * 1e6:>9.2f} us"
+        f"  ({scan_us / index_us:.0f}x)"
+    )
+
+
+def main():
+    n_locations = int(sys.argv[1]) if len(sys.argv) > 1 else N_LOCATIONS
+    rng = random.Random(0)
+    locations = make_locations(n_locations, rng)
+    index = SpatialIndex(locations)
+
+    # Query points near real locations so point and radius queries hit things
+    points = []
+    for location in rng.choices(locations, k=QUERIES):
+        points.append(
+            (
+                location.center_x
+                + rng.uniform(-COLLISION_THRESHOLD, COLLISION_THRESHOLD),
+                location.center_y
+                + rng.uniform(-COLLISION_THRESHOLD, COLLISION_THRESHOLD),
+            )
+        )
+
+    print(f"{n_locations} locations")
+    report(
+        "overlap",
+        lambda x, y: index.first_overlapping(x, y, PLAYER_SIZE / 2),
+        lambda x, y: scan_overlapping(locations, x, y, PLAYER_SIZE / 2),
+        points,
+    )
+    report(
+        "radius",
+        lambda x, y: index.within_radius(x, y),
+        lambda x, y: [loc for loc in locations if within_reach(x, y, loc)],
+        points,
+    )
+
+    # Nearest-of-type: a sparse kind, like subways among homes and shops
+    subways = locations[: max(1, n_locations // 10)]
+    subway_index = SpatialIndex(subways)
+    destinations = rng.choices(locations, k=QUERIES)
+    report(
+        "nearest",
+        lambda x, y: subway_index.nearest(x, y),
+        lambda x, y: find_closest_subway(subways, MapLocation(None, x, x, y, y, x, y)),
+        [(d.center_x, d.center_y) for d in destinations],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Time the static scene drawn every frame vs copied from the StaticLayer cache.
+
+Opens a hidden window (needs an OpenGL 3.3 context) and draws the Manhattan
+grid, its labels and every location for a few hundred frames, first
+directly and then through a StaticLayer, counting draw calls and frame time
+with the helpers from the location draw benchmark. Grid labels are drawn by
+pyglet and aren't counted as draw calls, but their cost shows in frame time.
+
+Usage: python -m benchmarks.static_layer_benchmark [frames]
+"""
+
+import sys
+
+import arcade
+
+from benchmarks.location_draw_benchmark import FRAMES, time_frames
+from map_locations import MapSprites, default_layout
+from static_drawings import StaticLayer, draw_manhattan_grid
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    window = arcade.Window(1200, 800, "Static layer benchmark", visible=False)
+    sprites = MapSprites.from_layout(default_layout())
+
+    def draw_scene():
+        draw_manhattan_grid()
+        sprites.draw()
+
+    layer = StaticLayer(window, draw_scene)
+    print(f"static scene, {frames} frames each:")
+    for label, draw in (
+        ("drawn every frame", draw_scene),
+        ("static layer", layer.draw),
+    ):
+        ms, calls = time_frames(window, draw, frames)
+        print(f"  {label:<18} {calls:5.0f} draw calls/frame, {ms:6.3f} ms/frame")
+    print(f"  static layer rendered {layer.renders} time(s)")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
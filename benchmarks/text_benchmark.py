@@ -0,0 +1,65 @@
+"""Time the sidebar's text drawn with arcade.draw_text vs a retained TextLayer.
+
+Opens a hidden window (needs an OpenGL 3.3 context) and draws a sidebar's
+worth of labels for a few hundred frames, with the timer ticking every
+frame as in a game, first with arcade.draw_text and then through a
+TextLayer.
+
+Usage: python -m benchmarks.text_benchmark [frames]
+"""
+
+import sys
+
+import arcade
+
+from benchmarks.location_draw_benchmark import FRAMES, time_frames
+from static_drawings import TextLayer
+
+
+def sidebar_lines(frame: int) -> list[tuple[str, tuple, int, bool]]:
+    """(text, color, size, bold) of each sidebar line at a frame."""
+    remaining = 60 - frame / 60
+    flash = arcade.color.RED if frame % 60 < 30 else arcade.color.ORANGE
+    return [
+        ("Player: Benchmark", arcade.color.BLACK, 14, True),
+        ("Earned: $120", arcade.color.GREEN, 12, False),
+        ("Spent: $4", arcade.color.RED, 12, False),
+        ("Net Income: $116", arcade.color.BLUE, 16, True),
+        (f"Time: {remaining:.1f}s", arcade.color.BLACK, 16, False),
+        ("ACTIVE ORDER:", arcade.color.BLACK, 14, True),
+        ("Pickup from Joe's", flash, 12, False),
+        ("at 8Av, 42St", flash, 12, False),
+        ("Deliver to 3Av, 71St", arcade.color.BLUE, 12, True),
+    ]
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    window = arcade.Window(1200, 800, "Text benchmark", visible=False)
+    layer = TextLayer()
+    frame = 0
+
+    def draw_immediate():
+        nonlocal frame
+        frame += 1
+        for i, (text, color, size, bold) in enumerate(sidebar_lines(frame)):
+            arcade.draw_text(text, 900, 770 - i * 22, color, size, bold=bold)
+
+    def draw_retained():
+        nonlocal frame
+        frame += 1
+        for i, (text, color, size, bold) in enumerate(sidebar_lines(frame)):
+            layer.draw_text(text, 900, 770 - i * 22, color, size, bold=bold)
+        layer.draw()
+
+    print(f"{len(sidebar_lines(0))} sidebar labels, {frames} frames each:")
+    for label, draw in (("draw_text", draw_immediate), ("TextLayer", draw_retained)):
+        frame = 0
+        ms, _ = time_frames(window, draw, frames)
+        print(f"  {label:<10} {ms:6.3f} ms/frame")
+    print(f"  TextLayer laid out {layer.layouts} labels from scratch")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Time building the map sprites with shared textures against one load each.
+
+Before the texture registry every home, subway and pizza shop sprite
+decoded its own copy of its image. This builds the Manhattan sprites and
+the player through the registry, then decodes the same images once per
+sprite the old way, and reports loads and bytes saved.
+
+Usage: python -m benchmarks.texture_benchmark
+"""
+
+import time
+
+import arcade
+
+from gameplay.player import PlayerCharacter
+from map_locations import MapSprites, default_layout
+from map_locations.textures import TEXTURES
+
+
+def main():
+    layout = default_layout()
+
+    TEXTURES.clear()
+    start = time.perf_counter()
+    sprites = MapSprites.from_layout(layout)
+    PlayerCharacter()
+    shared = time.perf_counter() - start
+    if len({id(home.home_texture) for home in sprites.homes}) != 1:
+        raise AssertionError("Homes don't share one texture")
+    print(f"map sprites with shared textures: {shared * 1e3:.0f} ms")
+    print(f"  {TEXTURES.summary()}")
+
+    paths = (
+        [spec.logo_path for spec in layout.pizza_shops]
+        + ["images/home.png"] * len(layout.homes)
+        + ["images/subway.png"] * len(layout.subways)
+        + ["images/scooter.png"]
+    )
+    start = time.perf_counter()
+    for path in paths:
+        arcade.load_texture(path)
+    separate = time.perf_counter() - start
+    print(
+        f"one load per sprite: {separate * 1e3:.0f} ms for {len(paths)} loads "
+        f"({separate / shared:.0f}x slower)"
+    )
+
+
+if __name__ == "__main__":
+    main()
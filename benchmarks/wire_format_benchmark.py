@@ -0,0 +1,126 @@
+"""Compare payload size and encode/decode time of JSON vs the binary wire format.
+
+JSON is measured the way the client and server produce it today: `.dict()` plus
+json.dumps on the way out, and model validation on the way in.
+"""
+
+import json
+import timeit
+import uuid
+from datetime import datetime
+
+from backend.db.models import Session
+from backend.server.schemas import SessionUpdate
+from backend.server.wire_format import (
+    decode_payload,
+    encode_session,
+    encode_session_update,
+    encode_sessions,
+)
+
+ITERATIONS = 20_000
+LIST_ITERATIONS = 500
+LIST_SIZE = 100
+
+
+def make_session(i: int) -> Session:
+    return Session(
+        player_name=f"player-{i}",
+        session_id=str(uuid.uuid4()),
+        timestamp=datetime(2025, 1, 1, 12, 0, i % 60),
+        earned=10.0 * i,
+        spent=float(i % 7),
+        net_income=10.0 * i - i % 7,
+    )
+
+
+def time_per_call_us(fn, iterations: int) -> float:
+    return min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def report(name: str, json_bytes: bytes, binary_bytes: bytes, timings: dict):
+    print(f"\n{name}")
+    print(f"  size:    json {len(json_bytes):>7} B   binary {len(binary_bytes):>7} B")
+    for label, (json_us, binary_us) in timings.items():
+        print(
+            f"  {label}: json {json_us:>7.2f} us  binary {binary_us:>7.2f} us"
+            f"  ({json_us / binary_us:.1f}x)"
+        )
+
+
+def main():
+    session = make_session(42)
+    json_single = json.dumps(session.model_dump(mode="json")).encode()
+    binary_single = encode_session(session)
+    report(
+        "Session",
+        json_single,
+        binary_single,
+        {
+            "encode": (
+                time_per_call_us(
+                    lambda: json.dumps(session.model_dump(mode="json")), ITERATIONS
+                ),
+                time_per_call_us(lambda: encode_session(session), ITERATIONS),
+            ),
+            "decode": (
+                time_per_call_us(
+                    lambda: Session.model_validate_json(json_single), ITERATIONS
+                ),
+                time_per_call_us(lambda: decode_payload(binary_single), ITERATIONS),
+            ),
+        },
+    )
+
+    update = SessionUpdate(earned=120.0, spent=3.0, net_income=117.0)
+    json_update = json.dumps(update.model_dump(exclude_unset=True)).encode()
+    binary_update = encode_session_update(update)
+    report(
+        "SessionUpdate",
+        json_update,
+        binary_update,
+        {
+            "encode": (
+                time_per_call_us(
+                    lambda: json.dumps(update.model_dump(exclude_unset=True)),
+                    ITERATIONS,
+                ),
+                time_per_call_us(lambda: encode_session_update(update), ITERATIONS),
+            ),
+            "decode": (
+                time_per_call_us(
+                    lambda: SessionUpdate.model_validate_json(json_update), ITERATIONS
+                ),
+                time_per_call_us(lambda: decode_payload(binary_update), ITERATIONS),
+            ),
+        },
+    )
+
+    sessions = [make_session(i) for i in range(LIST_SIZE)]
+    json_list = json.dumps([s.model_dump(mode="json") for s in sessions]).encode()
+    binary_list = encode_sessions(sessions)
+    report(
+        f"list[Session] x {LIST_SIZE}",
+        json_list,
+        binary_list,
+        {
+            "encode": (
+                time_per_call_us(
+                    lambda: json.dumps([s.model_dump(mode="json") for s in sessions]),
+                    LIST_ITERATIONS,
+                ),
+                time_per_call_us(lambda: encode_sessions(sessions), LIST_ITERATIONS),
+            ),
+            "decode": (
+                time_per_call_us(
+                    lambda: [Session(**s) for s in json.loads(json_list)],
+                    LIST_ITERATIONS,
+                ),
+                time_per_call_us(lambda: decode_payload(binary_list), LIST_ITERATIONS),
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,39 @@ STREET_HEIGHT = MAP_HEIGHT // (STREETS + 1)
 GAME_DURATION = 60.0  # Total game duration in seconds
 COLLISION_THRESHOLD = 40  # Distance threshold for pickup/delivery interactions
 
+# Order Difficulty Constants - (shop, home) pairs are drawn most often around
+# the target walking time between them, falling off with the spread
+ORDER_TARGET_TRAVEL_TIME = 1.2  # Seconds of walking from pickup to delivery
+ORDER_TRAVEL_TIME_SPREAD = 0.5  # Seconds; smaller gives more uniform orders
+# Maps bigger than the default grid only pair shops and homes this close
+ORDER_MAX_TRAVEL_TIME = ORDER_TARGET_TRAVEL_TIME + 3 * ORDER_TRAVEL_TIME_SPREAD
+
+# Simulation Constants
+SIMULATION_TICK_RATE = 120  # Fixed simulation steps per second, whatever the frame rate
+MAX_TICKS_PER_FRAME = (
+    12  # Catch-up steps allowed after a slow frame before time is dropped
+)
+
+# Session Constants
+CHECKPOINT_INTERVAL = 5.0  # Seconds between live score checkpoints sent to the backend
+CHECKPOINT_STOP_TIMEOUT = 0.5  # Longest the game waits for a checkpoint being sent
+TRACE_DIRECTORY = "traces"  # Where finished games' input traces are saved
+
+# Profiler Constants
+PROFILE_DIRECTORY = "profiles"  # Where frame timing traces are saved
+PROFILER_WINDOW = 240  # Frames the overlay's rolling percentiles cover
+PROFILER_TRACE_FRAMES = 36_000  # Most recent frames kept for saving (10 min at 60 fps)
+
+# Map Constants
+DEFAULT_MAP_PATH = "maps/manhattan.json"  # Layout the game and tools load by default
+MAP_DIRECTORY = "maps"  # Map files the server can replay submitted games on
+
+# Large Map Constants - maps bigger than the screen scroll with the player and
+# are drawn in chunks of this many blocks, only where the camera can see
+MAP_CHUNK_AVENUES = 8
+MAP_CHUNK_STREETS = 16
+MAP_CHUNK_CACHE_SIZE = 64  # Chunks kept built; the least recently seen go first
+
 # Default Address Spread Constants
 DEFAULT_AVENUES_SPREAD = 1
 DEFAULT_STREETS_SPREAD = 5
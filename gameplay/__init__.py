@@ -1,5 +1,12 @@
 """NYC Pizza Delivery Game - Gameplay Module."""
 
-from .game import PizzaDeliveryGame
-
 __all__ = ["PizzaDeliveryGame"]
+
+
+def __getattr__(name: str):
+    # Imported lazily: the window pulls in arcade, the simulation core does not
+    if name == "PizzaDeliveryGame":
+        from .game import PizzaDeliveryGame
+
+        return PizzaDeliveryGame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,109 @@
+"""NYC Pizza Delivery Game - Autopilot Module.
+
+A reference bot that plays through the same inputs as a person at the
+keyboard. It reads the current order, walks the fastest route to the
+pickup or delivery location, presses SPACE once in reach, and rides the
+subway when the ride saves enough time to be worth the fare.
+"""
+
+from gameplay.simulation import (
+    FIXED_TIMESTEP,
+    GameSimulation,
+    PlayerInput,
+    within_reach,
+)
+from map_locations import MapLocation
+from map_locations.routing import Node
+
+# Seconds a subway ride must save before it's worth $1; at roughly $10 per
+# four-second delivery, a second of walking is worth about $2.50
+SUBWAY_MIN_SAVING = 0.4
+
+DIRECTION_INPUTS = {
+    "up": PlayerInput.UP,
+    "down": PlayerInput.DOWN,
+    "left": PlayerInput.LEFT,
+    "right": PlayerInput.RIGHT,
+}
+
+
+class Autopilot:
+    """Plays a GameSimulation by pressing keys, one tick at a time."""
+
+    def __init__(
+        self, simulation: GameSimulation, subway_min_saving: float = SUBWAY_MIN_SAVING
+    ):
+        """
+        Initialize the autopilot.
+
+        Args:
+            simulation: Game to play
+            subway_min_saving: Seconds a subway ride must save to be taken
+        """
+        self.simulation = simulation
+        self.subway_min_saving = subway_min_saving
+        self._destination: MapLocation | None = None
+        # Nodes still to visit, with whether to ride the subway on leaving each
+        self._waypoints: list[tuple[Node, bool]] = []
+
+    def update(self):
+        """Press the keys for the next tick; call before every step."""
+        simulation = self.simulation
+        if simulation.current_order is None or simulation.is_over:
+            return
+        player = simulation.player
+        destination = simulation.get_current_destination_location(
+            is_pickup=not player.has_pizza
+        )
+
+        if within_reach(player.center_x, player.center_y, destination):
+            simulation.apply_input(PlayerInput.SPACE)
+            return
+        if destination is not self._destination:
+            self._plan(destination)
+
+        routing = simulation.game_map.routing
+        # Close enough to a waypoint when within a tick's movement of it
+        tolerance = player.speed * FIXED_TIMESTEP
+        while self._waypoints:
+            node, ride = self._waypoints[0]
+            target_x, target_y = routing.position(node)
+            dx = target_x - player.center_x
+            dy = target_y - player.center_y
+            if abs(dx) > tolerance or abs(dy) > tolerance:
+                break
+            self._waypoints.pop(0)
+            if ride:
+                simulation.apply_input(PlayerInput.SPACE)
+                # Came out at the next waypoint
+                self._waypoints.pop(0)
+        else:
+            dx = destination.center_x - player.center_x
+            dy = destination.center_y - player.center_y
+
+        # Close one axis at a time, like walking the grid
+        if abs(dx) > tolerance:
+            action = PlayerInput.RIGHT if dx > 0 else PlayerInput.LEFT
+        else:
+            action = PlayerInput.UP if dy > 0 else PlayerInput.DOWN
+        if DIRECTION_INPUTS.get(player.direction) is not action:
+            simulation.apply_input(action)
+
+    def _plan(self, destination: MapLocation):
+        """Route to a new destination, riding the subway only if it pays."""
+        simulation = self.simulation
+        routing = simulation.game_map.routing
+        start = routing.node_at(simulation.player.center_x, simulation.player.center_y)
+        route = routing.fastest_route(start, destination)
+        if route.subway_rides:
+            walk = routing.fastest_route(start, destination, use_subway=False)
+            if walk.time - route.time < self.subway_min_saving:
+                route = walk
+
+        nodes = route.nodes
+        self._waypoints = [
+            (node, not routing.adjacent(node, following))
+            for node, following in zip(nodes, nodes[1:])
+        ]
+        self._waypoints.append((nodes[-1], False))
+        self._destination = destination
@@ -0,0 +1,301 @@
+"""NYC Pizza Delivery Game - Batch Simulation Module.
+
+Steps thousands of games at once for balancing runs. Every per-game value
+(position, direction, pizza, order, timer, score) is a NumPy array indexed by
+game, and movement, speed zones, reach checks and subway rides are computed
+for all games in one go. The rules and their floating point arithmetic are
+the same as gameplay.simulation.GameSimulation, so a game played here with
+the same seed and inputs ends in exactly the same state.
+"""
+
+import random
+from typing import Iterable
+
+import numpy as np
+
+from constants import DEFAULT_PLAYER_SPEED, GAME_DURATION, SIMULATION_TICK_RATE
+from gameplay.simulation import (
+    COLLISION_THRESHOLD_SQUARED,
+    DELIVERY_REWARD,
+    FIXED_TIMESTEP,
+    PLAYER_HALF_SIZE,
+    SpaceAction,
+    new_seed,
+    start_position,
+)
+from map_locations import GameMap, MapLocation, default_game_map
+
+# Direction codes, in the order of DIRECTIONS; NO_DIRECTION means standing still
+DIRECTIONS = ("up", "down", "left", "right")
+NO_DIRECTION = -1
+
+# Unit velocity per direction code; the last row is picked by NO_DIRECTION
+_DIRECTION_X = np.array([0.0, 0.0, -1.0, 1.0, 0.0])
+_DIRECTION_Y = np.array([1.0, -1.0, 0.0, 0.0, 0.0])
+
+# Codes returned by handle_space_action, indexing SPACE_ACTIONS
+ACTION_NONE = 0
+ACTION_PICKUP = 1
+ACTION_DELIVERY = 2
+ACTION_SUBWAY = 3
+SPACE_ACTIONS = (
+    SpaceAction.NONE,
+    SpaceAction.PICKUP,
+    SpaceAction.DELIVERY,
+    SpaceAction.SUBWAY,
+)
+
+
+def _centers(locations: list[MapLocation]) -> tuple[np.ndarray, np.ndarray]:
+    """Center x and y of each location as arrays."""
+    return (
+        np.array([location.center_x for location in locations], dtype=np.float64),
+        np.array([location.center_y for location in locations], dtype=np.float64),
+    )
+
+
+class BatchSimulation:
+    """Many independent games of pizza delivery stored as arrays."""
+
+    def __init__(
+        self,
+        n_games: int,
+        game_map: GameMap | None = None,
+        seeds: Iterable[int] | None = None,
+        duration: float = GAME_DURATION,
+    ):
+        """
+        Initialize a batch of games.
+
+        Args:
+            n_games: Number of games to simulate side by side
+            game_map: Locations to play on, the Manhattan map by default
+            seeds: One order generation seed per game, fresh random ones by
+                default; game i matches GameSimulation(seed=seeds[i])
+            duration: Game length in seconds
+        """
+        self.n_games = n_games
+        self.game_map = game_map or default_game_map()
+        self.duration = duration
+        self.duration_ticks = round(duration * SIMULATION_TICK_RATE)
+        self.seeds = (
+            list(seeds) if seeds is not None else [new_seed() for _ in range(n_games)]
+        )
+        if len(self.seeds) != n_games:
+            raise ValueError(f"Expected {n_games} seeds, got {len(self.seeds)}")
+
+        # Map arrays are (re)loaded by reset whenever the map's version changes
+        self._map_version: int | None = None
+        self.reset()
+
+    def _load_map(self):
+        """Copy the map's locations into arrays."""
+        game_map = self.game_map
+        self._map_version = game_map.version
+        self._bounds = game_map.grid.bounds
+        self._shop_x, self._shop_y = _centers(game_map.pizza_shops)
+        self._home_x, self._home_y = _centers(game_map.homes)
+        self._subway_x, self._subway_y = _centers(game_map.subways)
+        self._order_table = game_map.order_table
+
+        zones = game_map.speed_zones
+        self._zone_left = np.array([zone.left for zone in zones], dtype=np.float64)
+        self._zone_right = np.array([zone.right for zone in zones], dtype=np.float64)
+        self._zone_bottom = np.array([zone.bottom for zone in zones], dtype=np.float64)
+        self._zone_top = np.array([zone.top for zone in zones], dtype=np.float64)
+        self._zone_multiplier = np.array(
+            [zone.speed_multiplier for zone in zones], dtype=np.float64
+        )
+
+        # Subway each destination teleports to, from the map's nearest-subway table
+        self._shop_subway = self._closest_subway_indices(game_map.pizza_shops)
+        self._home_subway = self._closest_subway_indices(game_map.homes)
+
+    def _closest_subway_indices(self, destinations: list[MapLocation]) -> np.ndarray:
+        """Index of the subway closest to each destination, or -1 without subways."""
+        subway_index = {id(subway): i for i, subway in enumerate(self.game_map.subways)}
+        nearest_subways = self.game_map.nearest_subways
+        indices = []
+        for destination in destinations:
+            subway = nearest_subways.for_location(destination)
+            indices.append(-1 if subway is None else subway_index[id(subway)])
+        return np.array(indices, dtype=np.intp)
+
+    def reset(self):
+        """Reset every game's player, score, order and timer."""
+        # Pick up locations added or removed since the last game
+        if self._map_version != self.game_map.version:
+            self._load_map()
+
+        n = self.n_games
+        start_x, start_y = start_position(self._bounds)
+        self.x = np.full(n, start_x, dtype=np.float64)
+        self.y = np.full(n, start_y, dtype=np.float64)
+        self.direction = np.full(n, NO_DIRECTION, dtype=np.intp)
+        self.has_pizza = np.zeros(n, dtype=bool)
+        self.pickup_index = np.full(n, -1, dtype=np.intp)
+        self.delivery_index = np.full(n, -1, dtype=np.intp)
+        # Center of the current pickup or delivery location, kept for policies
+        self.destination_x = np.zeros(n, dtype=np.float64)
+        self.destination_y = np.zeros(n, dtype=np.float64)
+        self._destination_subway = np.full(n, -1, dtype=np.intp)
+        self.tick_count = np.zeros(n, dtype=np.int64)
+        self.earned = np.zeros(n, dtype=np.int64)
+        self.spent = np.zeros(n, dtype=np.int64)
+        self.subway_usage_count = np.zeros(n, dtype=np.int64)
+        self.rngs = [random.Random(seed) for seed in self.seeds]
+
+    @property
+    def score(self) -> np.ndarray:
+        """Net income (earned - spent) of every game."""
+        return self.earned - self.spent
+
+    @property
+    def game_timer(self) -> np.ndarray:
+        """Seconds of game time played in every game."""
+        return self.tick_count / SIMULATION_TICK_RATE
+
+    @property
+    def active(self) -> np.ndarray:
+        """Mask of games whose time is not up yet."""
+        return self.tick_count < self.duration_ticks
+
+    @property
+    def is_over(self) -> bool:
+        """Check if every game's time is up."""
+        return not self.active.any()
+
+    def start(self):
+        """Start the clock and hand out the first order in every game."""
+        self.tick_count[:] = 0
+        self._generate_new_orders(np.arange(self.n_games))
+
+    def _generate_new_orders(self, games: np.ndarray):
+        """Generate a new order for each of the given games."""
+        # Same draw as Order.from_order_table
+        for game in games.tolist():
+            shop_index, home_index = self._order_table.sample(self.rngs[game])
+            self.pickup_index[game] = shop_index
+            self.delivery_index[game] = home_index
+        self._update_destinations(games)
+
+    def _update_destinations(self, games: np.ndarray):
+        """Refresh the cached destination of the given games."""
+        has_pizza = self.has_pizza[games]
+        pickup = self.pickup_index[games]
+        delivery = self.delivery_index[games]
+        self.destination_x[games] = np.where(
+            has_pizza, self._home_x[delivery], self._shop_x[pickup]
+        )
+        self.destination_y[games] = np.where(
+            has_pizza, self._home_y[delivery], self._shop_y[pickup]
+        )
+        self._destination_subway[games] = np.where(
+            has_pizza, self._home_subway[delivery], self._shop_subway[pickup]
+        )
+
+    def move_direction(self, directions: np.ndarray, games: np.ndarray | None = None):
+        """
+        Set the movement direction of games.
+
+        Args:
+            directions: Direction codes (index into DIRECTIONS, or NO_DIRECTION to stop)
+            games: Games to steer, all games by default
+        """
+        if games is None:
+            self.direction[:] = directions
+        else:
+            self.direction[games] = directions
+
+    def stop_movement(self, games: np.ndarray | None = None):
+        """Stop moving the player in the given games, all games by default."""
+        self.move_direction(NO_DIRECTION, games)
+
+    def get_player_speed_multipliers(self) -> np.ndarray:
+        """Speed multiplier of the first speed zone each player overlaps, else 1."""
+        multipliers = np.ones(self.n_games)
+        left = self.x - PLAYER_HALF_SIZE
+        right = self.x + PLAYER_HALF_SIZE
+        bottom = self.y - PLAYER_HALF_SIZE
+        top = self.y + PLAYER_HALF_SIZE
+        # Maps have a handful of zones; walk them backwards so the first overlap wins
+        for zone in reversed(range(len(self._zone_multiplier))):
+            overlap = (
+                (self._zone_left[zone] < right)
+                & (left < self._zone_right[zone])
+                & (self._zone_bottom[zone] < top)
+                & (bottom < self._zone_top[zone])
+            )
+            multipliers[overlap] = self._zone_multiplier[zone]
+        return multipliers
+
+    def step(self):
+        """Advance every running game by one fixed tick."""
+        active = self.active
+        speed = DEFAULT_PLAYER_SPEED * self.get_player_speed_multipliers()
+        change_x = _DIRECTION_X[self.direction] * speed
+        change_y = _DIRECTION_Y[self.direction] * speed
+
+        min_x, max_x, min_y, max_y = self._bounds
+        x = np.clip(self.x + change_x * FIXED_TIMESTEP, min_x, max_x)
+        y = np.clip(self.y + change_y * FIXED_TIMESTEP, min_y, max_y)
+        np.copyto(self.x, x, where=active)
+        np.copyto(self.y, y, where=active)
+        self.tick_count += active
+
+    def handle_space_action(self, pressed: np.ndarray | None = None) -> np.ndarray:
+        """
+        Press SPACE in the given games.
+
+        Args:
+            pressed: Mask of games pressing SPACE, all games by default
+
+        Returns:
+            np.ndarray: Action code per game (index into SPACE_ACTIONS)
+        """
+        actions = np.zeros(self.n_games, dtype=np.int8)
+        pressing = self.active & (self.pickup_index >= 0)
+        if pressed is not None:
+            pressing &= pressed
+        games = np.flatnonzero(pressing)
+        if not games.size:
+            return actions
+
+        x = self.x[games]
+        y = self.y[games]
+        has_pizza = self.has_pizza[games]
+
+        # Only the current order's pickup or delivery location counts
+        dx = self.destination_x[games] - x
+        dy = self.destination_y[games] - y
+        at_target = dx * dx + dy * dy < COLLISION_THRESHOLD_SQUARED
+
+        pickups = games[at_target & ~has_pizza]
+        self.has_pizza[pickups] = True
+        self._update_destinations(pickups)
+        actions[pickups] = ACTION_PICKUP
+
+        deliveries = games[at_target & has_pizza]
+        self.has_pizza[deliveries] = False
+        self.earned[deliveries] += DELIVERY_REWARD
+        actions[deliveries] = ACTION_DELIVERY
+        # Complete the current order and immediately generate a new one
+        self._generate_new_orders(deliveries)
+
+        # Check for subway interaction at last
+        if not len(self._subway_x):
+            return actions
+        away = ~at_target
+        dx = self._subway_x - x[away][:, None]
+        dy = self._subway_y - y[away][:, None]
+        at_subway = (dx * dx + dy * dy < COLLISION_THRESHOLD_SQUARED).any(axis=1)
+        riders = games[away][at_subway]
+        if riders.size:
+            closest_subway = self._destination_subway[riders]
+            self.x[riders] = self._subway_x[closest_subway]
+            self.y[riders] = self._subway_y[closest_subway]
+            # Deduct $1 for subway usage
+            self.spent[riders] += 1
+            self.subway_usage_count[riders] += 1
+            actions[riders] = ACTION_SUBWAY
+        return actions
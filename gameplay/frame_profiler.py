@@ -0,0 +1,219 @@
+"""NYC Pizza Delivery Game - Frame Profiler Module.
+
+Opt-in timing of where each frame's time goes. The window wraps each
+phase of on_update and on_draw in profiler.phase(name), timed with
+perf_counter_ns, and ends the frame after drawing. Each frame also
+records the time since the previous one, which is what the player sees
+as stutter, and how many draw calls it made.
+
+The last PROFILER_WINDOW frames give rolling p50/p99 per phase for the
+overlay, and the last PROFILER_TRACE_FRAMES frames can be saved as CSV or
+JSON for comparing builds or machines.
+
+Usage: python -m gameplay.frame_profiler <trace.csv|trace.json>...
+"""
+
+import csv
+import json
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Iterator
+
+from constants import PROFILER_TRACE_FRAMES, PROFILER_WINDOW
+
+# Columns every frame has, before its phases
+FRAME_INTERVAL = "interval_ns"
+DRAW_CALLS = "draw_calls"
+
+_NO_PHASE = nullcontext()
+
+
+class DrawCallCounter:
+    """Counts draw calls while active.
+
+    Counts arcade's one GL entry point for drawing, Geometry.render, so
+    shapes, sprite lists and the static layer are counted; text is drawn
+    by pyglet batches and isn't.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __enter__(self):
+        from arcade.gl.vertex_array import Geometry
+
+        self._geometry = Geometry
+        self._render = Geometry.render
+        counter = self
+
+        def render(geometry, *args, **kwargs):
+            counter.count += 1
+            return counter._render(geometry, *args, **kwargs)
+
+        Geometry.render = render
+        return self
+
+    def __exit__(self, *exc_info):
+        self._geometry.render = self._render
+
+
+def percentile(values: list[int], q: float) -> int:
+    """Nearest-rank percentile of some values, q from 0 to 100."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class FrameProfiler:
+    """Per-phase frame timings, kept for a rolling summary and for export."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        window: int = PROFILER_WINDOW,
+        trace_frames: int = PROFILER_TRACE_FRAMES,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Whether to time anything; a disabled profiler's phases cost
+                one attribute check
+            window: Frames the rolling percentiles cover
+            trace_frames: Most recent frames kept for saving
+        """
+        self.enabled = enabled
+        self.show_overlay = False
+        self.window = window
+        # Phase names in the order they were first seen, for columns
+        self.phases: list[str] = []
+        self.frames: deque[dict[str, int]] = deque(maxlen=trace_frames)
+        self._recent: dict[str, deque[int]] = {}
+        self._current: dict[str, int] = {}
+        self._frame_count = 0
+        self._last_frame_end: int | None = None
+        self._draw_calls: DrawCallCounter | None = None
+        self._draw_calls_at_frame_start = 0
+
+    def start(self):
+        """Start counting draw calls; call once there's a window."""
+        if self.enabled and self._draw_calls is None:
+            self._draw_calls = DrawCallCounter().__enter__()
+
+    def stop(self):
+        """Stop counting draw calls."""
+        if self._draw_calls is not None:
+            self._draw_calls.__exit__(None, None, None)
+            self._draw_calls = None
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            self._current[name] = self._current.get(name, 0) + elapsed
+
+    def phase(self, name: str):
+        """Context manager adding the time spent in it to a phase of this frame."""
+        if not self.enabled:
+            return _NO_PHASE
+        return self._timed(name)
+
+    def end_frame(self):
+        """Record the frame so far and start the next one."""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        frame = {"frame": self._frame_count}
+        frame[FRAME_INTERVAL] = (
+            0 if self._last_frame_end is None else now - self._last_frame_end
+        )
+        if self._draw_calls is not None:
+            count = self._draw_calls.count
+            frame[DRAW_CALLS] = count - self._draw_calls_at_frame_start
+            self._draw_calls_at_frame_start = count
+        else:
+            frame[DRAW_CALLS] = 0
+        for name, elapsed in self._current.items():
+            if name not in self.phases:
+                self.phases.append(name)
+            frame[name] = elapsed
+        self.frames.append(frame)
+
+        # Phases skipped this frame, e.g. a closed dialog, count as zero
+        for name in (FRAME_INTERVAL, DRAW_CALLS, *self.phases):
+            recent = self._recent.setdefault(name, deque(maxlen=self.window))
+            recent.append(frame.get(name, 0))
+
+        self._current = {}
+        self._frame_count += 1
+        self._last_frame_end = now
+
+    def summary(self) -> dict[str, tuple[int, int]]:
+        """(p50, p99) of each column over the rolling window."""
+        return {
+            name: (percentile(list(values), 50), percentile(list(values), 99))
+            for name, values in self._recent.items()
+        }
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names of a saved trace."""
+        return ["frame", FRAME_INTERVAL, DRAW_CALLS, *self.phases]
+
+    def save(self, path: Path | str):
+        """Write the kept frames as CSV or JSON, chosen by the file's suffix."""
+        path = Path(path)
+        columns = self.columns
+        rows = [[frame.get(name, 0) for name in columns] for frame in self.frames]
+        if path.suffix == ".json":
+            path.write_text(json.dumps({"columns": columns, "frames": rows}))
+        elif path.suffix == ".csv":
+            with path.open("w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(rows)
+        else:
+            raise ValueError(f"Unknown trace format: {path.suffix or path.name}")
+
+
+def load_trace(path: Path | str) -> dict[str, list[int]]:
+    """Read a saved trace into one list of values per column."""
+    path = Path(path)
+    if path.suffix == ".json":
+        data = json.loads(path.read_text())
+        columns, rows = data["columns"], data["frames"]
+    else:
+        with path.open(newline="") as f:
+            reader = csv.reader(f)
+            columns = next(reader)
+            rows = [[int(value) for value in row] for row in reader]
+    return {name: [row[i] for row in rows] for i, name in enumerate(columns)}
+
+
+def main(paths: list[str]):
+    """Print p50/p99/max of each phase of saved traces."""
+    for path in paths:
+        trace = load_trace(path)
+        print(f"{path}: {len(trace['frame'])} frames")
+        print(f"  {'':<14} {'p50':>8} {'p99':>8} {'max':>8}")
+        for name, values in trace.items():
+            if name == "frame" or not values:
+                continue
+            stats = [percentile(values, 50), percentile(values, 99), max(values)]
+            if name == DRAW_CALLS:
+                cells = [f"{v:8d}" for v in stats]
+            else:
+                cells = [f"{v / 1e6:6.2f}ms" for v in stats]
+            print(f"  {name:<14} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,73 +1,142 @@
 """NYC Pizza Delivery Game - Main entry point."""
 
+import time
+from pathlib import Path
 from typing import Iterable
 
 import arcade
 
 from constants import (
-    COLLISION_THRESHOLD,
-    DEFAULT_PLAYER_SPEED,
-    GAME_DURATION,
-    MAP_HEIGHT,
     MAP_OFFSET_X,
     MAP_OFFSET_Y,
+    PROFILE_DIRECTORY,
     SCREEN_HEIGHT,
     SCREEN_TITLE,
     SCREEN_WIDTH,
     SIDEBAR_X,
 )
+from gameplay.frame_profiler import FrameProfiler
 from gameplay.game_state_manager import GameState, GameStateManager
 from gameplay.orders import Order
 from gameplay.player import PlayerCharacter
 from gameplay.score_tracker import ScoreTracker
+from gameplay.simulation import GameSimulation, PlayerInput, SpaceAction
+from gameplay.timestep import FixedTimestep
 from logging_utils import get_logger
 from map_locations import (
-    HOMES,
-    PIZZA_SHOPS,
-    SPEED_MULTIPLIER_LOCATIONS,
-    SUBWAYS,
+    GameMap,
     Location,
+    MapGrid,
+    MapLayout,
+    MapLocation,
+    MapSprites,
+    default_layout,
 )
+from map_locations.textures import TEXTURES
 from static_drawings import (
+    MapChunks,
+    StaticLayer,
+    TextLayer,
     draw_final_score,
     draw_game_instructions_dialog,
     draw_leaderboard_dialog,
     draw_manhattan_grid,
     draw_name_input_dialog,
+    draw_order_info,
+    draw_profiler_overlay,
 )
 
 # Initialize logger at module level
 logger = get_logger(__name__)
 
 
+def fits_on_screen(grid: MapGrid) -> bool:
+    """Check if a map fits beside the sidebar, with room for its rivers and labels."""
+    left, right, _, top = grid.bounds
+    return (
+        left - MAP_OFFSET_X >= 0
+        and right + MAP_OFFSET_X <= SIDEBAR_X
+        and top + MAP_OFFSET_Y <= SCREEN_HEIGHT
+    )
+
+
+def _clamp_between(value: float, low: float, high: float) -> float:
+    """Clamp a value to [low, high], or the middle when the range is empty."""
+    if low > high:
+        return (low + high) / 2
+    return min(max(value, low), high)
+
+
 class PizzaDeliveryGame(arcade.Window):
-    """Main game class."""
+    """Main game class - renders and drives a GameSimulation."""
+
+    def __init__(self, profile: bool = False, map_path: str | None = None):
+        """
+        Initialize the game window.
 
-    def __init__(self):
+        Args:
+            profile: Time each frame's phases; F3 shows them, F4 saves a trace
+            map_path: Map file to play on, the Manhattan map by default
+        """
         super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
         arcade.set_background_color(arcade.color.LIGHT_GRAY)
+        self.profiler = FrameProfiler(enabled=profile)
+        self.profiler.start()
 
-        # Initialize score tracker
-        self.score_tracker = ScoreTracker()
+        # Game rules, scoring and timer run headless in the simulation, stepped
+        # in fixed ticks whatever the frame rate
+        layout = default_layout() if map_path is None else MapLayout.load(map_path)
+        self.simulation = GameSimulation(GameMap.from_layout(layout))
+        self.timestep = FixedTimestep()
 
         # Initialize game state manager
         self.game_state_manager = GameStateManager(self)
 
         # Initialize game objects
         self._player = PlayerCharacter()
-        self._pizza_shops = PIZZA_SHOPS
-        self._homes = HOMES
-        self._speed_multipler_locations = SPEED_MULTIPLIER_LOCATIONS
-        self._subways = SUBWAYS
-
-        # Order management
-        self.current_order = None
+        # Everything that moves, in one sprite list that is only ever moved,
+        # never rebuilt; more couriers or traffic would join the player here
+        self._actors = arcade.SpriteList(capacity=len(self._player.sprites))
+        self._actors.extend(self._player.sprites)
+        if fits_on_screen(layout.grid):
+            # Textures are loaded here, once there's a window to draw them in
+            self.camera: arcade.Camera2D | None = None
+            self._map_chunks: MapChunks | None = None
+            self._map_sprites = MapSprites.from_layout(layout)
+            self._pizza_shops = self._map_sprites.pizza_shops
+            self._homes = self._map_sprites.homes
+            self._speed_multipler_locations = (
+                self._map_sprites.speed_multiplier_locations
+            )
+            self._subways = self._map_sprites.subways
+        else:
+            # Bigger maps scroll with the player, and their sprites are built a
+            # chunk at a time as they come into view
+            self.camera = arcade.Camera2D(
+                viewport=arcade.LBWH(0, 0, SIDEBAR_X, SCREEN_HEIGHT)
+            )
+            self._map_chunks = MapChunks(layout)
+            self._map_sprites = None
+            self._pizza_shops = []
+            self._homes = []
+            self._speed_multipler_locations = []
+            self._subways = []
+        # One decoded image per file, packed into the atlas before the first frame
+        TEXTURES.add_to_atlas(self.ctx.default_atlas)
+        logger.info(f"Textures: {TEXTURES.summary()}")
+        # Sidebar labels, laid out again only when their text changes
+        self._sidebar_text = TextLayer()
+        self._controls_text = TextLayer()
+        # Grid, locations and sidebar chrome never change, so they're drawn once
+        self.static_layer = StaticLayer(self, self.draw_static_scene)
+
+        # Player position before the latest tick, to draw in between ticks
+        self._previous_player_position = (0.0, 0.0)
+        self.snap_player()
+
+        # Flash effect for order highlights
         self.flash_timer = 0.0
 
-        # Game timer (1 minute = 60 seconds)
-        self.game_timer = 0.0
-        self.game_duration = GAME_DURATION
-
     @property
     def player(self) -> arcade.Sprite:
         """Get the player character."""
@@ -78,6 +147,26 @@ class PizzaDeliveryGame(arcade.Window):
         """Get the player name."""
         return self.game_state_manager.player_name
 
+    @property
+    def score_tracker(self) -> ScoreTracker:
+        """Get the score tracker of the current game."""
+        return self.simulation.score_tracker
+
+    @property
+    def current_order(self) -> Order | None:
+        """Get the current order."""
+        return self.simulation.current_order
+
+    @property
+    def game_timer(self) -> float:
+        """Get the seconds played in the current game."""
+        return self.simulation.game_timer
+
+    @property
+    def game_duration(self) -> float:
+        """Get the game length in seconds."""
+        return self.simulation.duration
+
     @property
     def pizza_shops(self) -> Iterable[Location]:
         """Get the pizza shops."""
@@ -98,24 +187,6 @@ class PizzaDeliveryGame(arcade.Window):
         """Get the subways."""
         return self._subways
 
-    def get_player_speed_multiplier(self):
-        """Get the speed multiplier based on player's current location in speed multiplier locations."""
-        for location in self._speed_multipler_locations:
-            # Check if player sprite collides with location sprite
-            if arcade.check_for_collision(self.player, location):
-                return location.player_speed_multiplier
-
-        # Default multiplier if not in any speed multiplier location
-        return 1.0
-
-    def update_player_speed(self):
-        """Update player speed based on current location."""
-        multiplier = self.get_player_speed_multiplier()
-        new_speed = DEFAULT_PLAYER_SPEED * multiplier
-        self.player.set_speed(new_speed)
-        # Note: The player's update() method will automatically recalculate velocity
-        # based on the new speed if the player is currently moving
-
     def log_final_score(self):
         """Log the final score with player name."""
         logger.info("=== GAME OVER ===")
@@ -126,21 +197,12 @@ class PizzaDeliveryGame(arcade.Window):
         logger.info(f"Subway Usage: {self.score_tracker.subway_usage_count} times")
         logger.info("================")
 
-    def generate_new_order(self):
-        """Generate a new order and make it the current order."""
-        self.current_order = Order.generate_order()
+    def log_current_order(self):
+        """Log the current order."""
         logger.info(
             f"New order: Pickup from {self.current_order.pickup_location.name} at {self.current_order.pickup_location.avenue_street_address}, deliver to {self.current_order.delivery_location.avenue_street_address}"
         )
 
-    def get_current_destination_location(self, is_pickup: bool = True) -> Location:
-        """Get the current pickup or delivery location for highlighting."""
-        return (
-            self.current_order.pickup_location
-            if is_pickup
-            else self.current_order.delivery_location
-        )
-
     def draw_order_highlights(self):
         """Draw highlighting for current order pickup and delivery locations."""
         # Don't draw highlights if there's no current order
@@ -154,18 +216,19 @@ class PizzaDeliveryGame(arcade.Window):
             # Use single color for highlighting
             highlight_color = arcade.color.MAGENTA
 
-            if not self.player.has_pizza:
+            if not self.simulation.player.has_pizza:
                 # Player doesn't have pizza - highlight pickup location only
-                location = self.get_current_destination_location(is_pickup=True)
-                arcade.draw_rect_outline(
-                    location.arcade_rect, highlight_color, border_width=8
+                location = self.simulation.get_current_destination_location(
+                    is_pickup=True
                 )
             else:
                 # Player has pizza - highlight delivery location only
-                location = self.get_current_destination_location(is_pickup=False)
-                arcade.draw_rect_outline(
-                    location.arcade_rect, highlight_color, border_width=8
+                location = self.simulation.get_current_destination_location(
+                    is_pickup=False
                 )
+            arcade.draw_rect_outline(
+                arcade.LRBT(*location.bounds), highlight_color, border_width=8
+            )
 
     def _draw_sidebar_background(self):
         """Draw the sidebar background and border."""
@@ -174,55 +237,116 @@ class PizzaDeliveryGame(arcade.Window):
         arcade.draw_rect_outline(sidebar_rect, arcade.color.BLACK, border_width=2)
 
     def _draw_sidebar_text(
-        self, text: str, x: int, y: int, color, size: int = 14, bold: bool = False
+        self,
+        layer: TextLayer,
+        text: str,
+        x: int,
+        y: int,
+        color,
+        size: int = 14,
+        bold: bool = False,
     ) -> int:
-        """Draw text in sidebar and return new y position."""
-        arcade.draw_text(text, x, y, color, size, bold=bold)
+        """Add text to a sidebar text layer and return new y position."""
+        layer.draw_text(text, x, y, color, size, bold=bold)
         return y - (25 if bold else 20)
 
-    def draw_game_screen(self):
-        """Draw the normal game screen."""
-        # Draw Manhattan map first
-        draw_manhattan_grid()
-
-        # Draw all sprites with highlighting
-        for location in self.pizza_shops:
-            location.draw()
-        for location in self.homes:
-            location.draw()
-        for location in self.speed_multiplier_locations:
-            location.draw()
-        for location in self.subways:
-            location.draw()
-
-        # Draw highlighting for current order locations
-        self.draw_order_highlights()
+    def draw_static_scene(self):
+        """Draw the parts of the game screen that never change."""
+        self._draw_sidebar_background()
+        self._draw_sidebar_controls()
+        if self.camera is not None:
+            # A scrolling map is drawn every frame, through the camera
+            return
 
-        # Draw player character
-        self.player.draw()
+        # Draw Manhattan map first
+        grid = self.simulation.game_map.grid
+        draw_manhattan_grid(grid)
 
-        # Draw sidebar
-        self.draw_sidebar()
+        # Draw every location in one batched sprite list
+        self._map_sprites.draw()
 
         # Draw map labels
         arcade.draw_text(
             "Manhattan Pizza Delivery",
-            MAP_OFFSET_X,
-            MAP_OFFSET_Y + MAP_HEIGHT + 20,
+            grid.bounds[0],
+            grid.bounds[3] + 20,
             arcade.color.BLACK,
             20,
         )
 
-    def draw_sidebar(self):
-        """Draw the sidebar with game information."""
-        self._draw_sidebar_background()
+    def draw_game_screen(self):
+        """Draw the normal game screen."""
+        # Map, locations and sidebar chrome, from the offscreen cache
+        with self.profiler.phase("static"):
+            self.static_layer.draw()
+
+        # Place player character between its last two simulated positions
+        with self.profiler.phase("player"):
+            alpha = (
+                self.timestep.alpha
+                if self.game_state_manager.game_state == GameState.ACTIVE
+                else 1.0
+            )
+            self.player.sync(
+                self.simulation.player, self._previous_player_position, alpha
+            )
+
+        if self.camera is None:
+            self.draw_world()
+        else:
+            # Scroll to the player and draw only the chunks in view
+            self.follow_player()
+            with self.camera.activate():
+                with self.profiler.phase("map"):
+                    x, y = self.camera.position
+                    self._map_chunks.draw(
+                        x + self.camera.left,
+                        x + self.camera.right,
+                        y + self.camera.bottom,
+                        y + self.camera.top,
+                    )
+                self.draw_world()
+
+        # Draw sidebar
+        with self.profiler.phase("sidebar"):
+            self.draw_sidebar()
+
+    def draw_world(self):
+        """Draw what changes on the map: order highlights and the player."""
+        # Draw highlighting for current order locations
+        with self.profiler.phase("highlights"):
+            self.draw_order_highlights()
+
+        with self.profiler.phase("player"):
+            self._actors.draw()
+
+    def follow_player(self):
+        """Center the camera on the player, without scrolling past the rivers."""
+        left, right, bottom, top = self.simulation.game_map.grid.bounds
+        half_width = self.camera.viewport_width / 2 / self.camera.zoom
+        half_height = self.camera.viewport_height / 2 / self.camera.zoom
+        self.camera.position = (
+            _clamp_between(
+                self.player.center_x,
+                left - MAP_OFFSET_X + half_width,
+                right + MAP_OFFSET_X - half_width,
+            ),
+            _clamp_between(
+                self.player.center_y,
+                bottom - MAP_OFFSET_Y + half_height,
+                top + MAP_OFFSET_Y - half_height,
+            ),
+        )
 
+    def draw_sidebar(self):
+        """Draw the sidebar's game information over its background."""
         # Sidebar text positioning
         sidebar_text_x = SIDEBAR_X + 10
         current_y = SCREEN_HEIGHT - 30
 
         # Draw player and financial information
         current_y = self._draw_sidebar_text(
+            self._sidebar_text,
             f"Player: {self.player_name}",
             sidebar_text_x,
             current_y,
@@ -231,18 +355,21 @@ class PizzaDeliveryGame(arcade.Window):
             bold=True,
         )
         current_y = self._draw_sidebar_text(
+            self._sidebar_text,
             f"Earned: ${self.score_tracker.earned}",
             sidebar_text_x,
             current_y,
             arcade.color.GREEN,
         )
         current_y = self._draw_sidebar_text(
+            self._sidebar_text,
             f"Spent: ${self.score_tracker.spent}",
             sidebar_text_x,
             current_y,
             arcade.color.RED,
         )
         current_y = self._draw_sidebar_text(
+            self._sidebar_text,
             f"Net Income: ${self.score_tracker.score}",
             sidebar_text_x,
             current_y,
@@ -253,23 +380,37 @@ class PizzaDeliveryGame(arcade.Window):
         current_y -= 5  # Extra spacing
 
         # Draw timer
-        remaining_time = max(0, self.game_duration - self.game_timer)
+        remaining_time = self.simulation.remaining_time
         timer_color = arcade.color.RED if remaining_time < 10 else arcade.color.BLACK
         current_y = self._draw_sidebar_text(
-            f"Time: {remaining_time:.1f}s", sidebar_text_x, current_y, timer_color, 16
+            self._sidebar_text,
+            f"Time: {remaining_time:.1f}s",
+            sidebar_text_x,
+            current_y,
+            timer_color,
+            16,
         )
         current_y -= 5  # Extra spacing
+        self._sidebar_text.draw()
 
         # Draw current order information
         if self.current_order is not None:
-            current_y = self.current_order.draw_order_info(
-                sidebar_text_x, current_y, self.flash_timer
+            draw_order_info(
+                self.current_order, sidebar_text_x, current_y, self.flash_timer
             )
 
-        # Draw controls
+    def _draw_sidebar_controls(self):
+        """Draw the controls help at the bottom of the sidebar."""
+        sidebar_text_x = SIDEBAR_X + 10
         current_y = MAP_OFFSET_Y
         current_y = self._draw_sidebar_text(
-            "Controls:", sidebar_text_x, current_y, arcade.color.BLACK, 12, bold=True
+            self._controls_text,
+            "Controls:",
+            sidebar_text_x,
+            current_y,
+            arcade.color.BLACK,
+            12,
+            bold=True,
         )
 
         control_texts = [
@@ -281,18 +422,35 @@ class PizzaDeliveryGame(arcade.Window):
 
         for text in control_texts:
             current_y = self._draw_sidebar_text(
-                text, sidebar_text_x, current_y, arcade.color.BLACK, 10
+                self._controls_text,
+                text,
+                sidebar_text_x,
+                current_y,
+                arcade.color.BLACK,
+                10,
             )
             current_y += 5  # Less spacing for controls
+        self._controls_text.draw()
 
     def on_draw(self):
         """Render the screen."""
-        self.clear()
+        with self.profiler.phase("clear"):
+            self.clear()
 
         # Always draw the game screen first
         self.draw_game_screen()
 
         # Draw state-specific overlays
+        with self.profiler.phase("dialogs"):
+            self.draw_dialogs()
+
+        if self.profiler.show_overlay:
+            with self.profiler.phase("overlay"):
+                draw_profiler_overlay(self.profiler)
+        self.profiler.end_frame()
+
+    def draw_dialogs(self):
+        """Draw the dialog of the current game state, if it has one."""
         if self.game_state_manager.game_state == GameState.NAME_INPUT:
             draw_name_input_dialog(self.game_state_manager.name_input_text)
         elif self.game_state_manager.game_state == GameState.SHOWING_INSTRUCTIONS:
@@ -311,96 +469,57 @@ class PizzaDeliveryGame(arcade.Window):
                 self.game_state_manager.leaderboard_data, self.player_name
             )
 
+    def snap_player(self):
+        """Draw the player at its current position without interpolating, e.g. after a jump."""
+        player = self.simulation.player
+        self._previous_player_position = (player.center_x, player.center_y)
+
     def on_update(self, delta_time):
         """Movement and game logic."""
         if self.game_state_manager.game_state == GameState.ACTIVE:
-            # Update player speed based on speed multiplier locations
-            self.update_player_speed()
-
-            self.player.update(delta_time)
+            # Run as many fixed simulation ticks as this frame's time covers
+            with self.profiler.phase("simulation"):
+                for _ in range(self.timestep.advance(delta_time)):
+                    self.snap_player()
+                    self.simulation.step()
+                    if self.simulation.is_over:
+                        break
             # Update flash timer for highlighting effects
             self.flash_timer += delta_time
 
-            # Update game timer
-            self.game_timer += delta_time
+            # Queue the live score for the next background checkpoint
+            with self.profiler.phase("checkpoint"):
+                self.game_state_manager.session_manager.checkpoint(
+                    self.score_tracker.earned, self.score_tracker.spent
+                )
 
             # Check if time is up
-            if self.game_timer >= self.game_duration:
+            if self.simulation.is_over:
                 self.game_state_manager.end_game()
 
     def handle_space_action(self):
         """Handle space bar action for pizza pickup, dropoff, and subway teleportation."""
-
-        # Check for pizza pickup using distance-based collision detection
-        if not self.player.has_pizza:
-            # Only allow pickup from the current order's pickup location
-            location = self.get_current_destination_location(is_pickup=True)
-            distance = arcade.get_distance_between_sprites(self.player, location)
-            if distance < COLLISION_THRESHOLD:
-                self.player.has_pizza = True
-                logger.info(f"Pizza picked up from {location.name}!")
-                return
-
-        # Check for pizza delivery using distance-based collision detection
-        elif self.player.has_pizza:
-            # Only allow delivery to the current order's delivery location
-            location = self.get_current_destination_location(is_pickup=False)
-            distance = arcade.get_distance_between_sprites(self.player, location)
-            if distance < COLLISION_THRESHOLD:
-                self.player.has_pizza = False
-                self.score_tracker.earn_money(10)  # +$10 per pizza delivery
-                logger.info(
-                    f"Pizza delivered to {location.avenue_street_address}! Earned: ${self.score_tracker.earned}, Net: ${self.score_tracker.score}"
-                )
-                # Complete the current order and immediately generate a new one
-                self.current_order = None
-                self.generate_new_order()
-                return
-
-        # Check for subway interaction at last
-        for subway in self.subways:
-            distance = arcade.get_distance_between_sprites(self.player, subway)
-            if distance < COLLISION_THRESHOLD:
-                self.handle_subway_teleportation()
-                return
-
-    def find_closest_subway_to_destination(
-        self, destination: Location
-    ) -> Location | None:
-        """Find the subway station closest to the given destination."""
-
-        min_distance = float("inf")
-        closest_subway = None
-
-        for subway in self.subways:
-            distance = arcade.get_distance_between_sprites(subway, destination)
-            if distance < min_distance:
-                min_distance = distance
-                closest_subway = subway
-
-        return closest_subway
-
-    def handle_subway_teleportation(self):
-        """Handle subway teleportation to the closest subway near the destination."""
-        if self.current_order is None:
+        action, location = self.simulation.apply_input(PlayerInput.SPACE)
+        if action is SpaceAction.PICKUP:
+            logger.info(f"Pizza picked up from {location.name}!")
+        elif action is SpaceAction.DELIVERY:
+            logger.info(
+                f"Pizza delivered to {location.avenue_street_address}! Earned: ${self.score_tracker.earned}, Net: ${self.score_tracker.score}"
+            )
+            self.log_current_order()
+        elif action is SpaceAction.SUBWAY:
+            self.snap_player()
+            self._log_subway_teleportation(location)
+
+    def _log_subway_teleportation(self, subway: MapLocation | None):
+        """Log where the subway took the player."""
+        if subway is None:
             logger.warning(
                 "No active order - can't determine destination for subway teleportation!"
             )
             return
-        destination = self.get_current_destination_location(
-            is_pickup=not self.player.has_pizza
-        )
-        closest_subway = self.find_closest_subway_to_destination(destination)
-
-        # Teleport player to the closest subway near the destination
-        self.player.center_x = closest_subway.center_x
-        self.player.center_y = closest_subway.center_y
-
-        # Deduct $1 for subway usage
-        self.score_tracker.use_subway()
-
         logger.info(
-            f"Teleported to subway at {closest_subway.avenue_street_address} (closest to destination)! Spent: ${self.score_tracker.spent}, Net: ${self.score_tracker.score}"
+            f"Teleported to subway at {subway.avenue_street_address} (closest to destination)! Spent: ${self.score_tracker.spent}, Net: ${self.score_tracker.score}"
         )
 
     def on_key_press(self, key, modifiers):
@@ -408,8 +527,17 @@ class PizzaDeliveryGame(arcade.Window):
         # Common keys that work in all states
         if key == arcade.key.ESCAPE:
             self.game_state_manager.session_manager.cleanup()
+            if self.profiler.enabled:
+                self.save_profile()
+                self.profiler.stop()
             arcade.close_window()
             return
+        if self.profiler.enabled and key == arcade.key.F3:
+            self.profiler.show_overlay = not self.profiler.show_overlay
+            return
+        if self.profiler.enabled and key == arcade.key.F4:
+            self.save_profile()
+            return
 
         # State-specific key handling
         if self.game_state_manager.is_game_over:
@@ -421,6 +549,19 @@ class PizzaDeliveryGame(arcade.Window):
         else:
             self._handle_game_key(key)
 
+    def save_profile(self):
+        """Save the profiler's frame timings as CSV and JSON traces."""
+        stem = Path(PROFILE_DIRECTORY) / time.strftime("frames-%Y%m%d-%H%M%S")
+        try:
+            stem.parent.mkdir(parents=True, exist_ok=True)
+            for suffix in (".csv", ".json"):
+                self.profiler.save(stem.with_suffix(suffix))
+            logger.info(
+                f"Frame trace of {len(self.profiler.frames)} frames saved to {stem}.csv/.json"
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save frame trace: {e}")
+
     def _handle_game_over_key(self, key):
         """Handle keys when game is over."""
         if key == arcade.key.R:
@@ -467,18 +608,18 @@ class PizzaDeliveryGame(arcade.Window):
     def _handle_movement_key(self, key):
         """Handle movement and action keys."""
         movement_map = {
-            arcade.key.UP: "up",
-            arcade.key.W: "up",
-            arcade.key.DOWN: "down",
-            arcade.key.S: "down",
-            arcade.key.LEFT: "left",
-            arcade.key.A: "left",
-            arcade.key.RIGHT: "right",
-            arcade.key.D: "right",
+            arcade.key.UP: PlayerInput.UP,
+            arcade.key.W: PlayerInput.UP,
+            arcade.key.DOWN: PlayerInput.DOWN,
+            arcade.key.S: PlayerInput.DOWN,
+            arcade.key.LEFT: PlayerInput.LEFT,
+            arcade.key.A: PlayerInput.LEFT,
+            arcade.key.RIGHT: PlayerInput.RIGHT,
+            arcade.key.D: PlayerInput.RIGHT,
         }
 
         if key in movement_map:
-            self.player.move_direction(movement_map[key])
+            self.simulation.apply_input(movement_map[key])
         elif key == arcade.key.SPACE:
             self.handle_space_action()
 
@@ -497,4 +638,4 @@ class PizzaDeliveryGame(arcade.Window):
                 arcade.key.D,
             ]
             if key in movement_keys:
-                self.player.stop_movement()
+                self.simulation.apply_input(PlayerInput.STOP)
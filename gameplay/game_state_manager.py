@@ -1,15 +1,10 @@
 from enum import Enum
+from pathlib import Path
 
-from constants import (
-    MAP_HEIGHT,
-    MAP_OFFSET_X,
-    MAP_OFFSET_Y,
-    MAP_WIDTH,
-)
-
-# Import ScoreTracker from main module
-from gameplay.score_tracker import ScoreTracker
+from constants import TRACE_DIRECTORY
+from gameplay.input_trace import TRACE_SUFFIX, InputTrace
 from gameplay.session_manager import SessionManager
+from gameplay.simulation import PlayerInput
 from logging_utils import get_logger
 
 # Initialize logger at module level
@@ -75,7 +70,6 @@ class GameStateManager:
     def start_game_from_instructions(self):
         """Start the game after showing instructions."""
         self._game_state = GameState.ACTIVE
-        self.game.game_timer = 0.0  # Reset timer
 
         # Create a new session in the database
         self.session_manager.create_session(
@@ -84,47 +78,67 @@ class GameStateManager:
             self.game.score_tracker.spent,
         )
 
-        # Start the game by generating a new order
-        self.game.generate_new_order()
+        # Play with the seed the server issued, so the game's trace verifies
+        if self.session_manager.game_seed is not None:
+            self.game.simulation.reset(self.session_manager.game_seed)
+
+        # Start the game timer and generate the first order
+        self.game.simulation.start()
+        self.game.timestep.reset()
+        logger.info(f"Game seed: {self.game.simulation.seed}")
+        self.game.log_current_order()
         logger.info(f"Let's start delivering pizzas, {self.player_name}!")
 
     def toggle_instructions_overlay(self):
         """Toggle the instructions overlay during gameplay."""
         if self._game_state == GameState.ACTIVE_WITH_OVERLAY:
             self._game_state = GameState.ACTIVE
+            # Don't catch up on time spent reading the instructions
+            self.game.timestep.reset()
             logger.info("Instructions hidden")
         else:
             self._game_state = GameState.ACTIVE_WITH_OVERLAY
             # Stop player movement when showing instructions
-            self.game.player.stop_movement()
+            self.game.simulation.apply_input(PlayerInput.STOP)
             logger.info("Instructions shown - press 'i' again to hide")
 
     def end_game(self):
         """End the game and show final score."""
         self._game_state = GameState.GAME_OVER
 
-        # Update the session with final scores
+        # Update the session with final scores, for the server to check
+        # against a replay of the game's inputs
+        trace = InputTrace.from_simulation(self.game.simulation)
         self.session_manager.update_session(
-            self.game.score_tracker.earned, self.game.score_tracker.spent
+            self.game.score_tracker.earned,
+            self.game.score_tracker.spent,
+            input_trace=trace.to_bytes(),
         )
 
         self.game.log_final_score()
+        self.save_input_trace(trace)
+
+    def save_input_trace(self, trace: InputTrace):
+        """Save the finished game's inputs so it can be replayed later."""
+        name = self.session_manager.session_id or str(trace.seed)
+        path = Path(TRACE_DIRECTORY) / f"{name}{TRACE_SUFFIX}"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            trace.save(path)
+            logger.info(f"Input trace saved to {path} ({path.stat().st_size} bytes)")
+        except OSError as e:
+            logger.warning(f"Failed to save input trace: {e}")
 
     def restart_game(self):
         """Restart the game with the same player name."""
         # Reset game state
         self._game_state = GameState.SHOWING_INSTRUCTIONS
-        self.game.score_tracker = ScoreTracker()
-        self.game.game_timer = 0.0
-        self.game.current_order = None
         self.game.flash_timer = 0.0
-        self.game.session_manager.reset_session()  # Reset session ID for new game
+        self.session_manager.reset_session()  # Reset session ID for new game
 
-        # Reset player position and state
-        self.game.player.center_x = MAP_OFFSET_X + MAP_WIDTH // 2
-        self.game.player.center_y = MAP_OFFSET_Y + MAP_HEIGHT // 2
-        self.game.player.has_pizza = False
-        self.game.player.stop_movement()
+        # Reset player, score, order and timer, with a new order seed
+        self.game.simulation.reset()
+        self.game.snap_player()
 
         logger.info(f"Game restarted for {self.player_name}! Showing instructions...")
 
@@ -0,0 +1,200 @@
+"""NYC Pizza Delivery Game - Input Trace Module.
+
+A game is fully determined by its seed and the inputs applied on each tick,
+so recording those is enough to play it back exactly, e.g. to reproduce a
+bug report or to re-score old games after a rule change.
+
+Traces are stored as a one-byte format version followed by unsigned LEB128
+varints:
+
+    tick rate, seed, duration in ticks, map digest length, map digest,
+    event count, then per event: (ticks since the previous event << 3) | input
+
+The map digest is the ASCII digest of the layout the game was played on
+(MapLayout.digest), so a trace is replayed on the same map; it's empty for
+a map that was edited after loading.
+
+Inputs happen a few times a second at most, so almost every event fits in
+one or two bytes and a whole game takes a few hundred bytes.
+
+The version changes whenever the same inputs would play a different game,
+e.g. version 2 draws orders from the difficulty-weighted order table rather
+than uniformly; version 3 adds the map digest. Traces of older versions can't
+be replayed and are rejected.
+
+Usage: python -m gameplay.input_trace <trace file>...
+"""
+
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from constants import MAP_DIRECTORY, SIMULATION_TICK_RATE
+from gameplay.simulation import GameSimulation, InputEvent, PlayerInput, replay_inputs
+from map_locations import GameMap
+from map_locations.layout import map_files_by_digest
+
+TRACE_VERSION = 3
+TRACE_SUFFIX = ".trace"
+
+_ACTION_BITS = 3
+_ACTION_MASK = (1 << _ACTION_BITS) - 1
+
+
+class InputTraceError(ValueError):
+    """Raised when a trace is malformed or can't be replayed by this build."""
+
+
+def _pack_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _unpack_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        try:
+            byte = data[offset]
+        except IndexError:
+            raise InputTraceError("Trace ends in the middle of a number") from None
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+@dataclass
+class InputTrace:
+    """A game's seed, length and map, with every input applied during it."""
+
+    seed: int
+    duration_ticks: int
+    events: list[InputEvent] = field(default_factory=list)
+    # Layout digest of the map the game was played on, "" if unknown
+    map_digest: str = ""
+
+    @classmethod
+    def from_simulation(cls, simulation: GameSimulation) -> "InputTrace":
+        """Take the trace of a game played so far."""
+        return cls(
+            simulation.seed,
+            simulation.duration_ticks,
+            list(simulation.inputs),
+            simulation.game_map.layout_digest,
+        )
+
+    @property
+    def duration(self) -> float:
+        """Game length in seconds."""
+        return self.duration_ticks / SIMULATION_TICK_RATE
+
+    def to_bytes(self) -> bytes:
+        """Encode the trace."""
+        out = bytearray([TRACE_VERSION])
+        _pack_varint(out, SIMULATION_TICK_RATE)
+        _pack_varint(out, self.seed)
+        _pack_varint(out, self.duration_ticks)
+        map_digest = self.map_digest.encode("ascii")
+        _pack_varint(out, len(map_digest))
+        out += map_digest
+        _pack_varint(out, len(self.events))
+        previous_tick = 0
+        for tick, action in self.events:
+            _pack_varint(out, (tick - previous_tick) << _ACTION_BITS | action)
+            previous_tick = tick
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InputTrace":
+        """Decode a trace."""
+        if not data:
+            raise InputTraceError("Empty trace")
+        if data[0] < TRACE_VERSION:
+            raise InputTraceError(
+                f"Trace version {data[0]} was recorded under older game rules "
+                f"and can't be replayed by this build (version {TRACE_VERSION})"
+            )
+        if data[0] != TRACE_VERSION:
+            raise InputTraceError(f"Unsupported trace version: {data[0]}")
+        tick_rate, offset = _unpack_varint(data, 1)
+        if tick_rate != SIMULATION_TICK_RATE:
+            raise InputTraceError(
+                f"Trace was recorded at {tick_rate} ticks/s, "
+                f"this build runs at {SIMULATION_TICK_RATE}"
+            )
+        seed, offset = _unpack_varint(data, offset)
+        duration_ticks, offset = _unpack_varint(data, offset)
+        digest_length, offset = _unpack_varint(data, offset)
+        digest_end = offset + digest_length
+        if digest_end > len(data):
+            raise InputTraceError("Trace ends in the middle of the map digest")
+        try:
+            map_digest = data[offset:digest_end].decode("ascii")
+        except UnicodeDecodeError:
+            raise InputTraceError("Map digest in trace is not ASCII") from None
+        offset = digest_end
+        count, offset = _unpack_varint(data, offset)
+
+        events = []
+        tick = 0
+        for _ in range(count):
+            packed, offset = _unpack_varint(data, offset)
+            tick += packed >> _ACTION_BITS
+            action = packed & _ACTION_MASK
+            if action >= len(PlayerInput):
+                raise InputTraceError(f"Unknown input in trace: {action}")
+            events.append(InputEvent(tick, PlayerInput(action)))
+        if offset != len(data):
+            raise InputTraceError("Unexpected data after the last event")
+        return cls(seed, duration_ticks, events, map_digest)
+
+    def save(self, path: Path | str):
+        """Write the encoded trace to a file."""
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path | str) -> "InputTrace":
+        """Read a trace written by save()."""
+        return cls.from_bytes(Path(path).read_bytes())
+
+    def replay(self, game_map: GameMap | None = None) -> GameSimulation:
+        """
+        Play the game back headlessly, as fast as possible.
+
+        Args:
+            game_map: Map the game was played on, the Manhattan map by default
+
+        Returns:
+            GameSimulation: The finished game
+        """
+        return replay_inputs(self.seed, self.events, game_map, self.duration)
+
+
+def main(paths: list[str]):
+    """Replay trace files on the maps in MAP_DIRECTORY and print their scores."""
+    map_files = map_files_by_digest(MAP_DIRECTORY)
+    for path in paths:
+        trace = InputTrace.load(path)
+        map_path = map_files.get(trace.map_digest)
+        if map_path is None:
+            print(f"{path}: played on a map not in {MAP_DIRECTORY}/, skipped")
+            continue
+        game_map = GameMap.load(map_path)
+        start = time.perf_counter()
+        simulation = trace.replay(game_map)
+        elapsed_ms = (time.perf_counter() - start) * 1e3
+        score = simulation.score_tracker
+        print(
+            f"{path}: seed {trace.seed}, {len(trace.events)} inputs, "
+            f"earned ${score.earned} spent ${score.spent} net ${score.score} "
+            f"(replayed in {elapsed_ms:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
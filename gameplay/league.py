@@ -0,0 +1,133 @@
+"""NYC Pizza Delivery Game - Autopilot League Module.
+
+Plays many seeded games with the Autopilot across a pool of worker
+processes, and reports the score distribution and games per second. The
+same seeds always give the same scores, so a league run is a reproducible
+throughput benchmark and a baseline for map or rule changes. Results can be
+uploaded to the backend in bulk, where they are stored off the leaderboard.
+
+Usage: python -m gameplay.league [--games N] [--first-seed S] [--workers W]
+                                 [--upload] [--player-name NAME]
+"""
+
+import argparse
+import os
+import statistics
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple
+
+from backend.client import FastAPIClient
+from backend.server.schemas import SessionCreate
+from gameplay.autopilot import Autopilot
+from gameplay.simulation import GameSimulation
+from map_locations import default_game_map
+
+LEAGUE_PLAYER_NAME = "Autopilot"
+
+
+class GameResult(NamedTuple):
+    """Final score of one autopilot game."""
+
+    seed: int
+    earned: int
+    spent: int
+    subway_rides: int
+
+    @property
+    def net_income(self) -> int:
+        return self.earned - self.spent
+
+
+def play_game(seed: int) -> GameResult:
+    """Play one full game with the autopilot."""
+    simulation = GameSimulation(default_game_map(), seed=seed)
+    autopilot = Autopilot(simulation)
+    simulation.start()
+    while not simulation.is_over:
+        autopilot.update()
+        simulation.step()
+
+    score = simulation.score_tracker
+    return GameResult(seed, score.earned, score.spent, score.subway_usage_count)
+
+
+def run_league(seeds: Iterable[int], workers: int | None = None) -> list[GameResult]:
+    """
+    Play a game for every seed across worker processes.
+
+    Args:
+        seeds: Seeds to play, one game each
+        workers: Number of worker processes, one per core by default
+
+    Returns:
+        list[GameResult]: Results in seed order
+    """
+    seeds = list(seeds)
+    workers = workers or os.cpu_count() or 1
+    # Batches keep the per-task overhead small next to a game's runtime
+    chunk_size = max(1, len(seeds) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(play_game, seeds, chunksize=chunk_size))
+
+
+def summarize(results: list[GameResult], elapsed: float) -> str:
+    """Describe the score distribution and throughput of a league run."""
+    scores = sorted(result.net_income for result in results)
+    deciles = statistics.quantiles(scores, n=10) if len(scores) > 1 else scores * 9
+    rides = statistics.mean(result.subway_rides for result in results)
+    return "\n".join(
+        [
+            f"{len(results)} games in {elapsed:.2f}s ({len(results) / elapsed:.1f} games/s)",
+            f"  net income: mean ${statistics.mean(scores):.2f}, "
+            f"stdev ${statistics.pstdev(scores):.2f}",
+            f"  min ${scores[0]}, p10 ${deciles[0]:.0f}, median ${deciles[4]:.0f}, "
+            f"p90 ${deciles[8]:.0f}, max ${scores[-1]}",
+            f"  mean subway rides {rides:.1f}",
+        ]
+    )
+
+
+def upload_results(results: list[GameResult], player_name: str) -> int:
+    """Upload league results as sessions; returns how many were stored."""
+    run_id = uuid.uuid4().hex[:8]
+    sessions = [
+        SessionCreate(
+            player_name=player_name,
+            # Stable per run and seed, so re-sending a batch doesn't duplicate it
+            session_id=f"league-{run_id}-{result.seed}",
+            earned=result.earned,
+            spent=result.spent,
+            net_income=result.net_income,
+        )
+        for result in results
+    ]
+    with FastAPIClient() as client:
+        return client.create_sessions_bulk(sessions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play an autopilot league.")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--upload", action="store_true", help="send results to the backend"
+    )
+    parser.add_argument("--player-name", default=LEAGUE_PLAYER_NAME)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_league(
+        range(args.first_seed, args.first_seed + args.games), args.workers
+    )
+    print(summarize(results, time.perf_counter() - start))
+
+    if args.upload:
+        stored = upload_results(results, args.player_name)
+        print(f"  uploaded {stored} of {len(results)} results")
+
+
+if __name__ == "__main__":
+    main()
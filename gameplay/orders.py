@@ -4,16 +4,17 @@ This module contains the order system with pickup and delivery addresses.
 """
 
 import random
+from typing import Sequence
 
-import arcade
+from map_locations import GameMap, MapLocation
 
-from map_locations import HOMES, PIZZA_SHOPS, Location
 
+class Order:
+    """Represents a pizza delivery order."""
 
-class Order(arcade.Sprite):
-    """Represents a pizza delivery order as a sprite."""
+    __slots__ = ("pickup_location", "delivery_location")
 
-    def __init__(self, pickup_location: Location, delivery_location: Location):
+    def __init__(self, pickup_location: MapLocation, delivery_location: MapLocation):
         """
         Initialize an order.
 
@@ -21,67 +22,34 @@ class Order(arcade.Sprite):
             pickup_location: Location to pick up pizza from
             delivery_location: Location to deliver pizza to
         """
-        # Initialize arcade.Sprite first
-        super().__init__()
-
         self.pickup_location = pickup_location
         self.delivery_location = delivery_location
 
-        # Set sprite properties (invisible sprite for drawing purposes)
-        self.center_x = 0
-        self.center_y = 0
-        self.width = 0
-        self.height = 0
-
     @classmethod
-    def generate_order(cls) -> "Order":
-        """Generate a random order."""
-        pickup_location = random.choice(PIZZA_SHOPS)
-        delivery_location = random.choice(HOMES)
+    def generate_order(
+        cls,
+        pizza_shops: Sequence[MapLocation],
+        homes: Sequence[MapLocation],
+        rng: random.Random | None = None,
+    ) -> "Order":
+        """Generate a random order from the given shops and homes."""
+        rng = rng or random
+        pickup_location = rng.choice(pizza_shops)
+        delivery_location = rng.choice(homes)
         return cls(pickup_location=pickup_location, delivery_location=delivery_location)
 
-    def draw_order_info(self, x: int, y: int, flash_timer: float) -> int:
+    @classmethod
+    def from_order_table(
+        cls, game_map: GameMap, rng: random.Random | None = None
+    ) -> "Order":
         """
-        Draw the order information and return the next y position.
+        Draw an order from the map's order table, weighted by difficulty.
 
-        Args:
-            x: X position to draw at
-            y: Y position to start drawing at
-            flash_timer: Timer for flashing colors
-
-        Returns:
-            Next y position after drawing
+        Raises:
+            ValueError: If the map has no pizza shop and home pair
         """
-        current_y = y
-
-        # Always show order, but alternate colors based on flash_timer
-        order_text = "ACTIVE ORDER:"
-        arcade.draw_text(order_text, x, current_y, arcade.color.BLACK, 14, bold=True)
-
-        should_use_alt_color = (flash_timer % 1.0) < 0.5
-        pickup_color = arcade.color.RED if should_use_alt_color else arcade.color.ORANGE
-        delivery_color = (
-            arcade.color.BLUE if should_use_alt_color else arcade.color.CYAN
+        shop_index, home_index = game_map.order_table.sample(rng or random)
+        return cls(
+            pickup_location=game_map.pizza_shops[shop_index],
+            delivery_location=game_map.homes[home_index],
         )
-
-        current_y -= 20
-
-        pickup_text = f"Pickup from {self.pickup_location.name}"
-        arcade.draw_text(pickup_text, x, current_y, pickup_color, 12)
-        current_y -= 15
-
-        pickup_address = f"at {self.pickup_location.avenue_street_address}"
-        arcade.draw_text(pickup_address, x, current_y, pickup_color, 12)
-        current_y -= 20
-
-        delivery_text = f"Deliver to {self.delivery_location.avenue_street_address}"
-        arcade.draw_text(
-            delivery_text,
-            x,
-            current_y,
-            delivery_color,
-            12,
-            bold=True,
-        )
-
-        return current_y
@@ -0,0 +1,82 @@
+"""NYC Pizza Delivery Game - Score Checkpointer Module.
+
+Pushes live score checkpoints for the current session from a background thread
+so the game loop never waits on the network.
+"""
+
+import threading
+
+from backend.client import FastAPIClient
+from constants import CHECKPOINT_INTERVAL, CHECKPOINT_STOP_TIMEOUT
+from logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class ScoreCheckpointer:
+    """Periodically sends the latest score snapshot of a session.
+
+    Score changes are coalesced: only the most recent snapshot is kept, and at
+    most one request is sent per interval - and only if the snapshot changed
+    since the last successful checkpoint.
+    """
+
+    def __init__(
+        self,
+        api_client: FastAPIClient,
+        session_id: str,
+        interval: float = CHECKPOINT_INTERVAL,
+    ):
+        self.api_client = api_client
+        self.session_id = session_id
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._pending: tuple[float, float] | None = None
+        self._last_sent: tuple[float, float] | None = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="score-checkpointer", daemon=True
+        )
+
+    def start(self):
+        """Start the background checkpoint loop."""
+        self._thread.start()
+
+    def record(self, earned: float, spent: float):
+        """Record the latest score. Cheap enough to call every frame."""
+        with self._lock:
+            self._pending = (earned, spent)
+
+    def stop(self):
+        """Stop the background loop without sending pending changes.
+
+        Waits at most CHECKPOINT_STOP_TIMEOUT for a checkpoint already being
+        sent, so a slow server never freezes the game. One that lands after
+        the final update is refused by the server, as the final score is
+        verified by replay.
+        """
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(CHECKPOINT_STOP_TIMEOUT)
+            if self._thread.is_alive():
+                logger.info(
+                    f"Not waiting for the checkpoint of session {self.session_id}"
+                )
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self._flush()
+
+    def _flush(self):
+        """Send the pending snapshot if it changed since the last checkpoint."""
+        with self._lock:
+            snapshot = self._pending
+        if snapshot is None or snapshot == self._last_sent:
+            return
+
+        earned, spent = snapshot
+        if self.api_client.checkpoint_session(self.session_id, earned, spent):
+            self._last_sent = snapshot
+        else:
+            logger.warning(f"Failed to checkpoint session {self.session_id}")
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from backend.client import FastAPIClient
+from gameplay.score_checkpointer import ScoreCheckpointer
 from logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -12,7 +13,10 @@ class SessionManager:
     def __init__(self):
         """Initialize the session manager."""
         self.session_id: Optional[str] = None
+        # Seed the server issued for this session's game, if any
+        self.game_seed: Optional[int] = None
         self.api_client: Optional[FastAPIClient] = None
+        self.checkpointer: Optional[ScoreCheckpointer] = None
         self._initialize_api_client()
 
     def _initialize_api_client(self):
@@ -44,7 +48,9 @@ class SessionManager:
             )
             if session_response:
                 self.session_id = session_response.session_id
+                self.game_seed = session_response.game_seed
                 logger.info(f"Session created with ID: {self.session_id}")
+                self._start_checkpointer()
                 return True
             else:
                 logger.error("Failed to create session")
@@ -53,14 +59,38 @@ class SessionManager:
             logger.error(f"Error creating session: {e}")
             return False
 
-    def update_session(self, earned: float, spent: float) -> bool:
-        """Update the current session with final scores."""
+    def _start_checkpointer(self):
+        """Start sending live score checkpoints for the current session."""
+        self._stop_checkpointer()
+        self.checkpointer = ScoreCheckpointer(self.api_client, self.session_id)
+        self.checkpointer.start()
+
+    def _stop_checkpointer(self):
+        """Stop live score checkpoints, if running."""
+        if self.checkpointer:
+            self.checkpointer.stop()
+            self.checkpointer = None
+
+    def checkpoint(self, earned: float, spent: float):
+        """Record the current score for the next live checkpoint."""
+        if self.checkpointer:
+            self.checkpointer.record(earned, spent)
+
+    def update_session(
+        self, earned: float, spent: float, input_trace: Optional[bytes] = None
+    ) -> bool:
+        """Update the current session with final scores and the game's input trace."""
+        # The final update supersedes any pending checkpoint
+        self._stop_checkpointer()
         if not self.api_client or not self.session_id:
             return False
 
         try:
             session_response = self.api_client.update_session(
-                session_id=self.session_id, earned=earned, spent=spent
+                session_id=self.session_id,
+                earned=earned,
+                spent=spent,
+                input_trace=input_trace,
             )
             if session_response:
                 logger.info(
@@ -76,6 +106,7 @@ class SessionManager:
 
     def cleanup(self):
         """Clean up the API client resources."""
+        self._stop_checkpointer()
         if self.api_client:
             try:
                 self.api_client.client.close()
@@ -84,5 +115,7 @@ class SessionManager:
                 logger.error(f"Error cleaning up API client: {e}")
 
     def reset_session(self):
-        """Reset the session ID for a new game."""
+        """Reset the session ID and game seed for a new game."""
+        self._stop_checkpointer()
         self.session_id = None
+        self.game_seed = None
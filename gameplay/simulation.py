@@ -0,0 +1,401 @@
+"""NYC Pizza Delivery Game - Simulation Module.
+
+Headless game rules: player movement, speed zones, orders, subway teleports,
+scoring and the game timer. Nothing here imports arcade, so games can run
+without a display - for bots, tests and server-side validation - while
+PizzaDeliveryGame only renders the state kept here.
+
+The game advances in fixed ticks of FIXED_TIMESTEP seconds and draws orders
+from a random.Random seeded per game, so the same seed and the same inputs
+at the same ticks always produce the same game, at any frame rate.
+"""
+
+import math
+import random
+import secrets
+from enum import Enum, IntEnum
+from typing import Iterable, NamedTuple, Sequence
+
+from constants import (
+    COLLISION_THRESHOLD,
+    DEFAULT_PLAYER_SPEED,
+    GAME_DURATION,
+    PLAYER_SIZE,
+    SIMULATION_TICK_RATE,
+)
+from gameplay.orders import Order
+from gameplay.score_tracker import ScoreTracker
+from map_locations import GameMap, MapGrid, MapLocation, default_game_map
+
+DELIVERY_REWARD = 10  # +$10 per pizza delivery
+
+# Seconds of game time per simulation tick
+FIXED_TIMESTEP = 1 / SIMULATION_TICK_RATE
+
+
+def start_position(bounds: tuple[float, float, float, float]) -> tuple[float, float]:
+    """Get where players start: the center of the map's (left, right, bottom, top)."""
+    left, right, bottom, top = bounds
+    return left + (right - left) // 2, bottom + (top - bottom) // 2
+
+
+# Half the player's size, used for speed zone overlap checks
+PLAYER_HALF_SIZE = PLAYER_SIZE / 2
+
+# Reach checks compare squared distances so batched NumPy code gets the same answer
+COLLISION_THRESHOLD_SQUARED = COLLISION_THRESHOLD * COLLISION_THRESHOLD
+
+
+class SpaceAction(Enum):
+    """What pressing SPACE did."""
+
+    NONE = "none"
+    PICKUP = "pickup"
+    DELIVERY = "delivery"
+    SUBWAY = "subway"
+
+
+class PlayerInput(IntEnum):
+    """An input the player can give the game."""
+
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+    STOP = 4
+    SPACE = 5
+
+
+# Movement direction of each directional input
+INPUT_DIRECTIONS = {
+    PlayerInput.UP: "up",
+    PlayerInput.DOWN: "down",
+    PlayerInput.LEFT: "left",
+    PlayerInput.RIGHT: "right",
+}
+
+
+class InputEvent(NamedTuple):
+    """An input applied before the simulation step numbered `tick`."""
+
+    tick: int
+    action: PlayerInput
+
+
+class SpaceActionResult(NamedTuple):
+    """Outcome of pressing SPACE and the location it happened at."""
+
+    action: SpaceAction
+    location: MapLocation | None = None
+
+
+class PlayerState:
+    """Position and movement of the pizza delivery person."""
+
+    __slots__ = (
+        "center_x",
+        "center_y",
+        "change_x",
+        "change_y",
+        "speed",
+        "direction",
+        "has_pizza",
+        "bounds",
+    )
+
+    def __init__(self, bounds: tuple[float, float, float, float] = MapGrid().bounds):
+        """
+        Initialize the player at the center of the map.
+
+        Args:
+            bounds: (left, right, bottom, top) of the map the player is kept within
+        """
+        self.bounds = bounds
+        self.center_x, self.center_y = start_position(bounds)
+        self.has_pizza = False
+
+        # Movement properties
+        self.speed = DEFAULT_PLAYER_SPEED
+        self.change_x = 0
+        self.change_y = 0
+        self.direction = None  # Track current movement direction
+
+    def move_direction(self, direction: str):
+        """Set movement direction. Velocity follows the current speed on update."""
+        self.direction = direction
+        self._update_velocity_from_direction()
+
+    def stop_movement(self):
+        """Stop all movement."""
+        self.change_x = 0
+        self.change_y = 0
+        self.direction = None
+
+    def _update_velocity_from_direction(self):
+        """Update velocity based on current direction and speed."""
+        direction = self.direction
+        if direction == "up":
+            self.change_y = self.speed
+            self.change_x = 0
+        elif direction == "down":
+            self.change_y = -self.speed
+            self.change_x = 0
+        elif direction == "left":
+            self.change_x = -self.speed
+            self.change_y = 0
+        elif direction == "right":
+            self.change_x = self.speed
+            self.change_y = 0
+
+    def update(self, delta_time: float):
+        """Move by the current velocity and keep within the map boundaries."""
+        # Re-derive velocity so speed changes apply while moving
+        if self.direction is not None:
+            self._update_velocity_from_direction()
+
+        x = self.center_x + self.change_x * delta_time
+        y = self.center_y + self.change_y * delta_time
+        min_x, max_x, min_y, max_y = self.bounds
+
+        if x < min_x:
+            x = min_x
+            self.change_x = 0
+        elif x > max_x:
+            x = max_x
+            self.change_x = 0
+
+        if y < min_y:
+            y = min_y
+            self.change_y = 0
+        elif y > max_y:
+            y = max_y
+            self.change_y = 0
+
+        self.center_x = x
+        self.center_y = y
+
+
+def distance_between(x: float, y: float, location: MapLocation) -> float:
+    """Distance from a point to the center of a location."""
+    return math.hypot(location.center_x - x, location.center_y - y)
+
+
+def within_reach(x: float, y: float, location: MapLocation) -> bool:
+    """Check if a point is close enough to a location to interact with it."""
+    dx = location.center_x - x
+    dy = location.center_y - y
+    return dx * dx + dy * dy < COLLISION_THRESHOLD_SQUARED
+
+
+def find_closest_subway(
+    subways: Sequence[MapLocation], destination: MapLocation
+) -> MapLocation | None:
+    """Find the subway station closest to the given destination by scanning them all."""
+    min_distance = float("inf")
+    closest_subway = None
+
+    for subway in subways:
+        distance = distance_between(subway.center_x, subway.center_y, destination)
+        if distance < min_distance:
+            min_distance = distance
+            closest_subway = subway
+
+    return closest_subway
+
+
+def new_seed() -> int:
+    """Pick a fresh seed for a game's order generator."""
+    return secrets.randbits(63)
+
+
+class GameSimulation:
+    """One game of pizza delivery, stepped without any rendering."""
+
+    def __init__(
+        self,
+        game_map: GameMap | None = None,
+        seed: int | None = None,
+        duration: float = GAME_DURATION,
+    ):
+        """
+        Initialize a game.
+
+        Args:
+            game_map: Locations to play on, the Manhattan map by default
+            seed: Seed for order generation, a fresh random one by default
+            duration: Game length in seconds
+        """
+        self.game_map = game_map or default_game_map()
+        self.duration = duration
+        self.duration_ticks = round(duration * SIMULATION_TICK_RATE)
+        self.reset(seed)
+
+    def reset(self, seed: int | None = None):
+        """Reset the player, score, order and timer for a new game."""
+        self.seed = new_seed() if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.player = PlayerState(self.game_map.grid.bounds)
+        self.score_tracker = ScoreTracker()
+        self.current_order: Order | None = None
+        self.tick_count = 0
+        # Every input applied this game, for recording a trace
+        self.inputs: list[InputEvent] = []
+
+    @property
+    def game_timer(self) -> float:
+        """Seconds of game time played."""
+        return self.tick_count / SIMULATION_TICK_RATE
+
+    @property
+    def remaining_time(self) -> float:
+        """Seconds left in the game."""
+        return max(0, self.duration_ticks - self.tick_count) / SIMULATION_TICK_RATE
+
+    @property
+    def is_over(self) -> bool:
+        """Check if the game time is up."""
+        return self.tick_count >= self.duration_ticks
+
+    def start(self):
+        """Start the clock and hand out the first order."""
+        self.tick_count = 0
+        self.generate_new_order()
+
+    def generate_new_order(self) -> Order:
+        """Generate a new order and make it the current order."""
+        self.current_order = Order.from_order_table(self.game_map, self.rng)
+        return self.current_order
+
+    def move_direction(self, direction: str):
+        """Start moving the player up, down, left or right."""
+        self.player.move_direction(direction)
+
+    def stop_movement(self):
+        """Stop moving the player."""
+        self.player.stop_movement()
+
+    def get_player_speed_multiplier(self) -> float:
+        """Get the speed multiplier of the speed zone the player overlaps, if any."""
+        x = self.player.center_x
+        y = self.player.center_y
+        zone = self.game_map.spatial_index("speed_zones").first_overlapping(
+            x, y, PLAYER_HALF_SIZE
+        )
+
+        # Default multiplier if not in any speed multiplier location
+        return 1.0 if zone is None else zone.speed_multiplier
+
+    def step(self):
+        """Advance the game by one fixed tick."""
+        self.player.speed = DEFAULT_PLAYER_SPEED * self.get_player_speed_multiplier()
+        self.player.update(FIXED_TIMESTEP)
+        self.tick_count += 1
+
+    def run_until(self, tick: int):
+        """Step up to a tick, skipping straight over ticks where the player stands still."""
+        tick = min(tick, self.duration_ticks)
+        while self.tick_count < tick:
+            # Without a direction the velocity is zero, so stepping changes nothing
+            if self.player.direction is None:
+                self.tick_count = tick
+            else:
+                self.step()
+
+    def apply_input(self, action: PlayerInput) -> SpaceActionResult | None:
+        """Apply a player input; SPACE returns what it did."""
+        self.inputs.append(InputEvent(self.tick_count, action))
+        if action is PlayerInput.SPACE:
+            return self.handle_space_action()
+        if action is PlayerInput.STOP:
+            self.stop_movement()
+        else:
+            self.move_direction(INPUT_DIRECTIONS[action])
+        return None
+
+    def get_current_destination_location(self, is_pickup: bool = True) -> MapLocation:
+        """Get the current pickup or delivery location."""
+        return (
+            self.current_order.pickup_location
+            if is_pickup
+            else self.current_order.delivery_location
+        )
+
+    def handle_space_action(self) -> SpaceActionResult:
+        """Pick up or deliver the pizza, or take the subway, depending on position."""
+        player = self.player
+        if self.current_order is None:
+            return SpaceActionResult(SpaceAction.NONE)
+
+        # Only the current order's pickup or delivery location counts
+        location = self.get_current_destination_location(is_pickup=not player.has_pizza)
+        if within_reach(player.center_x, player.center_y, location):
+            if not player.has_pizza:
+                player.has_pizza = True
+                return SpaceActionResult(SpaceAction.PICKUP, location)
+
+            player.has_pizza = False
+            self.score_tracker.earn_money(DELIVERY_REWARD)
+            # Complete the current order and immediately generate a new one
+            self.generate_new_order()
+            return SpaceActionResult(SpaceAction.DELIVERY, location)
+
+        # Check for subway interaction at last
+        subways = self.game_map.spatial_index("subways")
+        if subways.within_radius(player.center_x, player.center_y):
+            closest_subway = self.handle_subway_teleportation()
+            return SpaceActionResult(SpaceAction.SUBWAY, closest_subway)
+
+        return SpaceActionResult(SpaceAction.NONE)
+
+    def find_closest_subway_to_destination(
+        self, destination: MapLocation
+    ) -> MapLocation | None:
+        """Find the subway station closest to the given destination."""
+        return self.game_map.nearest_subways.for_location(destination)
+
+    def handle_subway_teleportation(self) -> MapLocation | None:
+        """Teleport to the subway closest to the destination, for $1."""
+        if self.current_order is None:
+            return None
+        destination = self.get_current_destination_location(
+            is_pickup=not self.player.has_pizza
+        )
+        closest_subway = self.find_closest_subway_to_destination(destination)
+        if closest_subway is None:
+            return None
+
+        self.player.center_x = closest_subway.center_x
+        self.player.center_y = closest_subway.center_y
+
+        # Deduct $1 for subway usage
+        self.score_tracker.use_subway()
+        return closest_subway
+
+
+def replay_inputs(
+    seed: int,
+    inputs: Iterable[InputEvent],
+    game_map: GameMap | None = None,
+    duration: float = GAME_DURATION,
+) -> GameSimulation:
+    """
+    Play a whole game from its seed and recorded inputs.
+
+    Args:
+        seed: Seed the game was played with
+        inputs: Inputs in tick order
+        game_map: Map the game was played on, the Manhattan map by default
+        duration: Game length in seconds
+
+    Returns:
+        GameSimulation: The finished game
+    """
+    simulation = GameSimulation(game_map, seed, duration)
+    simulation.start()
+    for tick, action in inputs:
+        if tick >= simulation.duration_ticks:
+            break
+        simulation.run_until(tick)
+        simulation.apply_input(action)
+    simulation.run_until(simulation.duration_ticks)
+    return simulation
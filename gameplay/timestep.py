@@ -0,0 +1,50 @@
+"""NYC Pizza Delivery Game - Fixed Timestep Module.
+
+Turns the variable frame times arcade reports into a whole number of fixed
+simulation ticks, and how far the current frame is into the next tick, so the
+game plays the same at any frame rate and still renders smoothly.
+"""
+
+from constants import MAX_TICKS_PER_FRAME
+from gameplay.simulation import FIXED_TIMESTEP
+
+
+class FixedTimestep:
+    """Accumulates frame time and hands it out as fixed ticks."""
+
+    def __init__(
+        self,
+        timestep: float = FIXED_TIMESTEP,
+        max_ticks_per_frame: int = MAX_TICKS_PER_FRAME,
+    ):
+        """
+        Initialize the accumulator.
+
+        Args:
+            timestep: Seconds per simulation tick
+            max_ticks_per_frame: Most ticks to run for one frame; time beyond
+                that is dropped so a long stall doesn't snowball
+        """
+        self.timestep = timestep
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+
+    def reset(self):
+        """Forget any partial tick, e.g. when a game starts or resumes."""
+        self.accumulator = 0.0
+
+    def advance(self, frame_time: float) -> int:
+        """Add a frame's time and return how many ticks to run now."""
+        self.accumulator += frame_time
+        ticks = int(self.accumulator // self.timestep)
+        if ticks > self.max_ticks_per_frame:
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.timestep
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of the next tick already elapsed, for interpolated drawing."""
+        return min(self.accumulator / self.timestep, 1.0)
@@ -1,14 +1,30 @@
-from .base_models import Address, Location
-from .homes import HOMES
-from .pizza_shops import PIZZA_SHOPS
-from .speed_multiplier_locations import SPEED_MULTIPLIER_LOCATIONS
-from .subways import SUBWAYS
+from importlib import import_module
+
+from .address import Address, MapGrid
+from .game_map import GameMap, MapLocation, default_game_map
+from .layout import MapLayout, default_layout
 
 __all__ = [
     "Address",
+    "GameMap",
+    "MapGrid",
+    "MapLayout",
+    "MapLocation",
     "Location",
-    "HOMES",
-    "PIZZA_SHOPS",
-    "SPEED_MULTIPLIER_LOCATIONS",
-    "SUBWAYS",
+    "MapSprites",
+    "default_game_map",
+    "default_layout",
 ]
+
+# Sprite-backed names are imported on first access, so headless code can use
+# the address data in this package without importing arcade.
+_LAZY_ATTRIBUTES = {
+    "Location": ".base_models",
+    "MapSprites": ".sprites",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
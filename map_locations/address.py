@@ -0,0 +1,76 @@
+"""Avenue/street addresses and their position on the map.
+
+Kept free of arcade so game logic can run without a display.
+"""
+
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from constants import (
+    AVENUE_WIDTH,
+    AVENUES,
+    DEFAULT_AVENUES_SPREAD,
+    DEFAULT_STREETS_SPREAD,
+    MAP_HEIGHT,
+    MAP_OFFSET_X,
+    MAP_OFFSET_Y,
+    MAP_WIDTH,
+    STREET_HEIGHT,
+    STREETS,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Address:
+    """Address of a location.
+
+    Slotted and immutable: a generated map can hold 100k of them, and
+    locations sharing an address can't drift apart.
+    """
+
+    avenue_number: int
+    street_number: int
+    name: str | None = None
+    avenues_spread: int = DEFAULT_AVENUES_SPREAD
+    streets_spread: int = DEFAULT_STREETS_SPREAD
+
+
+def address_bounds(address: Address) -> tuple[float, float, float, float]:
+    """Convert avenue/street numbers to map coordinates.
+
+    Returns:
+        tuple: (left, right, bottom, top) of the block covered by the address.
+    """
+    right = MAP_OFFSET_X + (AVENUES + 1 - address.avenue_number) * AVENUE_WIDTH
+    left = right - address.avenues_spread * AVENUE_WIDTH
+    bottom = MAP_OFFSET_Y + (address.street_number // 5 - 1) * STREET_HEIGHT
+    top = bottom + (address.streets_spread // 5) * STREET_HEIGHT
+    return left, right, bottom, top
+
+
+class MapGrid(NamedTuple):
+    """Number of avenue and street blocks a map covers.
+
+    Avenues are numbered from 1st Avenue on the east edge, so maps bigger
+    than the default Manhattan grid extend west, and north for more
+    streets; an address is at the same position on every map.
+    """
+
+    avenues: int = AVENUES
+    streets: int = STREETS
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Get (left, right, bottom, top) of the map area."""
+        return (
+            MAP_OFFSET_X - (self.avenues - AVENUES) * AVENUE_WIDTH,
+            MAP_OFFSET_X + MAP_WIDTH,
+            MAP_OFFSET_Y,
+            MAP_OFFSET_Y + MAP_HEIGHT + (self.streets - STREETS) * STREET_HEIGHT,
+        )
+
+    @property
+    def origin(self) -> tuple[float, float]:
+        """Get the (x, y) where the westmost avenue and first street lines meet."""
+        left, _, bottom, _ = self.bounds
+        return left, bottom
@@ -1,42 +1,24 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 
 import arcade
 
-from constants import (
-    AVENUE_WIDTH,
-    AVENUES,
-    DEFAULT_AVENUES_SPREAD,
-    DEFAULT_STREETS_SPREAD,
-    MAP_OFFSET_X,
-    MAP_OFFSET_Y,
-    STREET_HEIGHT,
-)
-
-
-@dataclass
-class Address:
-    """Address of a location."""
-
-    avenue_number: int
-    street_number: int
-    name: str | None = None
-    avenues_spread: int = DEFAULT_AVENUES_SPREAD
-    streets_spread: int = DEFAULT_STREETS_SPREAD
+from map_locations.address import Address, address_bounds
+from map_locations.textures import load_texture
 
 
 class Location(arcade.Sprite, ABC):
     """Base class for all locations in the game."""
 
-    def __init__(self, address: Address):
+    def __init__(self, address: Address, texture: arcade.Texture | None = None):
         """
         Initialize a location.
 
         Args:
             address: Address of the location
+            texture: Texture the sprite is drawn with in a SpriteList
         """
         # Initialize arcade.Sprite first
-        super().__init__()
+        super().__init__(texture)
 
         self.address = address
 
@@ -68,16 +50,7 @@ class Location(arcade.Sprite, ABC):
             arcade.Rect: Rectangle object to be rendered by arcade.
         """
         if self._arcade_rect is None:
-            right = (
-                MAP_OFFSET_X + (AVENUES + 1 - self.address.avenue_number) * AVENUE_WIDTH
-            )
-            left = right - (self.address.avenues_spread) * AVENUE_WIDTH
-            bottom = (
-                MAP_OFFSET_Y + (self.address.street_number // 5 - 1) * STREET_HEIGHT
-            )
-            top = bottom + (self.address.streets_spread // 5) * STREET_HEIGHT
-
-            self._arcade_rect = arcade.LRBT(left, right, bottom, top)
+            self._arcade_rect = arcade.LRBT(*address_bounds(self.address))
 
         return self._arcade_rect
 
@@ -94,7 +67,7 @@ class PizzaShop(Location):
     """
 
     def __init__(self, address: Address, logo_texture: arcade.Texture):
-        super().__init__(address=address)
+        super().__init__(address=address, texture=logo_texture)
         self.logo_texture = logo_texture
 
     def draw(self):
@@ -109,9 +82,9 @@ class Subway(Location):
     """
 
     def __init__(self, address: Address):
-        super().__init__(address=address)
-        # Load the subway image texture
-        self.subway_texture = arcade.load_texture("images/subway.png")
+        # Shared with every other subway
+        self.subway_texture = load_texture("images/subway.png")
+        super().__init__(address=address, texture=self.subway_texture)
 
     def draw(self):
         """Draw the subway using the subway.png image."""
@@ -126,8 +99,8 @@ class Home(Location):
     """
 
     def __init__(self, address: Address):
-        super().__init__(address=address)
-        self.home_texture = arcade.load_texture("images/home.png")
+        self.home_texture = load_texture("images/home.png")
+        super().__init__(address=address, texture=self.home_texture)
 
     def draw(self):
         """Draw the home using the home texture."""
@@ -146,21 +119,31 @@ class SpeedMultiplierLocation(Location):
         super().__init__(address=address)
         self.speed_multiplier = speed_multiplier
         self.block_color = block_color
+        # Filled block for drawing in a SpriteList; this sprite has no texture
+        self.block = arcade.SpriteSolidColor.from_rect(self.arcade_rect, block_color)
+        self._label: arcade.Text | None = None
 
     @property
     def player_speed_multiplier(self):
         return self.speed_multiplier
 
+    @property
+    def label(self) -> arcade.Text:
+        """Get the zone's name label, laid out on first use."""
+        if self._label is None:
+            self._label = arcade.Text(
+                self.name,
+                self.arcade_rect.center_x,
+                self.arcade_rect.center_y,
+                arcade.color.BLACK,
+                12,
+                align="center",
+                anchor_y="center",
+                anchor_x="center",
+                rotation=270 if self.arcade_rect.height > self.arcade_rect.width else 0,
+            )
+        return self._label
+
     def draw(self):
         arcade.draw_rect_filled(self.arcade_rect, self.block_color)
-        arcade.draw_text(
-            self.address.name or self.avenue_street_address,
-            self.arcade_rect.center_x,
-            self.arcade_rect.center_y,
-            arcade.color.BLACK,
-            12,
-            align="center",
-            anchor_y="center",
-            anchor_x="center",
-            rotation=270 if self.arcade_rect.height > self.arcade_rect.width else 0,
-        )
+        self.label.draw()
@@ -0,0 +1,206 @@
+"""Arcade-free map model used by the game logic.
+
+Locations are plain records with precomputed bounds, so collision and
+distance checks never touch sprites or textures.
+"""
+
+import functools
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from constants import ORDER_MAX_TRAVEL_TIME
+from map_locations.address import Address, MapGrid, address_bounds
+from map_locations.layout import MapLayout, default_layout
+from map_locations.nearest_subway import NearestSubwayTable
+from map_locations.order_table import OrderTable
+from map_locations.routing import RoutingGraph
+from map_locations.spatial_index import SpatialIndex
+
+
+@dataclass(slots=True, eq=False)
+class MapLocation:
+    """A location on the map with its precomputed bounds."""
+
+    address: Address
+    left: float
+    right: float
+    bottom: float
+    top: float
+    center_x: float
+    center_y: float
+    speed_multiplier: float = 1.0
+
+    @classmethod
+    def from_address(
+        cls, address: Address, speed_multiplier: float = 1.0
+    ) -> "MapLocation":
+        left, right, bottom, top = address_bounds(address)
+        return cls(
+            address=address,
+            left=left,
+            right=right,
+            bottom=bottom,
+            top=top,
+            center_x=(left + right) / 2,
+            center_y=(bottom + top) / 2,
+            speed_multiplier=speed_multiplier,
+        )
+
+    @property
+    def avenue_street_address(self) -> str:
+        """Get the avenue/street address of the location."""
+        return f"{self.address.avenue_number}Av, {self.address.street_number}St"
+
+    @property
+    def name(self) -> str:
+        """Get the name of the location."""
+        return self.address.name or self.avenue_street_address
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Get (left, right, bottom, top) of the location."""
+        return self.left, self.right, self.bottom, self.top
+
+
+@dataclass
+class GameMap:
+    """All locations the game logic interacts with."""
+
+    pizza_shops: list[MapLocation] = field(default_factory=list)
+    homes: list[MapLocation] = field(default_factory=list)
+    subways: list[MapLocation] = field(default_factory=list)
+    speed_zones: list[MapLocation] = field(default_factory=list)
+    # Size of the avenue/street grid the player moves and routes over
+    grid: MapGrid = MapGrid()
+    # Bumped on every change so tables derived from the map get rebuilt
+    version: int = field(default=0, init=False, compare=False)
+    _spatial_indexes: dict[str, SpatialIndex] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _nearest_subways: NearestSubwayTable | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _routing: RoutingGraph | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _order_table: OrderTable | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Layout the map was built from, until a location is added or removed
+    _layout: MapLayout | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _layout_digest: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def add_location(self, kind: str, location: MapLocation):
+        """Add a location to one of the location lists, e.g. "subways"."""
+        getattr(self, kind).append(location)
+        self.invalidate()
+
+    def remove_location(self, kind: str, location: MapLocation):
+        """Remove a location from one of the location lists."""
+        getattr(self, kind).remove(location)
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop derived lookup tables; call after editing the location lists directly."""
+        self.version += 1
+        self._spatial_indexes.clear()
+        self._nearest_subways = None
+        self._routing = None
+        self._order_table = None
+        self._layout = None
+        self._layout_digest = ""
+
+    def spatial_index(self, kind: str) -> SpatialIndex:
+        """
+        Get the grid index over one kind of location, built on first use.
+
+        Args:
+            kind: Name of the location list, e.g. "subways" or "speed_zones"
+        """
+        index = self._spatial_indexes.get(kind)
+        if index is None:
+            index = self._spatial_indexes[kind] = SpatialIndex(getattr(self, kind))
+        return index
+
+    @property
+    def nearest_subways(self) -> NearestSubwayTable:
+        """Get the nearest-subway table for every pickup and delivery location."""
+        if self._nearest_subways is None:
+            self._nearest_subways = NearestSubwayTable(
+                self.spatial_index("subways"), self.pizza_shops + self.homes
+            )
+        return self._nearest_subways
+
+    @property
+    def routing(self) -> RoutingGraph:
+        """Get the travel-time graph over the avenue/street grid, built on first use."""
+        if self._routing is None:
+            self._routing = RoutingGraph(self)
+        return self._routing
+
+    @property
+    def layout_digest(self) -> str:
+        """Digest of the layout the map was built from, or "" once it's been edited."""
+        if self._layout_digest is None:
+            self._layout_digest = "" if self._layout is None else self._layout.digest
+        return self._layout_digest
+
+    @property
+    def order_table(self) -> OrderTable:
+        """Get the difficulty-weighted pairs orders are drawn from, built on first use."""
+        if self._order_table is None:
+            # Pairing every shop and home grows with the square of the map, so
+            # bigger maps only pair nearby ones; maps up to the default size
+            # keep every pair, as the traces they recorded were played with
+            default = MapGrid()
+            if (
+                self.grid.avenues * self.grid.streets
+                <= default.avenues * default.streets
+            ):
+                self._order_table = OrderTable(self)
+            else:
+                self._order_table = OrderTable(
+                    self, max_travel_time=ORDER_MAX_TRAVEL_TIME
+                )
+        return self._order_table
+
+    @classmethod
+    def from_layout(cls, layout: MapLayout) -> "GameMap":
+        """Build a map from layout data."""
+        game_map = cls(
+            pizza_shops=[
+                MapLocation.from_address(spec.address) for spec in layout.pizza_shops
+            ],
+            homes=[MapLocation.from_address(address) for address in layout.homes],
+            subways=[MapLocation.from_address(address) for address in layout.subways],
+            speed_zones=[
+                MapLocation.from_address(spec.address, spec.speed_multiplier)
+                for spec in layout.speed_zones
+            ],
+            grid=layout.grid,
+        )
+        game_map._layout = layout
+        return game_map
+
+    @classmethod
+    def load(cls, path: str | Path) -> "GameMap":
+        """Build a map from a map file."""
+        return cls.from_layout(MapLayout.load(path))
+
+    @classmethod
+    def default(cls) -> "GameMap":
+        """Build the Manhattan map from the default map file."""
+        return cls.from_layout(default_layout())
+
+
+@functools.cache
+def default_game_map() -> GameMap:
+    """Get the Manhattan map, built once per process with its lookup tables.
+
+    The map is shared, so edit a GameMap.default() of your own instead.
+    """
+    return GameMap.default()
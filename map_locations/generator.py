@@ -0,0 +1,222 @@
+"""Procedurally generated cities for scale and stress testing.
+
+generate_city() lays out homes, pizza shops, subways and speed zones on an
+avenue/street grid of any size and returns a MapLayout, the same data the
+game loads from a map file. The same config and seed always give the same
+city, so benchmarks can sweep map sizes reproducibly.
+
+Cities follow the Manhattan map: subway lines run up every few avenues
+with a station every few blocks, parks speed the player up and crowded
+squares slow them down, and homes and shops each take a block of their own.
+Densities are per block; the defaults match the Manhattan map.
+
+Usage: python -m map_locations.generator [--avenues N] [--streets N]
+           [--homes-per-block D] [--seed S] [-o maps/<name>.json]
+"""
+
+import argparse
+import random
+from dataclasses import dataclass
+
+from constants import AVENUES, STREETS
+from map_locations.address import Address, MapGrid
+from map_locations.layout import MapLayout, PizzaShopSpec, SpeedZoneSpec
+
+# Name and logo of each pizza shop chain
+SHOP_CHAINS = [
+    ("Joe's", "images/pizza_shops/joes.png"),
+    ("Papa J's", "images/pizza_shops/papajs.png"),
+    ("2Bro's", "images/pizza_shops/2bros.png"),
+]
+PARK_SPEED_MULTIPLIER = 2.0
+PARK_COLOR = (34, 139, 34)
+SQUARE_SPEED_MULTIPLIER = 0.25
+SQUARE_COLOR = (255, 192, 203)
+
+
+@dataclass(frozen=True)
+class CityConfig:
+    """Size and density of a generated city."""
+
+    avenues: int = AVENUES
+    streets: int = STREETS
+    # Locations per avenue/street block
+    homes_per_block: float = 0.2
+    shops_per_block: float = 0.02
+    parks_per_block: float = 0.004
+    squares_per_block: float = 0.004
+    # Avenues between subway lines, and street blocks between their stations
+    subway_line_spacing: int = 4
+    subway_station_spacing: int = 7
+
+    @property
+    def grid(self) -> MapGrid:
+        """Get the grid the city is laid out on."""
+        return MapGrid(self.avenues, self.streets)
+
+    @classmethod
+    def for_locations(cls, locations: int, **overrides) -> "CityConfig":
+        """
+        Get a config with about this many homes and shops, at the default density.
+
+        The grid keeps the Manhattan map's shape, about twice as many street
+        blocks as avenues.
+        """
+        config = cls(**overrides)
+        per_block = config.homes_per_block + config.shops_per_block
+        blocks = locations / per_block
+        avenues = max(1, round((blocks * config.avenues / config.streets) ** 0.5))
+        streets = max(1, round(blocks / avenues))
+        return cls(**{**overrides, "avenues": avenues, "streets": streets})
+
+
+def _block_address(block: int, avenues: int, name: str | None = None) -> Address:
+    """Get the address of a block, numbered west to east from 1st Avenue, then north."""
+    row, column = divmod(block, avenues)
+    return Address(column + 1, (row + 1) * 5, name)
+
+
+def _subway_blocks(config: CityConfig) -> list[int]:
+    """Blocks of the subway stations: lines up every few avenues, from 1st Avenue."""
+    blocks = []
+    for line, column in enumerate(range(0, config.avenues, config.subway_line_spacing)):
+        # Stagger the stations of neighbouring lines
+        first_row = (line * config.subway_station_spacing // 2) % max(
+            config.subway_station_spacing, 1
+        )
+        for row in range(first_row, config.streets, config.subway_station_spacing):
+            blocks.append(row * config.avenues + column)
+    return blocks
+
+
+def _speed_zones(
+    config: CityConfig, rng: random.Random, count: int, kind: str
+) -> list[SpeedZoneSpec]:
+    """Place parks (wide and long) or squares (small), anywhere on the grid."""
+    if kind == "park":
+        max_avenues, max_rows = 3, 10
+        multiplier, color = PARK_SPEED_MULTIPLIER, PARK_COLOR
+    else:
+        max_avenues, max_rows = 2, 3
+        multiplier, color = SQUARE_SPEED_MULTIPLIER, SQUARE_COLOR
+    zones = []
+    for i in range(count):
+        avenues_spread = rng.randint(1, min(max_avenues, config.avenues))
+        rows = rng.randint(1, min(max_rows, config.streets))
+        # A zone covers its avenue and the ones west of it, and its street up
+        avenue = rng.randint(1, config.avenues - avenues_spread + 1)
+        row = rng.randrange(config.streets - rows + 1)
+        address = Address(
+            avenue,
+            (row + 1) * 5,
+            f"{kind.title()} {i + 1}",
+            avenues_spread,
+            rows * 5,
+        )
+        zones.append(SpeedZoneSpec(address, multiplier, color))
+    return zones
+
+
+def generate_city(config: CityConfig = CityConfig(), seed: int = 0) -> MapLayout:
+    """
+    Generate a city.
+
+    Every city gets at least one home and one pizza shop, so it always has
+    an order to play, however small or sparse it is.
+
+    Args:
+        config: Size and density of the city
+        seed: Seed for every random choice; the same seed gives the same city
+
+    Returns:
+        MapLayout: The city, ready to save as a map file or play on
+
+    Raises:
+        ValueError: If the grid is empty or too small for every location
+    """
+    if config.avenues < 1 or config.streets < 1:
+        raise ValueError(f"City must be at least one block each way, not {config}")
+    rng = random.Random(seed)
+    blocks = config.avenues * config.streets
+    subway_blocks = _subway_blocks(config)
+    n_homes = max(1, round(blocks * config.homes_per_block))
+    n_shops = max(1, round(blocks * config.shops_per_block))
+    if len(subway_blocks) + n_homes + n_shops > blocks:
+        raise ValueError(
+            f"{n_homes} homes, {n_shops} shops and {len(subway_blocks)} subways "
+            f"don't fit in {blocks} blocks"
+        )
+
+    # Homes and shops each get a block no subway is on
+    taken = set(subway_blocks)
+    free_blocks = (
+        block
+        for block in rng.sample(range(blocks), n_homes + n_shops + len(taken))
+        if block not in taken
+    )
+    shop_blocks = [next(free_blocks) for _ in range(n_shops)]
+    home_blocks = [next(free_blocks) for _ in range(n_homes)]
+
+    pizza_shops = []
+    for block in shop_blocks:
+        name, logo = rng.choice(SHOP_CHAINS)
+        pizza_shops.append(
+            PizzaShopSpec(_block_address(block, config.avenues, name), logo)
+        )
+    return MapLayout(
+        homes=[_block_address(block, config.avenues) for block in home_blocks],
+        pizza_shops=pizza_shops,
+        speed_zones=[
+            *_speed_zones(config, rng, round(blocks * config.parks_per_block), "park"),
+            *_speed_zones(
+                config, rng, round(blocks * config.squares_per_block), "square"
+            ),
+        ],
+        subways=[_block_address(block, config.avenues) for block in subway_blocks],
+        grid=config.grid,
+    )
+
+
+def main():
+    default = CityConfig()
+    parser = argparse.ArgumentParser(description="Generate a city map file.")
+    parser.add_argument("--avenues", type=int, default=default.avenues)
+    parser.add_argument("--streets", type=int, default=default.streets)
+    parser.add_argument(
+        "--locations",
+        type=int,
+        default=None,
+        help="size the grid for about this many homes and shops",
+    )
+    parser.add_argument(
+        "--homes-per-block", type=float, default=default.homes_per_block
+    )
+    parser.add_argument(
+        "--shops-per-block", type=float, default=default.shops_per_block
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="map file to write, stdout by default")
+    args = parser.parse_args()
+
+    densities = {
+        "homes_per_block": args.homes_per_block,
+        "shops_per_block": args.shops_per_block,
+    }
+    if args.locations is not None:
+        config = CityConfig.for_locations(args.locations, **densities)
+    else:
+        config = CityConfig(args.avenues, args.streets, **densities)
+    layout = generate_city(config, args.seed)
+    if args.output is None:
+        print(layout.to_json(), end="")
+        return
+    layout.save(args.output)
+    print(
+        f"{args.output}: {config.avenues} x {config.streets} blocks, "
+        f"{len(layout.homes)} homes, {len(layout.pizza_shops)} shops, "
+        f"{len(layout.subways)} subways, {len(layout.speed_zones)} speed zones"
+    )
+
+
+if __name__ == "__main__":
+    main()
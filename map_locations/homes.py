@@ -1,74 +0,0 @@
-from map_locations.base_models import Address, Home
-
-__all__ = ["HOMES"]
-
-
-# Add homes to the list here
-HOMES = [
-    # 1st avenue
-    Home(Address(1, 6)),
-    Home(Address(1, 60)),
-    Home(Address(1, 125)),
-    # 2nd avenue
-    Home(Address(2, 30)),
-    Home(Address(2, 71)),
-    Home(Address(2, 95)),
-    # 3rd avenue
-    Home(Address(3, 15)),
-    Home(Address(3, 26)),
-    Home(Address(3, 34)),
-    Home(Address(3, 42)),
-    Home(Address(3, 71)),
-    Home(Address(3, 98)),
-    Home(Address(3, 125)),
-    # 4th avenue
-    Home(Address(4, 25)),
-    Home(Address(4, 35)),
-    Home(Address(4, 34)),
-    Home(Address(4, 42)),
-    Home(Address(4, 71)),
-    Home(Address(4, 98)),
-    Home(Address(4, 125)),
-    # 5th avenue
-    Home(Address(5, 125)),
-    Home(Address(5, 57)),
-    Home(Address(5, 47)),
-    # 7th avenue
-    Home(Address(7, 125)),
-    Home(Address(7, 57)),
-    Home(Address(7, 47)),
-    # 8th avenue
-    Home(Address(8, 8)),
-    Home(Address(8, 88)),
-    Home(Address(8, 71)),
-    Home(Address(8, 125)),
-    # 10th avenue
-    Home(Address(10, 45)),
-    Home(Address(10, 18)),
-    Home(Address(10, 65)),
-    Home(Address(10, 57)),
-    Home(Address(10, 47)),
-    Home(Address(10, 37)),
-    Home(Address(10, 27)),
-    Home(Address(10, 17)),
-    Home(Address(10, 7)),
-    Home(Address(10, 125)),
-    Home(Address(10, 120)),
-    Home(Address(10, 106)),
-    Home(Address(10, 102)),
-    Home(Address(10, 57)),
-    Home(Address(10, 47)),
-    Home(Address(10, 37)),
-    # 11th avenue
-    Home(Address(11, 125)),
-    Home(Address(11, 115)),
-    Home(Address(11, 105)),
-    Home(Address(11, 95)),
-    Home(Address(11, 70)),
-    Home(Address(11, 65)),
-    Home(Address(11, 60)),
-    Home(Address(11, 55)),
-    Home(Address(11, 50)),
-    Home(Address(11, 45)),
-    Home(Address(11, 40)),
-]
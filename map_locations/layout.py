@@ -0,0 +1,239 @@
+"""Map layouts stored as JSON data files.
+
+A layout is the plain address data for every location on a map. Loading one
+reads no images, so game logic and tools can use it without a display; this
+module must not import arcade. Sprites are built from a layout only when a
+window draws the map (map_locations/sprites.py).
+
+File format (version 1)::
+
+    {
+      "version": 1,
+      "avenues": 11, "streets": 25,
+      "homes": [ADDRESS, ...],
+      "subways": [ADDRESS, ...],
+      "pizza_shops": [{"address": ADDRESS, "logo": "images/..."}, ...],
+      "speed_zones": [
+        {"address": ADDRESS, "speed_multiplier": 2, "block_color": [r, g, b]}, ...
+      ]
+    }
+
+where ADDRESS is [avenue, street], or an object with "avenue", "street" and
+optional "name", "avenues_spread" and "streets_spread". "avenues" and
+"streets" give the size of the grid in blocks; they're left out for the
+default Manhattan grid.
+"""
+
+import functools
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from constants import (
+    DEFAULT_AVENUES_SPREAD,
+    DEFAULT_MAP_PATH,
+    DEFAULT_STREETS_SPREAD,
+    MAP_DIRECTORY,
+)
+from map_locations.address import Address, MapGrid
+
+__all__ = [
+    "MAP_FORMAT_VERSION",
+    "MapLayout",
+    "MapLayoutError",
+    "PizzaShopSpec",
+    "SpeedZoneSpec",
+    "default_layout",
+    "map_files_by_digest",
+]
+
+MAP_FORMAT_VERSION = 1
+MAP_DIGEST_LENGTH = 16
+
+
+class MapLayoutError(ValueError):
+    """Raised when a map file isn't a valid layout."""
+
+
+class PizzaShopSpec(NamedTuple):
+    """Pizza shop address and logo image."""
+
+    address: Address
+    logo_path: str
+
+
+class SpeedZoneSpec(NamedTuple):
+    """Speed multiplier zone address, multiplier and block colour."""
+
+    address: Address
+    speed_multiplier: float
+    block_color: tuple[int, int, int]
+
+
+def _encode_address(address: Address) -> list | dict:
+    """Write an address as [avenue, street] unless it has a name or spread."""
+    if (
+        address.name is None
+        and address.avenues_spread == DEFAULT_AVENUES_SPREAD
+        and address.streets_spread == DEFAULT_STREETS_SPREAD
+    ):
+        return [address.avenue_number, address.street_number]
+    data: dict[str, Any] = {
+        "avenue": address.avenue_number,
+        "street": address.street_number,
+    }
+    if address.name is not None:
+        data["name"] = address.name
+    if address.avenues_spread != DEFAULT_AVENUES_SPREAD:
+        data["avenues_spread"] = address.avenues_spread
+    if address.streets_spread != DEFAULT_STREETS_SPREAD:
+        data["streets_spread"] = address.streets_spread
+    return data
+
+
+def _decode_address(data: list | dict) -> Address:
+    if isinstance(data, list):
+        avenue, street = data
+        return Address(int(avenue), int(street))
+    return Address(
+        int(data["avenue"]),
+        int(data["street"]),
+        data.get("name"),
+        int(data.get("avenues_spread", DEFAULT_AVENUES_SPREAD)),
+        int(data.get("streets_spread", DEFAULT_STREETS_SPREAD)),
+    )
+
+
+def _decode_grid(data: dict) -> MapGrid:
+    default = MapGrid()
+    grid = MapGrid(
+        int(data.get("avenues", default.avenues)),
+        int(data.get("streets", default.streets)),
+    )
+    if grid.avenues < 1 or grid.streets < 1:
+        raise ValueError(f"Grid must have at least one block each way, not {grid}")
+    return grid
+
+
+@dataclass
+class MapLayout:
+    """Addresses of every location on a map."""
+
+    homes: list[Address] = field(default_factory=list)
+    pizza_shops: list[PizzaShopSpec] = field(default_factory=list)
+    speed_zones: list[SpeedZoneSpec] = field(default_factory=list)
+    subways: list[Address] = field(default_factory=list)
+    grid: MapGrid = MapGrid()
+
+    def to_dict(self) -> dict:
+        """Convert the layout to the JSON file structure."""
+        grid = {} if self.grid == MapGrid() else self.grid._asdict()
+        return {
+            "version": MAP_FORMAT_VERSION,
+            **grid,
+            "homes": [_encode_address(address) for address in self.homes],
+            "subways": [_encode_address(address) for address in self.subways],
+            "pizza_shops": [
+                {"address": _encode_address(spec.address), "logo": spec.logo_path}
+                for spec in self.pizza_shops
+            ],
+            "speed_zones": [
+                {
+                    "address": _encode_address(spec.address),
+                    "speed_multiplier": spec.speed_multiplier,
+                    "block_color": list(spec.block_color),
+                }
+                for spec in self.speed_zones
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MapLayout":
+        """
+        Build a layout from the JSON file structure.
+
+        Raises:
+            MapLayoutError: If the data is another version or malformed
+        """
+        if not isinstance(data, dict):
+            raise MapLayoutError("Map data must be a JSON object")
+        version = data.get("version")
+        if version != MAP_FORMAT_VERSION:
+            raise MapLayoutError(f"Unsupported map format version {version}")
+        try:
+            return cls(
+                homes=[_decode_address(item) for item in data.get("homes", [])],
+                pizza_shops=[
+                    PizzaShopSpec(_decode_address(item["address"]), str(item["logo"]))
+                    for item in data.get("pizza_shops", [])
+                ],
+                speed_zones=[
+                    SpeedZoneSpec(
+                        _decode_address(item["address"]),
+                        float(item["speed_multiplier"]),
+                        tuple(int(channel) for channel in item["block_color"]),
+                    )
+                    for item in data.get("speed_zones", [])
+                ],
+                subways=[_decode_address(item) for item in data.get("subways", [])],
+                grid=_decode_grid(data),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise MapLayoutError(f"Malformed map data: {e!r}") from e
+
+    def to_json(self) -> str:
+        """Encode the layout, one location per line so map edits diff cleanly."""
+        data = self.to_dict()
+        lines = []
+        for key, items in data.items():
+            if not isinstance(items, list):
+                lines.append(f'  "{key}": {json.dumps(items)}')
+                continue
+            entries = ",\n".join(f"    {json.dumps(item)}" for item in items)
+            lines.append(f'  "{key}": [\n{entries}\n  ]' if items else f'  "{key}": []')
+        return "{\n" + ",\n".join(lines) + "\n}\n"
+
+    @property
+    def digest(self) -> str:
+        """Short fingerprint of the layout, the same wherever its file is saved."""
+        return hashlib.sha256(self.to_json().encode()).hexdigest()[:MAP_DIGEST_LENGTH]
+
+    @classmethod
+    def from_json(cls, text: str) -> "MapLayout":
+        """Decode a layout from JSON text."""
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise MapLayoutError(f"Map file is not valid JSON: {e}") from e
+        return cls.from_dict(data)
+
+    def save(self, path: str | Path):
+        """Write the layout to a map file."""
+        Path(path).write_text(self.to_json(), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "MapLayout":
+        """Read a layout from a map file."""
+        return cls.from_json(Path(path).read_text(encoding="utf-8"))
+
+
+@functools.cache
+def default_layout() -> MapLayout:
+    """Get the Manhattan layout, read from DEFAULT_MAP_PATH once per process.
+
+    The layout is shared, so copy it before editing.
+    """
+    return MapLayout.load(DEFAULT_MAP_PATH)
+
+
+def map_files_by_digest(directory: str | Path = MAP_DIRECTORY) -> dict[str, Path]:
+    """Index the map files in a directory by layout digest, skipping invalid ones."""
+    files = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        try:
+            files[MapLayout.load(path).digest] = path
+        except (MapLayoutError, OSError, UnicodeDecodeError):
+            continue
+    return files
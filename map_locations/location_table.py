@@ -0,0 +1,169 @@
+"""Every location of a map as parallel arrays.
+
+A generated city can have 100k locations. As Address records or sprites,
+each one is a Python object and costs hundreds of bytes to over a
+kilobyte. A LocationTable keeps one row per location instead, in NumPy
+arrays of avenue, street, spreads and kind, about 20 bytes a row. Bounds of
+every location are computed in one vectorized pass, so code that only
+needs geometry, like sorting locations into map chunks or finding the ones
+in view, never builds per-location objects. Sprites are made later, for the
+rows that end up on screen.
+
+Kept free of arcade so game logic can run without a display.
+"""
+
+import numpy as np
+
+from constants import AVENUE_WIDTH, AVENUES, MAP_OFFSET_X, MAP_OFFSET_Y, STREET_HEIGHT
+from map_locations.address import Address
+from map_locations.layout import MapLayout
+
+# Kind of each row, indexing KINDS; names match the GameMap location lists
+KINDS = ("homes", "pizza_shops", "subways", "speed_zones")
+
+
+def layout_addresses(layout: MapLayout, kind: str) -> list[Address]:
+    """Get the addresses of one kind of location in a layout, in order."""
+    if kind in ("pizza_shops", "speed_zones"):
+        return [spec.address for spec in getattr(layout, kind)]
+    return getattr(layout, kind)
+
+
+class LocationTable:
+    """Locations of a map, one row each, as parallel arrays."""
+
+    def __init__(
+        self,
+        kind: np.ndarray,
+        index: np.ndarray,
+        avenue: np.ndarray,
+        street: np.ndarray,
+        avenues_spread: np.ndarray,
+        streets_spread: np.ndarray,
+        names: dict[int, str] | None = None,
+    ):
+        """
+        Initialize a table from its columns, all the same length.
+
+        Args:
+            kind: Kind of each row, indexing KINDS
+            index: Position of each row among the locations of its kind
+            avenue, street: Address of each row
+            avenues_spread, streets_spread: Size of each row's block
+            names: Name of each named row; most locations have none
+        """
+        self.kind = kind
+        self.index = index
+        self.avenue = avenue
+        self.street = street
+        self.avenues_spread = avenues_spread
+        self.streets_spread = streets_spread
+        self.names = names or {}
+        self._rects: tuple[np.ndarray, ...] | None = None
+
+    @classmethod
+    def from_layout(cls, layout: MapLayout) -> "LocationTable":
+        """Build the table of every location in a layout, kind by kind."""
+        addresses: list[Address] = []
+        kinds = []
+        indexes = []
+        for code, kind in enumerate(KINDS):
+            of_kind = layout_addresses(layout, kind)
+            addresses.extend(of_kind)
+            kinds.append(np.full(len(of_kind), code, dtype=np.uint8))
+            indexes.append(np.arange(len(of_kind), dtype=np.int32))
+
+        def column(attribute: str, dtype) -> np.ndarray:
+            return np.fromiter(
+                (getattr(address, attribute) for address in addresses),
+                dtype=dtype,
+                count=len(addresses),
+            )
+
+        return cls(
+            kind=np.concatenate(kinds),
+            index=np.concatenate(indexes),
+            avenue=column("avenue_number", np.int32),
+            street=column("street_number", np.int32),
+            avenues_spread=column("avenues_spread", np.int16),
+            streets_spread=column("streets_spread", np.int16),
+            names={
+                row: address.name
+                for row, address in enumerate(addresses)
+                if address.name is not None
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays."""
+        return sum(
+            column.nbytes
+            for column in (
+                self.kind,
+                self.index,
+                self.avenue,
+                self.street,
+                self.avenues_spread,
+                self.streets_spread,
+            )
+        )
+
+    def address(self, row: int) -> Address:
+        """Get the address of one row."""
+        return Address(
+            int(self.avenue[row]),
+            int(self.street[row]),
+            self.names.get(row),
+            int(self.avenues_spread[row]),
+            int(self.streets_spread[row]),
+        )
+
+    def rects(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the bounds of every row, computed once.
+
+        Same arithmetic as address_bounds, so each value is exactly what it
+        gives for that row's address.
+
+        Returns:
+            tuple: (left, right, bottom, top) arrays of map coordinates
+        """
+        if self._rects is None:
+            right = MAP_OFFSET_X + (AVENUES + 1 - self.avenue) * AVENUE_WIDTH
+            left = right - self.avenues_spread * AVENUE_WIDTH
+            bottom = MAP_OFFSET_Y + (self.street // 5 - 1) * STREET_HEIGHT
+            top = bottom + (self.streets_spread // 5) * STREET_HEIGHT
+            self._rects = tuple(
+                np.asarray(edge, dtype=np.float64)
+                for edge in (left, right, bottom, top)
+            )
+        return self._rects
+
+    def centers(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the center x and y of every row."""
+        left, right, bottom, top = self.rects()
+        return (left + right) / 2, (bottom + top) / 2
+
+    def in_view(
+        self, left: float, right: float, bottom: float, top: float
+    ) -> np.ndarray:
+        """
+        Get the rows overlapping a view of the map.
+
+        Args:
+            left, right, bottom, top: Edges of the view in map coordinates
+
+        Returns:
+            np.ndarray: Row numbers, in table order
+        """
+        row_left, row_right, row_bottom, row_top = self.rects()
+        return np.flatnonzero(
+            (row_left < right)
+            & (left < row_right)
+            & (row_bottom < top)
+            & (bottom < row_top)
+        )
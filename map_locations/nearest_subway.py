@@ -0,0 +1,126 @@
+"""Nearest-subway lookups precomputed from the map.
+
+Subway teleports always go to the subway closest to the current pickup or
+delivery location. Those locations never move, so the answer for each of
+them is worked out once when the table is built. Arbitrary points are
+answered from a short list of candidate subways per grid cell, built the
+first time a point in that cell is asked about.
+
+Answers match a scan over every subway in map order: the closest center by
+math.hypot, the earliest subway on a tie.
+"""
+
+import math
+from typing import TYPE_CHECKING, Iterable
+
+from map_locations.spatial_index import Cell, SpatialIndex
+
+if TYPE_CHECKING:
+    from map_locations.game_map import MapLocation
+
+# Extra distance allowed when pruning candidates, so float rounding can't
+# drop a subway that ties for closest
+_PRUNE_SLACK = 1e-6
+
+
+class NearestSubwayTable:
+    """Closest subway by destination location and by grid cell."""
+
+    def __init__(
+        self, subway_index: SpatialIndex, destinations: Iterable["MapLocation"]
+    ):
+        """
+        Build the table.
+
+        Args:
+            subway_index: Spatial index over the map's subways, in map order
+            destinations: Locations that orders send the player to
+        """
+        self.subway_index = subway_index
+        self._by_location: dict[MapLocation, MapLocation | None] = {
+            destination: subway_index.nearest(
+                destination.center_x, destination.center_y
+            )
+            for destination in destinations
+        }
+        # Candidate subways, in map order, for points in each grid cell
+        self._by_cell: dict[Cell, list[MapLocation]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_location)
+
+    def for_location(self, destination: "MapLocation") -> "MapLocation | None":
+        """Get the subway closest to a location, from the table when known."""
+        try:
+            return self._by_location[destination]
+        except KeyError:
+            return self.for_point(destination.center_x, destination.center_y)
+
+    def for_point(self, x: float, y: float) -> "MapLocation | None":
+        """Get the subway closest to an arbitrary point."""
+        cell = self.subway_index.cell_of(x, y)
+        candidates = self._by_cell.get(cell)
+        if candidates is None:
+            candidates = self._by_cell[cell] = self._cell_candidates(cell)
+
+        best = None
+        best_distance = math.inf
+        # Candidates are in map order, so strict < keeps the earliest on a tie
+        for subway in candidates:
+            distance = math.hypot(subway.center_x - x, subway.center_y - y)
+            if distance < best_distance:
+                best = subway
+                best_distance = distance
+        return best
+
+    def _cell_candidates(self, cell: Cell) -> list["MapLocation"]:
+        """Subways that are closest to at least one point of a cell."""
+        index = self.subway_index
+        left = index.origin_x + cell[0] * index.cell_width
+        bottom = index.origin_y + cell[1] * index.cell_height
+        right = left + index.cell_width
+        top = bottom + index.cell_height
+        center_x = (left + right) / 2
+        center_y = (bottom + top) / 2
+        half_diagonal = math.hypot(index.cell_width, index.cell_height) / 2
+
+        nearest = index.nearest(center_x, center_y)
+        if nearest is None:
+            return []
+
+        # Every point of the cell is within reach of this distance of some subway,
+        # so subways that can't get closer than it to the cell never win
+        reach = (
+            math.hypot(nearest.center_x - center_x, nearest.center_y - center_y)
+            + half_diagonal
+        )
+        nearby = index.within_radius(
+            center_x, center_y, reach + half_diagonal + _PRUNE_SLACK
+        )
+        farthest = min(
+            _farthest_distance(subway, left, right, bottom, top) for subway in nearby
+        )
+        return [
+            subway
+            for subway in nearby
+            if _closest_distance(subway, left, right, bottom, top)
+            <= farthest + _PRUNE_SLACK
+        ]
+
+
+def _closest_distance(
+    location: "MapLocation", left: float, right: float, bottom: float, top: float
+) -> float:
+    """Distance from a location's center to the nearest point of a rectangle."""
+    dx = max(left - location.center_x, 0.0, location.center_x - right)
+    dy = max(bottom - location.center_y, 0.0, location.center_y - top)
+    return math.hypot(dx, dy)
+
+
+def _farthest_distance(
+    location: "MapLocation", left: float, right: float, bottom: float, top: float
+) -> float:
+    """Distance from a location's center to the farthest corner of a rectangle."""
+    dx = max(abs(location.center_x - left), abs(location.center_x - right))
+    dy = max(abs(location.center_y - bottom), abs(location.center_y - top))
+    return math.hypot(dx, dy)
@@ -0,0 +1,179 @@
+"""Weighted (pizza shop, home) pairs for order generation.
+
+Every pickup/delivery pair is weighted by how long walking between them
+takes, along a difficulty curve centred on ORDER_TARGET_TRAVEL_TIME, so a
+trip across the street is as rare as one across town. Pairs are drawn from
+an alias table (Vose's method): one uniform number picks a column and
+settles between its two pairs, so a draw costs the same however many pairs
+the map has.
+
+The table is built from the map's routing graph once per map, and draws
+only ever consume one value from the caller's random generator. On big
+maps only pairs within a cutoff walking time are kept, found by searching
+out from each shop that far, since pairing everything grows with the
+square of the map.
+"""
+
+import math
+import random
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Sequence
+
+from constants import ORDER_TARGET_TRAVEL_TIME, ORDER_TRAVEL_TIME_SPREAD
+
+if TYPE_CHECKING:
+    # game_map builds its order table from this module
+    from map_locations.game_map import GameMap
+
+
+def difficulty_weight(
+    travel_time: float,
+    target: float = ORDER_TARGET_TRAVEL_TIME,
+    spread: float = ORDER_TRAVEL_TIME_SPREAD,
+) -> float:
+    """
+    Get the relative weight of an order from its walking time (a bell curve).
+
+    Args:
+        travel_time: Seconds of walking from pickup to delivery
+        target: Walking time drawn most often
+        spread: Seconds away from the target at which the weight drops to ~60%
+    """
+    return math.exp(-0.5 * ((travel_time - target) / spread) ** 2)
+
+
+class AliasTable:
+    """Draws indices in proportion to fixed weights in constant time."""
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        Build the table.
+
+        Args:
+            weights: Non-negative weight of each index, not all zero
+        """
+        total = sum(weights)
+        if not weights or total <= 0 or min(weights) < 0:
+            raise ValueError("Weights must be non-negative and not all zero")
+
+        n = len(weights)
+        # Scale so the average column holds exactly 1
+        scaled = [weight * n / total for weight in weights]
+        self._keep = [1.0] * n
+        self._alias = list(range(n))
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large[-1]
+            # Top up the short column with the rest of a tall one
+            self._keep[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(large.pop())
+        # Leftovers are full columns, give or take float rounding
+
+    def __len__(self) -> int:
+        return len(self._keep)
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw an index using a single value from rng."""
+        column, fraction = divmod(rng.random() * len(self._keep), 1.0)
+        column = int(column)
+        return column if fraction < self._keep[column] else self._alias[column]
+
+    def probabilities(self) -> list[float]:
+        """Get the chance of drawing each index."""
+        n = len(self._keep)
+        chances = [keep / n for keep in self._keep]
+        for column, keep in enumerate(self._keep):
+            if keep < 1.0:
+                chances[self._alias[column]] += (1.0 - keep) / n
+        return chances
+
+
+class OrderTable:
+    """Every (pizza shop, home) pair of a map, drawn by difficulty."""
+
+    def __init__(
+        self,
+        game_map: "GameMap",
+        weight: Callable[[float], float] = difficulty_weight,
+        max_travel_time: float | None = None,
+    ):
+        """
+        Build the table.
+
+        Args:
+            game_map: Map whose shops and homes orders are made from
+            weight: Relative weight of a pair from its walking time in seconds
+            max_travel_time: Leave out pairs further apart than this many
+                seconds of walking; every pair is kept by default
+
+        Raises:
+            ValueError: If the map has no pair to make an order from
+        """
+        self.pairs: list[tuple[int, int]] = []
+        self.travel_times: list[float] = []
+        if max_travel_time is None:
+            self._add_all_pairs(game_map)
+        else:
+            self._add_nearby_pairs(game_map, max_travel_time)
+        if not self.pairs:
+            raise ValueError(
+                f"Map has no pizza shop and home pair to make orders from "
+                f"({len(game_map.pizza_shops)} shops, {len(game_map.homes)} homes)"
+            )
+        weights = [weight(time) for time in self.travel_times]
+        if not any(weights):
+            raise ValueError(
+                f"All {len(self.pairs)} pizza shop and home pairs of the map "
+                f"are too far apart to make orders from"
+            )
+        self._alias = AliasTable(weights)
+
+    def _add_all_pairs(self, game_map: "GameMap"):
+        """Add every pair, with the walking time from the shop to the home."""
+        routing = game_map.routing
+        for home_index, home in enumerate(game_map.homes):
+            times = routing.travel_times_to(home, use_subway=False)
+            for shop_index, shop in enumerate(game_map.pizza_shops):
+                self.pairs.append((shop_index, home_index))
+                self.travel_times.append(
+                    times[routing.node_at(shop.center_x, shop.center_y)]
+                )
+
+    def _add_nearby_pairs(self, game_map: "GameMap", max_travel_time: float):
+        """Add the pairs within max_travel_time, searching out from each shop."""
+        routing = game_map.routing
+        # Homes each node is within reach of
+        homes_at: dict[int, list[int]] = defaultdict(list)
+        for home_index, home in enumerate(game_map.homes):
+            for node in routing.nodes_in_reach(home):
+                homes_at[node].append(home_index)
+
+        # Walking costs the same both ways, so the walk from a shop to the
+        # nearest node in reach of a home is the travel_times_to() time
+        for shop_index, shop in enumerate(game_map.pizza_shops):
+            start = routing.node_at(shop.center_x, shop.center_y)
+            times = routing.walking_times_from(start, max_travel_time)
+            nearest: dict[int, float] = {}
+            for node, time in times.items():
+                for home_index in homes_at.get(node, ()):
+                    if time < nearest.get(home_index, math.inf):
+                        nearest[home_index] = time
+            for home_index in sorted(nearest):
+                self.pairs.append((shop_index, home_index))
+                self.travel_times.append(nearest[home_index])
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def sample(self, rng: random.Random) -> tuple[int, int]:
+        """Draw the (pizza shop index, home index) of an order."""
+        return self.pairs[self._alias.sample(rng)]
+
+    def probabilities(self) -> list[float]:
+        """Get the chance of drawing each pair, in the order of self.pairs."""
+        return self._alias.probabilities()
@@ -0,0 +1,334 @@
+"""Fastest routes over the avenue/street grid.
+
+Nodes are the centers of the AVENUE_WIDTH x STREET_HEIGHT blocks that
+addresses are laid out on, each joined to its four neighbours. Walking an
+edge takes half its length at the speed of one end and half at the other,
+where the speed at a node is the player's speed times the multiplier of
+the speed zone the player overlaps there, as in the simulation.
+
+Subway rides follow the game's rule: from within reach of any subway, the
+player is taken to the subway closest to the current destination. A ride
+takes no game time, so routes that use one only cost the $1 fare.
+
+Travel times are in seconds of game time.
+"""
+
+import heapq
+import math
+from typing import TYPE_CHECKING, NamedTuple
+
+from constants import (
+    AVENUE_WIDTH,
+    COLLISION_THRESHOLD,
+    DEFAULT_PLAYER_SPEED,
+    PLAYER_SIZE,
+    STREET_HEIGHT,
+)
+
+if TYPE_CHECKING:
+    # game_map builds its routing graph from this module
+    from map_locations.game_map import GameMap, MapLocation
+
+Node = int  # row * columns + column
+
+# Furthest a goal node can be, on the grid, from the point it is in reach of
+_GOAL_SLACK = COLLISION_THRESHOLD * math.sqrt(2)
+
+
+class Route(NamedTuple):
+    """Fastest way from a node to a destination."""
+
+    time: float
+    nodes: list[Node]
+    subway_rides: int
+
+
+class RoutingGraph:
+    """Grid graph over a map, with travel times and subway links."""
+
+    def __init__(
+        self,
+        game_map: "GameMap",
+        columns: int | None = None,
+        rows: int | None = None,
+        speed: float = DEFAULT_PLAYER_SPEED,
+    ):
+        """
+        Build the graph.
+
+        Args:
+            game_map: Map whose speed zones and subways the routes use
+            columns: Number of avenue blocks across the grid, the map's by default
+            rows: Number of street blocks up the grid, the map's by default
+            speed: Player speed in pixels per second outside speed zones
+        """
+        self.game_map = game_map
+        self.columns = columns = columns or game_map.grid.avenues + 1
+        self.rows = rows = rows or game_map.grid.streets + 1
+        self.origin_x, self.origin_y = game_map.grid.origin
+
+        # Seconds per pixel walked at each node
+        zones = game_map.spatial_index("speed_zones")
+        self._pace = []
+        for node in range(columns * rows):
+            x, y = self.position(node)
+            zone = zones.first_overlapping(x, y, PLAYER_SIZE / 2)
+            multiplier = 1.0 if zone is None else zone.speed_multiplier
+            self._pace.append(1 / (speed * multiplier))
+        self._fastest_pace = min(self._pace)
+
+        # Nodes close enough to a subway to ride it
+        subways = game_map.spatial_index("subways")
+        self._subway_entrances = [
+            node
+            for node in range(columns * rows)
+            if subways.within_radius(*self.position(node))
+        ]
+        # Travel times from every node, by (destination, use_subway)
+        self._times_to: dict[tuple[MapLocation, bool], list[float]] = {}
+
+    def __len__(self) -> int:
+        return self.columns * self.rows
+
+    def position(self, node: Node) -> tuple[float, float]:
+        """Get the map coordinates of a node."""
+        row, column = divmod(node, self.columns)
+        return (
+            self.origin_x + (column + 0.5) * AVENUE_WIDTH,
+            self.origin_y + (row + 0.5) * STREET_HEIGHT,
+        )
+
+    def node_at(self, x: float, y: float) -> Node:
+        """Get the node of the block containing a point, clamped to the grid."""
+        column = math.floor((x - self.origin_x) / AVENUE_WIDTH)
+        row = math.floor((y - self.origin_y) / STREET_HEIGHT)
+        column = min(max(column, 0), self.columns - 1)
+        row = min(max(row, 0), self.rows - 1)
+        return row * self.columns + column
+
+    def adjacent(self, node: Node, other: Node) -> bool:
+        """Check if two nodes are next to each other on the grid."""
+        row, column = divmod(node, self.columns)
+        other_row, other_column = divmod(other, self.columns)
+        return abs(row - other_row) + abs(column - other_column) == 1
+
+    def _neighbours(self, node: Node):
+        """Yield (neighbour, seconds to walk there) for each adjacent node."""
+        row, column = divmod(node, self.columns)
+        pace = self._pace
+        if column > 0:
+            yield node - 1, AVENUE_WIDTH / 2 * (pace[node] + pace[node - 1])
+        if column < self.columns - 1:
+            yield node + 1, AVENUE_WIDTH / 2 * (pace[node] + pace[node + 1])
+        if row > 0:
+            other = node - self.columns
+            yield other, STREET_HEIGHT / 2 * (pace[node] + pace[other])
+        if row < self.rows - 1:
+            other = node + self.columns
+            yield other, STREET_HEIGHT / 2 * (pace[node] + pace[other])
+
+    def nodes_in_reach(self, destination: "MapLocation") -> set[Node]:
+        """Nodes within reach of a destination."""
+        x = destination.center_x
+        y = destination.center_y
+        radius_squared = COLLISION_THRESHOLD * COLLISION_THRESHOLD
+        # Only blocks whose centers are within the threshold on both axes
+        first_column = max(
+            math.floor((x - COLLISION_THRESHOLD - self.origin_x) / AVENUE_WIDTH), 0
+        )
+        last_column = min(
+            math.ceil((x + COLLISION_THRESHOLD - self.origin_x) / AVENUE_WIDTH),
+            self.columns - 1,
+        )
+        first_row = max(
+            math.floor((y - COLLISION_THRESHOLD - self.origin_y) / STREET_HEIGHT), 0
+        )
+        last_row = min(
+            math.ceil((y + COLLISION_THRESHOLD - self.origin_y) / STREET_HEIGHT),
+            self.rows - 1,
+        )
+        goals = set()
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                node = row * self.columns + column
+                node_x, node_y = self.position(node)
+                if (node_x - x) ** 2 + (node_y - y) ** 2 < radius_squared:
+                    goals.add(node)
+        # Off-grid destinations are reached at their closest node
+        if not goals:
+            goals.add(self.node_at(x, y))
+        return goals
+
+    def _subway_exit(self, destination: "MapLocation") -> Node | None:
+        """Node a subway ride towards a destination comes out at, if any."""
+        subway = self.game_map.nearest_subways.for_location(destination)
+        if subway is None:
+            return None
+        return self.node_at(subway.center_x, subway.center_y)
+
+    def fastest_route(
+        self, start: Node, destination: "MapLocation", use_subway: bool = True
+    ) -> Route:
+        """
+        Find the fastest route from a node to within reach of a destination (A*).
+
+        Args:
+            start: Node to start from
+            destination: Location to reach
+            use_subway: Whether the route may ride the subway
+        """
+        goals = self.nodes_in_reach(destination)
+        exit_node = self._subway_exit(destination) if use_subway else None
+        entrances = set(self._subway_entrances) if exit_node is not None else ()
+
+        target_x = destination.center_x
+        target_y = destination.center_y
+
+        def remaining(node: Node) -> float:
+            # Lower bound: walk the grid at the fastest pace, minus reach slack
+            x, y = self.position(node)
+            walk = abs(x - target_x) + abs(y - target_y)
+            if exit_node is not None:
+                exit_x, exit_y = self.position(exit_node)
+                walk = min(walk, abs(exit_x - target_x) + abs(exit_y - target_y))
+            return max(walk - _GOAL_SLACK, 0.0) * self._fastest_pace
+
+        times = {start: 0.0}
+        # Previous node on the fastest route, and whether it was a subway ride
+        came_from: dict[Node, tuple[Node, bool]] = {}
+        settled = set()
+        queue = [(remaining(start), start)]
+        while queue:
+            _, node = heapq.heappop(queue)
+            if node in settled:
+                continue
+            if node in goals:
+                return self._route(start, node, times[node], came_from)
+            settled.add(node)
+            time = times[node]
+            edges = [
+                (neighbour, cost, False) for neighbour, cost in self._neighbours(node)
+            ]
+            if node in entrances:
+                edges.append((exit_node, 0.0, True))
+            for neighbour, cost, ride in edges:
+                new_time = time + cost
+                if new_time < times.get(neighbour, math.inf):
+                    times[neighbour] = new_time
+                    came_from[neighbour] = (node, ride)
+                    heapq.heappush(queue, (new_time + remaining(neighbour), neighbour))
+        raise ValueError(f"{destination.name} can't be reached")
+
+    def walking_times_from(self, start: Node, max_time: float) -> dict[Node, float]:
+        """
+        Get the walking time from a node to every node within max_time of it (Dijkstra).
+
+        Searches only as far as max_time and isn't cached, so it stays cheap
+        on big maps.
+
+        Args:
+            start: Node to walk from
+            max_time: Furthest to search, in seconds
+        """
+        times = {start: 0.0}
+        queue = [(0.0, start)]
+        while queue:
+            time, node = heapq.heappop(queue)
+            if time > times[node]:
+                continue
+            for neighbour, cost in self._neighbours(node):
+                new_time = time + cost
+                if new_time <= max_time and new_time < times.get(neighbour, math.inf):
+                    times[neighbour] = new_time
+                    heapq.heappush(queue, (new_time, neighbour))
+        return times
+
+    @staticmethod
+    def _route(
+        start: Node, end: Node, time: float, came_from: dict[Node, tuple[Node, bool]]
+    ) -> Route:
+        nodes = [end]
+        rides = 0
+        while nodes[-1] != start:
+            previous, ride = came_from[nodes[-1]]
+            nodes.append(previous)
+            rides += ride
+        nodes.reverse()
+        return Route(time, nodes, rides)
+
+    def travel_times_to(
+        self, destination: "MapLocation", use_subway: bool = True
+    ) -> list[float]:
+        """
+        Get the fastest time from every node to a destination, cached (Dijkstra).
+
+        Args:
+            destination: Location to reach
+            use_subway: Whether routes may ride the subway
+        """
+        key = (destination, use_subway)
+        times = self._times_to.get(key)
+        if times is not None:
+            return times
+
+        exit_node = self._subway_exit(destination) if use_subway else None
+        times = [math.inf] * len(self)
+        queue = []
+        for goal in self.nodes_in_reach(destination):
+            times[goal] = 0.0
+            queue.append((0.0, goal))
+        heapq.heapify(queue)
+
+        # Walking edges cost the same both ways, so search back from the goals
+        while queue:
+            time, node = heapq.heappop(queue)
+            if time > times[node]:
+                continue
+            edges = self._neighbours(node)
+            if node == exit_node:
+                # Any subway entrance can ride here for free
+                edges = [
+                    *edges,
+                    *((entrance, 0.0) for entrance in self._subway_entrances),
+                ]
+            for neighbour, cost in edges:
+                new_time = time + cost
+                if new_time < times[neighbour]:
+                    times[neighbour] = new_time
+                    heapq.heappush(queue, (new_time, neighbour))
+
+        self._times_to[key] = times
+        return times
+
+    def travel_time(
+        self,
+        origin: "MapLocation",
+        destination: "MapLocation",
+        use_subway: bool = True,
+    ) -> float:
+        """Get the fastest time from one location to within reach of another."""
+        start = self.node_at(origin.center_x, origin.center_y)
+        return self.travel_times_to(destination, use_subway)[start]
+
+    def all_pairs(
+        self, use_subway: bool = True
+    ) -> dict["MapLocation", dict["MapLocation", float]]:
+        """
+        Get travel times between every shop, home and subway, building them once.
+
+        Returns:
+            dict: Fastest time by origin, then by destination
+        """
+        locations = (
+            self.game_map.pizza_shops + self.game_map.homes + self.game_map.subways
+        )
+        starts = [
+            (origin, self.node_at(origin.center_x, origin.center_y))
+            for origin in locations
+        ]
+        table = {origin: {} for origin in locations}
+        for destination in locations:
+            times = self.travel_times_to(destination, use_subway)
+            for origin, start in starts:
+                table[origin][destination] = times[start]
+        return table
@@ -0,0 +1,265 @@
+"""Uniform-grid spatial index over map locations.
+
+Cells follow the avenue/street grid that addresses are laid out on (one
+AVENUE_WIDTH x STREET_HEIGHT block per cell), so a lookup touches a few
+neighbouring blocks instead of every location on the map. Nearest-location
+queries use a second, square grid sized to the number of locations, so sparse
+kinds like subways are found within a couple of rings.
+
+Query results are the same as a linear scan over the locations in the order
+they were added, including which location wins a tie.
+"""
+
+import math
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable
+
+from constants import (
+    AVENUE_WIDTH,
+    COLLISION_THRESHOLD,
+    MAP_OFFSET_X,
+    MAP_OFFSET_Y,
+    STREET_HEIGHT,
+)
+
+if TYPE_CHECKING:
+    # game_map builds its indexes from this module
+    from map_locations.game_map import MapLocation
+
+Cell = tuple[int, int]
+Entry = tuple[int, "MapLocation"]  # (order added, location)
+
+# Extra reach when bucketing by grown bounds, so float rounding at a cell
+# edge can't drop a candidate
+_EDGE_SLACK = 1e-6
+
+# Average number of locations per cell of the nearest-location grid
+_NEAREST_CELL_OCCUPANCY = 2
+
+
+class SpatialIndex:
+    """Locations bucketed by the grid cells they cover."""
+
+    def __init__(
+        self,
+        locations: Iterable["MapLocation"] = (),
+        cell_width: float = AVENUE_WIDTH,
+        cell_height: float = STREET_HEIGHT,
+        origin_x: float = MAP_OFFSET_X,
+        origin_y: float = MAP_OFFSET_Y,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            locations: Locations to add, in priority order
+            cell_width: Width of a grid cell, one avenue block by default
+            cell_height: Height of a grid cell, one street block by default
+            origin_x: X coordinate where cell column 0 starts
+            origin_y: Y coordinate where cell row 0 starts
+        """
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+
+        self._entries: list[Entry] = []
+        # Entries by the cell holding the location's center
+        self._centers: defaultdict[Cell, list[Entry]] = defaultdict(list)
+        # Entries by every cell the location's bounds, grown by a margin, cover;
+        # margin 0 always exists, others are built on first query
+        self._areas: dict[float, defaultdict[Cell, list[Entry]]] = {
+            0: defaultdict(list)
+        }
+        # Square grid for nearest queries, rebuilt lazily after adds
+        self._nearest_grid: _NearestGrid | None = None
+
+        for location in locations:
+            self.add(location)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        """Get the (column, row) of the cell containing a point."""
+        return (
+            math.floor((x - self.origin_x) / self.cell_width),
+            math.floor((y - self.origin_y) / self.cell_height),
+        )
+
+    def add(self, location: "MapLocation"):
+        """Add a location; earlier locations win ties in queries."""
+        entry = (len(self._entries), location)
+        self._entries.append(entry)
+        self._centers[self.cell_of(location.center_x, location.center_y)].append(entry)
+        for margin, areas in self._areas.items():
+            self._add_area(areas, entry, margin)
+        self._nearest_grid = None
+
+    def _add_area(
+        self, areas: defaultdict[Cell, list[Entry]], entry: Entry, margin: float
+    ):
+        """Bucket a location under every cell its grown bounds cover."""
+        location = entry[1]
+        if margin:
+            margin += _EDGE_SLACK
+        for cell in self._cells_covering(
+            location.left - margin,
+            location.right + margin,
+            location.bottom - margin,
+            location.top + margin,
+        ):
+            areas[cell].append(entry)
+
+    def _areas_with_margin(self, margin: float) -> defaultdict[Cell, list[Entry]]:
+        """Get the location buckets for bounds grown by margin."""
+        areas = self._areas.get(margin)
+        if areas is None:
+            areas = self._areas[margin] = defaultdict(list)
+            for entry in self._entries:
+                self._add_area(areas, entry, margin)
+        return areas
+
+    def _cells_covering(
+        self, left: float, right: float, bottom: float, top: float
+    ) -> Iterable[Cell]:
+        """Every cell that a rectangle touches."""
+        min_column, min_row = self.cell_of(left, bottom)
+        max_column, max_row = self.cell_of(right, top)
+        for column in range(min_column, max_column + 1):
+            for row in range(min_row, max_row + 1):
+                yield column, row
+
+    def locations_at(self, x: float, y: float) -> list["MapLocation"]:
+        """Get the locations whose bounds contain a point."""
+        return [
+            location
+            for _, location in self._areas[0].get(self.cell_of(x, y), ())
+            if location.left <= x <= location.right
+            and location.bottom <= y <= location.top
+        ]
+
+    def first_overlapping(
+        self, x: float, y: float, half_size: float
+    ) -> "MapLocation | None":
+        """
+        Get the earliest added location whose bounds strictly overlap a square.
+
+        Args:
+            x: Center x of the square
+            y: Center y of the square
+            half_size: Half the side of the square, e.g. half the player's size
+        """
+        left = x - half_size
+        right = x + half_size
+        bottom = y - half_size
+        top = y + half_size
+        areas = self._areas.get(half_size)
+        if areas is None:
+            areas = self._areas_with_margin(half_size)
+        # Buckets hold bounds grown by half_size, so only the center's cell matters
+        cell = (
+            math.floor((x - self.origin_x) / self.cell_width),
+            math.floor((y - self.origin_y) / self.cell_height),
+        )
+        for _, location in areas.get(cell, ()):
+            if (
+                location.left < right
+                and left < location.right
+                and location.bottom < top
+                and bottom < location.top
+            ):
+                return location
+        return None
+
+    def within_radius(
+        self, x: float, y: float, radius: float = COLLISION_THRESHOLD
+    ) -> list["MapLocation"]:
+        """Get the locations whose center is closer than radius to a point."""
+        radius_squared = radius * radius
+        found = []
+        for cell in self._cells_covering(
+            x - radius, x + radius, y - radius, y + radius
+        ):
+            for entry in self._centers.get(cell, ()):
+                location = entry[1]
+                dx = location.center_x - x
+                dy = location.center_y - y
+                if dx * dx + dy * dy < radius_squared:
+                    found.append(entry)
+        found.sort(key=lambda entry: entry[0])
+        return [location for _, location in found]
+
+    def nearest(self, x: float, y: float) -> "MapLocation | None":
+        """Get the location whose center is closest to a point."""
+        if not self._entries:
+            return None
+        if self._nearest_grid is None:
+            self._nearest_grid = _NearestGrid(self._entries)
+        return self._nearest_grid.nearest(x, y)
+
+
+class _NearestGrid:
+    """Square cells over location centers, searched ring by ring."""
+
+    def __init__(self, entries: list[Entry]):
+        xs = [location.center_x for _, location in entries]
+        ys = [location.center_y for _, location in entries]
+        self.min_x = min(xs)
+        self.min_y = min(ys)
+        width = max(xs) - self.min_x
+        height = max(ys) - self.min_y
+        # Size cells so each holds a couple of locations on average
+        area = max(width, 1.0) * max(height, 1.0)
+        self.size = max(math.sqrt(area * _NEAREST_CELL_OCCUPANCY / len(entries)), 1.0)
+        self.columns = math.floor(width / self.size) + 1
+        self.rows = math.floor(height / self.size) + 1
+
+        self.cells: defaultdict[Cell, list[Entry]] = defaultdict(list)
+        for entry in entries:
+            location = entry[1]
+            self.cells[self.cell_of(location.center_x, location.center_y)].append(entry)
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        return (
+            math.floor((x - self.min_x) / self.size),
+            math.floor((y - self.min_y) / self.size),
+        )
+
+    def nearest(self, x: float, y: float) -> "MapLocation":
+        # Points off the grid start from the closest grid cell
+        column, row = self.cell_of(x, y)
+        column = min(max(column, 0), self.columns - 1)
+        row = min(max(row, 0), self.rows - 1)
+        # Rings past this one hold no cells with locations
+        max_ring = max(column, self.columns - 1 - column, row, self.rows - 1 - row)
+
+        best = None
+        best_distance = math.inf
+        for ring in range(max_ring + 1):
+            # Anything in this ring or beyond is more than (ring - 1) cells away
+            if best_distance < (ring - 1) * self.size:
+                break
+            for cell in _ring(column, row, ring):
+                for entry in self.cells.get(cell, ()):
+                    location = entry[1]
+                    distance = math.hypot(location.center_x - x, location.center_y - y)
+                    if distance < best_distance or (
+                        distance == best_distance and entry[0] < best[0]
+                    ):
+                        best = entry
+                        best_distance = distance
+        return best[1]
+
+
+def _ring(column: int, row: int, ring: int) -> Iterable[Cell]:
+    """Cells exactly `ring` steps away from a cell (Chebyshev distance)."""
+    if ring == 0:
+        yield column, row
+        return
+    for offset in range(-ring, ring + 1):
+        yield column + offset, row - ring
+        yield column + offset, row + ring
+    for offset in range(-ring + 1, ring):
+        yield column - ring, row + offset
+        yield column + ring, row + offset
@@ -0,0 +1,81 @@
+"""Sprites that draw a map layout.
+
+Building them loads every location's texture (once per image, through
+map_locations.textures), so it only happens when a window is about to draw
+the map; game logic uses the plain records in game_map.py instead.
+"""
+
+from dataclasses import dataclass, field
+
+import arcade
+import pyglet
+
+from map_locations.base_models import Home, PizzaShop, SpeedMultiplierLocation, Subway
+from map_locations.layout import MapLayout
+from map_locations.textures import load_texture
+
+
+@dataclass
+class MapSprites:
+    """Sprites for every location on a map."""
+
+    pizza_shops: list[PizzaShop]
+    homes: list[Home]
+    speed_multiplier_locations: list[SpeedMultiplierLocation]
+    subways: list[Subway]
+    # Locations drawn under the speed zones' labels, in drawing order,
+    # uploaded to the GPU once and drawn in one call; locations never move
+    sprite_list: arcade.SpriteList = field(init=False, repr=False)
+    # Subways, drawn over the labels in a second call
+    subway_list: arcade.SpriteList = field(init=False, repr=False)
+    # The speed zones' labels, drawn together once laid out
+    _label_batch: pyglet.graphics.Batch | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        self.sprite_list = arcade.SpriteList(
+            capacity=len(self.pizza_shops)
+            + len(self.homes)
+            + len(self.speed_multiplier_locations)
+        )
+        self.sprite_list.extend(self.pizza_shops)
+        self.sprite_list.extend(self.homes)
+        self.sprite_list.extend(zone.block for zone in self.speed_multiplier_locations)
+        self.subway_list = arcade.SpriteList(capacity=len(self.subways))
+        self.subway_list.extend(self.subways)
+
+    def draw(self):
+        """Draw every location in three calls, however many there are.
+
+        Shops, homes and speed zones come first, then the speed zones' labels
+        in one batch, then the subways over them.
+        """
+        self.sprite_list.draw(pixelated=True)
+        if self.speed_multiplier_locations:
+            if self._label_batch is None:
+                self._label_batch = pyglet.graphics.Batch()
+                for zone in self.speed_multiplier_locations:
+                    zone.label.batch = self._label_batch
+            self._label_batch.draw()
+        self.subway_list.draw(pixelated=True)
+
+    @classmethod
+    def from_layout(cls, layout: MapLayout) -> "MapSprites":
+        """Build the sprites for a layout, loading their textures."""
+        return cls(
+            pizza_shops=[
+                PizzaShop(spec.address, load_texture(spec.logo_path))
+                for spec in layout.pizza_shops
+            ],
+            homes=[Home(address) for address in layout.homes],
+            speed_multiplier_locations=[
+                SpeedMultiplierLocation(
+                    address=spec.address,
+                    speed_multiplier=spec.speed_multiplier,
+                    block_color=spec.block_color,
+                )
+                for spec in layout.speed_zones
+            ],
+            subways=[Subway(address) for address in layout.subways],
+        )
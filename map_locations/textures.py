@@ -0,0 +1,84 @@
+"""Process-wide registry of the textures the map and player are drawn with.
+
+arcade.load_texture decodes the image and works out its hit box on every
+call. Sprites get their textures from here instead, so each image file is
+decoded once and every sprite drawing it shares the same Texture. Shared
+textures take one region of the window's texture atlas, which
+add_to_atlas fills before the first frame so drawing never uploads images.
+"""
+
+from pathlib import Path
+
+import arcade
+from arcade.texture_atlas.base import TextureAtlasBase
+
+# Bytes per decoded pixel (textures are RGBA)
+_BYTES_PER_PIXEL = 4
+
+
+class TextureRegistry:
+    """Loads each image once and hands out the shared texture."""
+
+    def __init__(self):
+        self._textures: dict[Path, arcade.Texture] = {}
+        self.requests = 0
+        self.bytes_loaded = 0
+        self.bytes_saved = 0
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    @property
+    def loads(self) -> int:
+        """Number of images decoded."""
+        return len(self._textures)
+
+    def get(self, path: str | Path) -> arcade.Texture:
+        """
+        Get the texture of an image file, loading it on first use.
+
+        Args:
+            path: Image file, relative to the working directory
+        """
+        key = Path(path)
+        self.requests += 1
+        texture = self._textures.get(key)
+        if texture is None:
+            texture = arcade.load_texture(key)
+            self._textures[key] = texture
+            self.bytes_loaded += self._size(texture)
+        else:
+            self.bytes_saved += self._size(texture)
+        return texture
+
+    @staticmethod
+    def _size(texture: arcade.Texture) -> int:
+        return texture.image.width * texture.image.height * _BYTES_PER_PIXEL
+
+    def add_to_atlas(self, atlas: TextureAtlasBase):
+        """Pack every loaded texture into an atlas, e.g. the window's default one."""
+        for texture in self._textures.values():
+            atlas.add(texture)
+
+    def summary(self) -> str:
+        """Describe how many loads sharing textures avoided."""
+        return (
+            f"{self.loads} images decoded for {self.requests} textures "
+            f"({self.bytes_loaded / 1e6:.1f} MB), "
+            f"{self.bytes_saved / 1e6:.1f} MB of repeat decoding saved"
+        )
+
+    def clear(self):
+        """Forget every texture and reset the counters."""
+        self._textures.clear()
+        self.requests = 0
+        self.bytes_loaded = 0
+        self.bytes_saved = 0
+
+
+TEXTURES = TextureRegistry()
+
+
+def load_texture(path: str | Path) -> arcade.Texture:
+    """Get the shared texture of an image file from the process-wide registry."""
+    return TEXTURES.get(path)
@@ -1,3 +1,5 @@
+import argparse
+
 import arcade
 
 from gameplay.game import PizzaDeliveryGame
@@ -5,7 +7,17 @@ from gameplay.game import PizzaDeliveryGame
 
 def main():
     """Main function."""
-    PizzaDeliveryGame()
+    parser = argparse.ArgumentParser(description="Play NYC Pizza Delivery.")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each frame; F3 toggles the overlay, F4 saves a trace",
+    )
+    parser.add_argument(
+        "--map", help="map file to play on, maps/manhattan.json by default"
+    )
+    args = parser.parse_args()
+    PizzaDeliveryGame(profile=args.profile, map_path=args.map)
     arcade.run()
 
 
@@ -4,12 +4,22 @@ from .final_score_dialog import draw_final_score
 from .game_instructions_dialog import draw_game_instructions_dialog
 from .leaderboard_dialog import draw_leaderboard_dialog
 from .manhattan_grid import draw_manhattan_grid
+from .map_chunks import MapChunks
 from .name_input_dialog import draw_name_input_dialog
+from .order_info import draw_order_info
+from .profiler_overlay import draw_profiler_overlay
+from .static_layer import StaticLayer
+from .text_layer import TextLayer
 
 __all__ = [
+    "MapChunks",
+    "StaticLayer",
+    "TextLayer",
     "draw_final_score",
     "draw_game_instructions_dialog",
     "draw_leaderboard_dialog",
     "draw_manhattan_grid",
     "draw_name_input_dialog",
+    "draw_order_info",
+    "draw_profiler_overlay",
 ]
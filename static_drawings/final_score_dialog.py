@@ -6,6 +6,10 @@ import arcade
 
 from backend.db.models import Session
 from constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from static_drawings.text_layer import TextLayer
+
+# Labels of this dialog, kept between frames
+_text = TextLayer()
 
 
 def draw_final_score(
@@ -45,7 +49,7 @@ def draw_final_score(
     )
 
     # Draw title
-    arcade.draw_text(
+    _text.draw_text(
         "GAME OVER!",
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 60,
@@ -57,7 +61,7 @@ def draw_final_score(
     )
 
     # Draw player name
-    arcade.draw_text(
+    _text.draw_text(
         f"Player: {player_name}",
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 120,
@@ -68,7 +72,7 @@ def draw_final_score(
     )
 
     # Draw financial breakdown
-    arcade.draw_text(
+    _text.draw_text(
         f"Earned: ${earned}",
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 150,
@@ -78,7 +82,7 @@ def draw_final_score(
         anchor_y="center",
     )
 
-    arcade.draw_text(
+    _text.draw_text(
         f"Spent: ${spent}",
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 175,
@@ -88,7 +92,7 @@ def draw_final_score(
         anchor_y="center",
     )
 
-    arcade.draw_text(
+    _text.draw_text(
         f"Net Income: ${score}",
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 200,
@@ -102,7 +106,7 @@ def draw_final_score(
     # Draw instructions
     instruction_text = "Press L to show leaderboard | Press R to restart | ESC to exit"
 
-    arcade.draw_text(
+    _text.draw_text(
         instruction_text,
         dialog_x + dialog_width // 2,
         dialog_y + 30,
@@ -111,3 +115,5 @@ def draw_final_score(
         anchor_x="center",
         anchor_y="center",
     )
+
+    _text.draw()
@@ -3,6 +3,10 @@
 import arcade
 
 from constants import GAME_DURATION, SCREEN_HEIGHT, SCREEN_WIDTH
+from static_drawings.text_layer import TextLayer
+
+# Labels of this dialog, kept between frames
+_text = TextLayer()
 
 
 def draw_game_instructions_dialog(is_overlay=False):
@@ -31,7 +35,7 @@ def draw_game_instructions_dialog(is_overlay=False):
     )
 
     # Draw title
-    arcade.draw_text(
+    _text.draw_text(
         "Game Instructions",
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 40,
@@ -48,7 +52,7 @@ def draw_game_instructions_dialog(is_overlay=False):
     else:
         time_text = f"You have {GAME_DURATION} seconds to earn as much USD as possible!"
 
-    arcade.draw_text(
+    _text.draw_text(
         time_text,
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 80,
@@ -92,7 +96,7 @@ def draw_game_instructions_dialog(is_overlay=False):
             or instruction == "TIPS:"
         ):
             # Make headers bold
-            arcade.draw_text(
+            _text.draw_text(
                 instruction,
                 dialog_x + 20,
                 current_y,
@@ -105,7 +109,7 @@ def draw_game_instructions_dialog(is_overlay=False):
             pass
         else:
             # Regular instruction text
-            arcade.draw_text(
+            _text.draw_text(
                 instruction,
                 dialog_x + 20,
                 current_y,
@@ -120,7 +124,7 @@ def draw_game_instructions_dialog(is_overlay=False):
     else:
         instruction_text = "Press ENTER to start the game!"
 
-    arcade.draw_text(
+    _text.draw_text(
         instruction_text,
         dialog_x + dialog_width // 2,
         dialog_y + 10,
@@ -130,3 +134,5 @@ def draw_game_instructions_dialog(is_overlay=False):
         anchor_x="center",
         anchor_y="bottom",
     )
+
+    _text.draw()
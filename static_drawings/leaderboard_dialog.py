@@ -6,6 +6,10 @@ import arcade
 
 from backend.db.models import Session
 from constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from static_drawings.text_layer import TextLayer
+
+# Labels of this dialog, kept between frames
+_text = TextLayer()
 
 
 def draw_leaderboard_dialog(
@@ -36,7 +40,7 @@ def draw_leaderboard_dialog(
     )
 
     # Draw title
-    arcade.draw_text(
+    _text.draw_text(
         "🏆 LEADERBOARD 🏆",
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 50,
@@ -49,7 +53,7 @@ def draw_leaderboard_dialog(
 
     # Draw column headers
     header_y = dialog_y + dialog_height - 100
-    arcade.draw_text(
+    _text.draw_text(
         "Rank",
         dialog_x + 30,
         header_y,
@@ -59,7 +63,7 @@ def draw_leaderboard_dialog(
         anchor_y="center",
         bold=True,
     )
-    arcade.draw_text(
+    _text.draw_text(
         "Player",
         dialog_x + 100,
         header_y,
@@ -69,7 +73,7 @@ def draw_leaderboard_dialog(
         anchor_y="center",
         bold=True,
     )
-    arcade.draw_text(
+    _text.draw_text(
         "Net Income",
         dialog_x + 350,
         header_y,
@@ -79,7 +83,7 @@ def draw_leaderboard_dialog(
         anchor_y="center",
         bold=True,
     )
-    arcade.draw_text(
+    _text.draw_text(
         "Date",
         dialog_x + 480,
         header_y,
@@ -130,7 +134,7 @@ def draw_leaderboard_dialog(
         elif rank == 3:
             rank_text = "🥉"
 
-        arcade.draw_text(
+        _text.draw_text(
             rank_text,
             dialog_x + 30,
             entry_y,
@@ -145,7 +149,7 @@ def draw_leaderboard_dialog(
         player_name = session.player_name
         if len(player_name) > 15:
             player_name = player_name[:12] + "..."
-        arcade.draw_text(
+        _text.draw_text(
             player_name,
             dialog_x + 100,
             entry_y,
@@ -159,7 +163,7 @@ def draw_leaderboard_dialog(
         income_color = (
             arcade.color.GREEN if session.net_income >= 0 else arcade.color.RED
         )
-        arcade.draw_text(
+        _text.draw_text(
             f"${session.net_income:.0f}",
             dialog_x + 350,
             entry_y,
@@ -175,7 +179,7 @@ def draw_leaderboard_dialog(
             date_str = session.timestamp.strftime("%m/%d")
         else:
             date_str = "N/A"
-        arcade.draw_text(
+        _text.draw_text(
             date_str,
             dialog_x + 480,
             entry_y,
@@ -188,7 +192,7 @@ def draw_leaderboard_dialog(
         entry_y -= 25
 
     # Draw instructions
-    arcade.draw_text(
+    _text.draw_text(
         "Press L to close leaderboard",
         dialog_x + dialog_width // 2,
         dialog_y + 20,
@@ -215,7 +219,7 @@ def draw_leaderboard_dialog(
             )
 
             if current_rank:
-                arcade.draw_text(
+                _text.draw_text(
                     f"Your best: Rank #{current_rank} (${best_session.net_income:.0f})",
                     dialog_x + dialog_width // 2,
                     dialog_y + 50,
@@ -225,3 +229,5 @@ def draw_leaderboard_dialog(
                     anchor_y="center",
                     bold=True,
                 )
+
+    _text.draw()
@@ -0,0 +1,243 @@
+"""NYC Pizza Delivery Game - Map Chunks Drawing.
+
+Draws maps too big for the screen, as seen through a scrolling camera. The
+map is cut into chunks of MAP_CHUNK_AVENUES x MAP_CHUNK_STREETS blocks.
+A chunk's grid lines, street labels and locations are built the first time
+the camera sees it, as one shape list, one text batch and one sprite list,
+and only chunks overlapping the view are drawn, so a frame costs the same
+on a map of any size.
+
+Locations are sorted into chunks through a LocationTable, in one
+vectorized pass, so no sprite exists for a location until its chunk is
+seen. Built chunks are kept for when the camera comes back, up to
+MAP_CHUNK_CACHE_SIZE; the least recently seen are dropped first.
+"""
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import arcade
+import numpy as np
+import pyglet
+from arcade.shape_list import ShapeElementList, create_line
+
+from constants import (
+    AVENUE_WIDTH,
+    AVENUES,
+    MAP_CHUNK_AVENUES,
+    MAP_CHUNK_CACHE_SIZE,
+    MAP_CHUNK_STREETS,
+    MAP_OFFSET_X,
+    MAP_OFFSET_Y,
+    STREET_HEIGHT,
+)
+from map_locations import MapLayout, MapSprites
+from map_locations.location_table import KINDS, LocationTable
+
+ChunkKey = tuple[int, int]  # (column, row) of a chunk
+
+
+@dataclass
+class MapChunk:
+    """Grid lines, labels and locations of one chunk, ready to draw."""
+
+    lines: ShapeElementList
+    labels: pyglet.graphics.Batch
+    sprites: MapSprites
+    # Kept so the labels' vertices stay in the batch
+    texts: list[arcade.Text] = field(default_factory=list)
+
+
+class MapChunks:
+    """A map's chunks, built as the camera reaches them."""
+
+    def __init__(
+        self,
+        layout: MapLayout,
+        chunk_avenues: int = MAP_CHUNK_AVENUES,
+        chunk_streets: int = MAP_CHUNK_STREETS,
+        cache_size: int = MAP_CHUNK_CACHE_SIZE,
+    ):
+        """
+        Sort a layout's locations into chunks; no sprite is built yet.
+
+        Args:
+            layout: Map to draw
+            chunk_avenues: Avenue blocks across a chunk
+            chunk_streets: Street blocks up a chunk
+            cache_size: Most chunks kept built at once
+        """
+        self.grid = layout.grid
+        self.bounds = layout.grid.bounds
+        self.origin_x, self.origin_y = layout.grid.origin
+        self.chunk_avenues = chunk_avenues
+        self.chunk_streets = chunk_streets
+        self.chunk_width = chunk_avenues * AVENUE_WIDTH
+        self.chunk_height = chunk_streets * STREET_HEIGHT
+        self.cache_size = cache_size
+        left, right, bottom, top = self.bounds
+        self.columns = math.ceil((right - left) / self.chunk_width)
+        self.rows = math.ceil((top - bottom) / self.chunk_height)
+
+        # Rows of each chunk's locations, by the chunk their center is in,
+        # sorted out in one vectorized pass over the whole map
+        self._layout = layout
+        self._table = LocationTable.from_layout(layout)
+        row_left, row_right, row_bottom, row_top = self._table.rects()
+        # Furthest a location reaches out of its chunk
+        self._overhang = (
+            float(max((row_right - row_left).max(), (row_top - row_bottom).max()) / 2)
+            if len(self._table)
+            else 0.0
+        )
+        center_x, center_y = self._table.centers()
+        chunk_columns = np.clip(
+            np.floor((center_x - self.origin_x) / self.chunk_width), 0, self.columns - 1
+        ).astype(np.int64)
+        chunk_rows = np.clip(
+            np.floor((center_y - self.origin_y) / self.chunk_height), 0, self.rows - 1
+        ).astype(np.int64)
+        chunk_ids = chunk_rows * self.columns + chunk_columns
+        order = np.argsort(chunk_ids, kind="stable")
+        ids, starts = np.unique(chunk_ids[order], return_index=True)
+        self._rows: dict[ChunkKey, np.ndarray] = {
+            (int(chunk_id) % self.columns, int(chunk_id) // self.columns): rows
+            for chunk_id, rows in zip(ids, np.split(order, starts[1:]))
+        }
+
+        self._chunks: OrderedDict[ChunkKey, MapChunk] = OrderedDict()
+        # Chunks built so far, for profiling
+        self.builds = 0
+
+    def _chunk_layout(self, key: ChunkKey) -> MapLayout:
+        """Get the part of the layout drawn in a chunk."""
+        layout = MapLayout(grid=self.grid)
+        for row in self._rows.get(key, ()):
+            kind = KINDS[self._table.kind[row]]
+            entry = getattr(self._layout, kind)[self._table.index[row]]
+            getattr(layout, kind).append(entry)
+        return layout
+
+    def _chunk_at(self, x: float, y: float) -> ChunkKey:
+        """Get the chunk a point is in, clamped to the map."""
+        column = math.floor((x - self.origin_x) / self.chunk_width)
+        row = math.floor((y - self.origin_y) / self.chunk_height)
+        return (
+            min(max(column, 0), self.columns - 1),
+            min(max(row, 0), self.rows - 1),
+        )
+
+    def _build(self, key: ChunkKey) -> MapChunk:
+        """Lay out a chunk's grid lines, labels and location sprites."""
+        column, row = key
+        _, map_right, _, map_top = self.bounds
+        left = self.origin_x + column * self.chunk_width
+        bottom = self.origin_y + row * self.chunk_height
+        right = min(left + self.chunk_width, map_right)
+        top = min(bottom + self.chunk_height, map_top)
+
+        lines = ShapeElementList()
+        labels = pyglet.graphics.Batch()
+        texts = []
+        # Avenue and street lines starting in this chunk, numbered as in
+        # draw_manhattan_grid
+        first_avenue = AVENUES - self.grid.avenues + column * self.chunk_avenues
+        for i in range(first_avenue, first_avenue + self.chunk_avenues):
+            x = MAP_OFFSET_X + i * AVENUE_WIDTH
+            if x > map_right:
+                break
+            lines.append(create_line(x, bottom, x, top, arcade.color.DARK_GRAY, 3))
+            texts.append(
+                arcade.Text(
+                    f"{AVENUES + 1 - i}st Ave",
+                    x + 4,
+                    bottom + 4,
+                    arcade.color.BLACK,
+                    10,
+                    batch=labels,
+                )
+            )
+        first_street = row * self.chunk_streets
+        for i in range(first_street, first_street + self.chunk_streets):
+            y = MAP_OFFSET_Y + i * STREET_HEIGHT
+            if y > map_top:
+                break
+            lines.append(create_line(left, y, right, y, arcade.color.DARK_GRAY, 3))
+            texts.append(
+                arcade.Text(
+                    f"{(i + 1) * 5}th St",
+                    left + 4,
+                    y + 4,
+                    arcade.color.BLACK,
+                    10,
+                    batch=labels,
+                )
+            )
+
+        self.builds += 1
+        sprites = MapSprites.from_layout(self._chunk_layout(key))
+        return MapChunk(lines, labels, sprites, texts)
+
+    def visible_chunks(
+        self, left: float, right: float, bottom: float, top: float
+    ) -> list[MapChunk]:
+        """
+        Get the chunks a view of the map overlaps, building any not yet built.
+
+        Args:
+            left, right, bottom, top: Edges of the view in map coordinates
+
+        Returns:
+            list[MapChunk]: Chunks to draw, bottom row first
+        """
+        # Widen the view so locations hanging over from off-screen chunks show
+        margin = self._overhang
+        first_column, first_row = self._chunk_at(left - margin, bottom - margin)
+        last_column, last_row = self._chunk_at(right + margin, top + margin)
+
+        chunks = []
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                key = (column, row)
+                chunk = self._chunks.get(key)
+                if chunk is None:
+                    chunk = self._chunks[key] = self._build(key)
+                else:
+                    self._chunks.move_to_end(key)
+                chunks.append(chunk)
+
+        # Drop the least recently seen chunks, never ones in view
+        while len(self._chunks) > max(self.cache_size, len(chunks)):
+            self._chunks.popitem(last=False)
+        return chunks
+
+    def draw(self, left: float, right: float, bottom: float, top: float):
+        """Draw the part of the map in a view, given in map coordinates."""
+        map_left, map_right, map_bottom, map_top = self.bounds
+
+        # Rivers either side and the city blocks between them
+        for river_left, river_right in (
+            (map_left - MAP_OFFSET_X, map_left),
+            (map_right, map_right + MAP_OFFSET_X),
+        ):
+            river = arcade.LRBT(river_left, river_right, map_bottom, map_top)
+            arcade.draw_rect_filled(river, arcade.color.TEAL_BLUE)
+        blocks = arcade.LRBT(
+            max(left, map_left),
+            min(right, map_right),
+            max(bottom, map_bottom),
+            min(top, map_top),
+        )
+        if blocks.width > 0 and blocks.height > 0:
+            arcade.draw_rect_filled(blocks, arcade.color.LIGHT_GRAY)
+
+        # Each layer for every chunk before the next, so a chunk's lines
+        # never cover a neighbour's locations
+        chunks = self.visible_chunks(left, right, bottom, top)
+        for chunk in chunks:
+            chunk.lines.draw()
+        for chunk in chunks:
+            chunk.labels.draw()
+        for chunk in chunks:
+            chunk.sprites.draw()
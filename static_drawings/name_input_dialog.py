@@ -3,6 +3,10 @@
 import arcade
 
 from constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from static_drawings.text_layer import TextLayer
+
+# Labels of this dialog, kept between frames
+_text = TextLayer()
 
 
 def draw_name_input_dialog(name_input_text: str):
@@ -32,7 +36,7 @@ def draw_name_input_dialog(name_input_text: str):
 
     # Draw title
     title_text = "NYC Pizza Delivery Game"
-    arcade.draw_text(
+    _text.draw_text(
         title_text,
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 50,
@@ -44,7 +48,7 @@ def draw_name_input_dialog(name_input_text: str):
 
     # Draw instruction
     instruction_text = "Type your name:"
-    arcade.draw_text(
+    _text.draw_text(
         instruction_text,
         dialog_x + dialog_width // 2,
         dialog_y + dialog_height - 100,
@@ -74,7 +78,7 @@ def draw_name_input_dialog(name_input_text: str):
     display_text = name_input_text
     text_color = arcade.color.BLACK
 
-    arcade.draw_text(
+    _text.draw_text(
         display_text,
         input_x + 10,
         input_y + input_height // 2,
@@ -84,7 +88,7 @@ def draw_name_input_dialog(name_input_text: str):
     )
 
     # Draw instructions
-    arcade.draw_text(
+    _text.draw_text(
         "Press ENTER to start",
         dialog_x + dialog_width // 2,
         dialog_y + 30,
@@ -93,3 +97,5 @@ def draw_name_input_dialog(name_input_text: str):
         anchor_x="center",
         anchor_y="center",
     )
+
+    _text.draw()
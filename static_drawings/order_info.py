@@ -0,0 +1,56 @@
+"""Active order panel for the NYC Pizza Delivery Game sidebar."""
+
+import arcade
+
+from gameplay.orders import Order
+from static_drawings.text_layer import TextLayer
+
+# Labels of the order panel, kept between frames
+_text = TextLayer()
+
+
+def draw_order_info(order: Order, x: int, y: int, flash_timer: float) -> int:
+    """
+    Draw the order information and return the next y position.
+
+    Args:
+        order: Order to describe
+        x: X position to draw at
+        y: Y position to start drawing at
+        flash_timer: Timer for flashing colors
+
+    Returns:
+        Next y position after drawing
+    """
+    current_y = y
+
+    # Always show order, but alternate colors based on flash_timer
+    order_text = "ACTIVE ORDER:"
+    _text.draw_text(order_text, x, current_y, arcade.color.BLACK, 14, bold=True)
+
+    should_use_alt_color = (flash_timer % 1.0) < 0.5
+    pickup_color = arcade.color.RED if should_use_alt_color else arcade.color.ORANGE
+    delivery_color = arcade.color.BLUE if should_use_alt_color else arcade.color.CYAN
+
+    current_y -= 20
+
+    pickup_text = f"Pickup from {order.pickup_location.name}"
+    _text.draw_text(pickup_text, x, current_y, pickup_color, 12)
+    current_y -= 15
+
+    pickup_address = f"at {order.pickup_location.avenue_street_address}"
+    _text.draw_text(pickup_address, x, current_y, pickup_color, 12)
+    current_y -= 20
+
+    delivery_text = f"Deliver to {order.delivery_location.avenue_street_address}"
+    _text.draw_text(
+        delivery_text,
+        x,
+        current_y,
+        delivery_color,
+        12,
+        bold=True,
+    )
+
+    _text.draw()
+    return current_y
@@ -0,0 +1,59 @@
+"""Frame profiler overlay for the NYC Pizza Delivery Game."""
+
+import arcade
+
+from constants import SCREEN_HEIGHT
+from gameplay.frame_profiler import DRAW_CALLS, FRAME_INTERVAL, FrameProfiler
+from static_drawings.text_layer import TextLayer
+
+# Labels of the overlay, kept between frames
+_text = TextLayer()
+
+_LINE_HEIGHT = 16
+
+
+def draw_profiler_overlay(profiler: FrameProfiler):
+    """Draw rolling p50/p99 of each frame phase in the top left corner."""
+    summary = profiler.summary()
+    if not summary:
+        return
+
+    rows = [(FRAME_INTERVAL, "frame"), *((name, name) for name in profiler.phases)]
+    x = 10
+    top = SCREEN_HEIGHT - 10
+    height = (len(rows) + 2) * _LINE_HEIGHT + 10
+    background = arcade.LRBT(x - 5, x + 245, top - height, top)
+    arcade.draw_rect_filled(background, (0, 0, 0, 160))
+
+    current_y = top - _LINE_HEIGHT
+    _text.draw_text(
+        f"{f'last {profiler.window} frames':<16} {'p50':>8} {'p99':>8}",
+        x,
+        current_y,
+        arcade.color.WHITE,
+        10,
+        font_name="Courier New",
+    )
+    for name, label in rows:
+        current_y -= _LINE_HEIGHT
+        p50, p99 = summary.get(name, (0, 0))
+        _text.draw_text(
+            f"{label:<16} {p50 / 1e6:6.2f}ms {p99 / 1e6:6.2f}ms",
+            x,
+            current_y,
+            arcade.color.WHITE,
+            10,
+            font_name="Courier New",
+        )
+
+    current_y -= _LINE_HEIGHT
+    p50, p99 = summary[DRAW_CALLS]
+    _text.draw_text(
+        f"{'draw calls':<16} {p50:8d} {p99:8d}",
+        x,
+        current_y,
+        arcade.color.YELLOW,
+        10,
+        font_name="Courier New",
+    )
+    _text.draw()
@@ -0,0 +1,64 @@
+"""NYC Pizza Delivery Game - Static Layer Drawing.
+
+Caches the parts of the screen that never change (the grid, its labels,
+the locations, the sidebar background) in an offscreen framebuffer. They
+are drawn once and the framebuffer is copied to the screen every frame as
+one textured quad, so the static scene costs the same however much is in
+it. The cache is redrawn when the window's framebuffer changes size or
+invalidate() is called, e.g. after the map changes.
+"""
+
+from typing import Callable
+
+import arcade
+from arcade.gl import NEAREST, geometry
+
+
+class StaticLayer:
+    """Offscreen copy of the static scene, redrawn only when it changes."""
+
+    def __init__(self, window: arcade.Window, draw: Callable[[], None]):
+        """
+        Initialize the static layer.
+
+        Args:
+            window: Window the layer is drawn in
+            draw: Draws the static scene, as it would onto the screen
+        """
+        self.window = window
+        self._draw = draw
+        self._framebuffer: arcade.gl.Framebuffer | None = None
+        self._quad: arcade.gl.Geometry | None = None
+        self._stale = True
+        # Times the scene has been drawn into the cache
+        self.renders = 0
+
+    def invalidate(self):
+        """Redraw the static scene on the next frame."""
+        self._stale = True
+
+    def _render(self, size: tuple[int, int]):
+        """Draw the static scene into the offscreen framebuffer."""
+        ctx = self.window.ctx
+        if self._framebuffer is None or self._framebuffer.size != size:
+            self._framebuffer = ctx.framebuffer(
+                color_attachments=[
+                    ctx.texture(size, components=4, filter=(NEAREST, NEAREST))
+                ]
+            )
+        with self._framebuffer.activate():
+            self._framebuffer.clear(color=self.window.background_color)
+            self._draw()
+        self._stale = False
+        self.renders += 1
+
+    def draw(self):
+        """Draw the static scene, from the cache unless it's out of date."""
+        size = self.window.get_framebuffer_size()
+        if self._stale or self._framebuffer is None or self._framebuffer.size != size:
+            self._render(size)
+        if self._quad is None:
+            self._quad = geometry.quad_2d_fs()
+        # Copied pixel for pixel over the whole window, it covers the background
+        self._framebuffer.color_attachments[0].use(0)
+        self._quad.render(self.window.ctx.utility_textured_quad_program)
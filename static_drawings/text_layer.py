@@ -0,0 +1,83 @@
+"""NYC Pizza Delivery Game - Retained Text Drawing.
+
+arcade.draw_text shares one label between every string of the same style,
+so each call re-lays out its glyphs and flushes the GPU. A TextLayer keeps
+an arcade.Text per call instead: the n-th draw_text of a frame reuses the
+n-th label, so a string is only laid out again when it changes, and the
+whole layer is drawn as one pyglet batch.
+
+Labels are drawn when draw() is called, over whatever was drawn before,
+so call it where the text belongs in the frame, e.g. at the end of a
+dialog.
+"""
+
+from typing import Any
+
+import arcade
+import pyglet
+
+
+class TextLayer:
+    """Labels kept from frame to frame and drawn in one batch."""
+
+    def __init__(self):
+        self._batch: pyglet.graphics.Batch | None = None
+        self._labels: list[arcade.Text] = []
+        # Layout settings of each label; a label is rebuilt when they change
+        self._styles: list[tuple] = []
+        self._used = 0
+        # Number of labels laid out from scratch, for profiling
+        self.layouts = 0
+
+    def draw_text(
+        self,
+        text: str,
+        x: float,
+        y: float,
+        color: arcade.types.RGBOrA255 = arcade.color.WHITE,
+        font_size: float = 12,
+        **style: Any,
+    ) -> arcade.Text:
+        """
+        Add a label to this frame's text; takes the same arguments as arcade.draw_text.
+
+        Returns:
+            arcade.Text: The retained label
+        """
+        color = arcade.types.Color.from_iterable(color)
+        key = (font_size, tuple(sorted(style.items())))
+        index = self._used
+        self._used += 1
+
+        if index < len(self._labels) and self._styles[index] == key:
+            label = self._labels[index]
+            label.text = text  # No-op unless changed
+            if label.position != (x, y):
+                label.position = x, y
+            if label.color != color:
+                label.color = color
+            label.visible = True
+            return label
+
+        if self._batch is None:
+            self._batch = pyglet.graphics.Batch()
+        label = arcade.Text(text, x, y, color, font_size, batch=self._batch, **style)
+        self.layouts += 1
+        if index < len(self._labels):
+            self._labels[index].batch = None
+            self._labels[index] = label
+            self._styles[index] = key
+        else:
+            self._labels.append(label)
+            self._styles.append(key)
+        return label
+
+    def draw(self):
+        """Draw this frame's labels and start collecting the next frame's."""
+        # Labels not drawn this frame stay laid out for when they come back
+        for label in self._labels[self._used :]:
+            if label.visible:
+                label.visible = False
+        if self._batch is not None:
+            self._batch.draw()
+        self._used = 0
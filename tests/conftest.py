@@ -0,0 +1,13 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.db import connection
+from backend.server.fastapi_server import app
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """API client backed by a fresh database in a temporary directory"""
+    monkeypatch.setattr(connection, "DATABASE_PATH", str(tmp_path / "test.db"))
+    with TestClient(app, raise_server_exceptions=False) as test_client:
+        yield test_client
@@ -0,0 +1,95 @@
+import shutil
+from pathlib import Path
+
+from backend.db import connection
+
+
+def bulk_create(client, *sessions):
+    return client.post("/sessions/bulk", json={"sessions": list(sessions)})
+
+
+def bot_session(session_id, net_income=500.0, player_name="autopilot"):
+    return {
+        "player_name": player_name,
+        "session_id": session_id,
+        "earned": net_income,
+        "spent": 0.0,
+        "net_income": net_income,
+    }
+
+
+def play_session(client, session_id, player_name, net_income):
+    client.post(
+        "/sessions/", json={"player_name": player_name, "session_id": session_id}
+    )
+    client.put(f"/sessions/{session_id}", json={"net_income": net_income})
+
+
+def test_bulk_create_skips_existing_ids(client):
+    first = bulk_create(client, bot_session("bot-1"), bot_session("bot-2"))
+    resent = bulk_create(client, bot_session("bot-2"), bot_session("bot-3"))
+
+    assert first.json() == {"created": 2}
+    assert resent.json() == {"created": 1}
+    assert len(client.get("/sessions/player/autopilot").json()) == 3
+
+
+def test_bulk_sessions_stay_off_the_leaderboard(client):
+    play_session(client, "game-1", "alice", 50.0)
+    bulk_create(client, bot_session("bot-1", 900.0), bot_session("bot-2", 800.0))
+
+    leaderboard = client.get("/leaderboard/").json()
+
+    assert [entry["session_id"] for entry in leaderboard] == ["game-1"]
+
+
+def test_bulk_sessions_are_not_a_players_best_score(client):
+    play_session(client, "game-1", "alice", 50.0)
+    bulk_create(client, bot_session("bot-1", 900.0, player_name="alice"))
+
+    best = client.get("/leaderboard/player/alice").json()
+
+    assert best["session_id"] == "game-1"
+
+
+def test_player_with_only_bulk_sessions_has_no_best_score(client):
+    bulk_create(client, bot_session("bot-1"))
+
+    assert client.get("/leaderboard/player/autopilot").status_code == 404
+    players = client.post(
+        "/leaderboard/players", json={"player_names": ["autopilot", "alice"]}
+    )
+    assert players.json() == []
+
+
+def test_players_best_scores_skip_bulk_sessions(client):
+    play_session(client, "game-1", "alice", 50.0)
+    bulk_create(client, bot_session("bot-1", 900.0, player_name="alice"))
+
+    players = client.post("/leaderboard/players", json={"player_names": ["alice"]})
+
+    assert [entry["session_id"] for entry in players.json()] == ["game-1"]
+
+
+def test_migration_keeps_existing_sessions_ranked(tmp_path, monkeypatch):
+    # A database created before sessions had a ranked flag
+    migrations_dir = connection.MIGRATIONS_DIR
+    old_migrations = tmp_path / "migrations"
+    old_migrations.mkdir()
+    for path in Path(migrations_dir).glob("*.sql"):
+        if path.name < "006":
+            shutil.copy(path, old_migrations)
+    monkeypatch.setattr(connection, "DATABASE_PATH", str(tmp_path / "old.db"))
+    monkeypatch.setattr(connection, "MIGRATIONS_DIR", str(old_migrations))
+    connection.apply_migrations()
+    with connection.get_db_connection() as db:
+        db.execute(
+            "INSERT INTO sessions (player_name, session_id) VALUES ('alice', 'old-1')"
+        )
+
+    monkeypatch.setattr(connection, "MIGRATIONS_DIR", migrations_dir)
+    connection.apply_migrations()
+
+    with connection.get_db_connection() as db:
+        row = db.execute("SELECT ranked FROM sessions WHERE session_id = 'old-1'")
+        assert row.fetchone()["ranked"] == 1
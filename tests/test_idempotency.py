@@ -0,0 +1,77 @@
+from backend.server.idempotency_handler import IdempotencyHandler
+
+SESSION = {"player_name": "alice", "session_id": "session-1"}
+
+
+def create(client, body=SESSION, key="create-key"):
+    return client.post("/sessions/", json=body, headers={"Idempotency-Key": key})
+
+
+def update(client, body, key="update-key"):
+    return client.put(
+        f"/sessions/{SESSION['session_id']}",
+        json=body,
+        headers={"Idempotency-Key": key},
+    )
+
+
+def test_create_retry_replays_stored_response(client):
+    first = create(client)
+    retry = create(client)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert len(client.get("/sessions/").json()) == 1
+
+
+def test_update_retry_replays_stored_response(client):
+    create(client)
+    first = update(client, {"earned": 30.0, "spent": 5.0, "net_income": 25.0})
+    # A later write must not leak into the replayed response
+    client.put(f"/sessions/{SESSION['session_id']}", json={"earned": 50.0})
+    retry = update(client, {"earned": 30.0, "spent": 5.0, "net_income": 25.0})
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+
+
+def test_key_reused_with_different_body_conflicts(client):
+    create(client)
+    conflict = create(client, {**SESSION, "player_name": "mallory"})
+
+    assert conflict.status_code == 409
+    stored = client.get(f"/sessions/{SESSION['session_id']}").json()
+    assert stored["player_name"] == "alice"
+
+
+def test_key_is_scoped_to_method_and_path(client):
+    create(client, key="shared-key")
+    updated = update(client, {"earned": 10.0}, key="shared-key")
+
+    assert updated.status_code == 200
+    assert updated.json()["earned"] == 10.0
+
+
+def fail_save_response(monkeypatch):
+    """Make storing an idempotency record crash mid-transaction"""
+
+    def save_response(self, *args, **kwargs):
+        raise RuntimeError("crashed before the idempotency record was stored")
+
+    monkeypatch.setattr(IdempotencyHandler, "save_response", save_response)
+
+
+def test_create_is_rolled_back_without_its_idempotency_record(client, monkeypatch):
+    fail_save_response(monkeypatch)
+
+    assert create(client).status_code == 500
+    assert client.get(f"/sessions/{SESSION['session_id']}").status_code == 404
+
+
+def test_update_is_rolled_back_without_its_idempotency_record(client, monkeypatch):
+    create(client)
+    fail_save_response(monkeypatch)
+
+    assert update(client, {"earned": 30.0}).status_code == 500
+    stored = client.get(f"/sessions/{SESSION['session_id']}").json()
+    assert stored["earned"] == 0.0
@@ -0,0 +1,146 @@
+import base64
+import dataclasses
+
+import pytest
+
+from benchmarks.replay_benchmark import play_game
+from gameplay.input_trace import TRACE_VERSION, InputTrace
+from map_locations import default_game_map
+
+
+def create_session(client, session_id="session-1") -> int:
+    """Create a session and return the game seed the server issued to it"""
+    response = client.post(
+        "/sessions/", json={"player_name": "alice", "session_id": session_id}
+    )
+    assert response.status_code == 201
+    return response.json()["game_seed"]
+
+
+def final_update(trace: bytes, earned: float, spent: float) -> dict:
+    return {
+        "earned": earned,
+        "spent": spent,
+        "net_income": earned - spent,
+        "input_trace": base64.b64encode(trace).decode(),
+    }
+
+
+def play(seed: int):
+    """Play a full bot game and return its encoded trace, earned and spent"""
+    game = play_game(seed, default_game_map())
+    trace = InputTrace.from_simulation(game).to_bytes()
+    return trace, game.score_tracker.earned, game.score_tracker.spent
+
+
+@pytest.fixture
+def session(client):
+    """A created session and a game played with its seed"""
+    return play(create_session(client))
+
+
+def test_trace_played_with_the_session_seed_is_accepted(client, session):
+    trace, earned, spent = session
+    response = client.put(
+        "/sessions/session-1", json=final_update(trace, earned, spent)
+    )
+
+    assert response.status_code == 200
+    assert response.json()["earned"] == earned
+    assert response.json()["spent"] == spent
+
+
+def test_score_is_filled_in_from_the_replay(client, session):
+    trace, earned, spent = session
+    body = {"input_trace": base64.b64encode(trace).decode()}
+    response = client.put("/sessions/session-1", json=body)
+
+    assert response.status_code == 200
+    assert response.json()["net_income"] == earned - spent
+
+
+def test_verified_score_is_final(client, session):
+    trace, earned, spent = session
+    client.put("/sessions/session-1", json=final_update(trace, earned, spent))
+
+    checkpoint = client.patch(
+        "/sessions/session-1/checkpoint", json={"earned": 9999, "spent": 0}
+    )
+    update = client.put("/sessions/session-1", json={"earned": 9999})
+    resubmitted = client.put(
+        "/sessions/session-1", json=final_update(trace, earned, spent)
+    )
+
+    assert checkpoint.status_code == update.status_code == 409
+    assert resubmitted.status_code == 409
+    assert client.get("/sessions/session-1").json()["earned"] == earned
+
+
+def test_score_not_matching_the_replay_is_rejected(client, session):
+    trace, earned, spent = session
+    response = client.put(
+        "/sessions/session-1", json=final_update(trace, earned + 10, spent)
+    )
+
+    assert response.status_code == 400
+    assert "earned" in response.json()["detail"]
+    assert client.get("/sessions/session-1").json()["earned"] == 0.0
+
+
+def test_trace_is_rejected_for_another_session(client, session):
+    trace, earned, spent = session
+    create_session(client, "session-2")
+    response = client.put(
+        "/sessions/session-2", json=final_update(trace, earned, spent)
+    )
+
+    assert response.status_code == 400
+    assert "seed" in response.json()["detail"]
+
+
+def test_trace_played_with_another_seed_is_rejected(client):
+    seed = create_session(client)
+    trace, earned, spent = play(seed + 1)
+    response = client.put(
+        "/sessions/session-1", json=final_update(trace, earned, spent)
+    )
+
+    assert response.status_code == 400
+
+
+def test_trace_for_a_session_without_seed_is_rejected(client, session):
+    trace, earned, spent = session
+    client.post(
+        "/sessions/bulk",
+        json={"sessions": [{"player_name": "bot", "session_id": "bulk-1"}]},
+    )
+    response = client.put("/sessions/bulk-1", json=final_update(trace, earned, spent))
+
+    assert response.status_code == 400
+    assert "no game seed" in response.json()["detail"]
+
+
+def test_trace_of_an_older_version_is_rejected(client, session):
+    trace, earned, spent = session
+    old_trace = bytes([TRACE_VERSION - 1]) + trace[1:]
+    response = client.put(
+        "/sessions/session-1", json=final_update(old_trace, earned, spent)
+    )
+
+    assert response.status_code == 400
+    assert "older game rules" in response.json()["detail"]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [{"duration_ticks": 60}, {"map_digest": "0" * 16}],
+    ids=["short game", "unknown map"],
+)
+def test_trace_of_a_different_game_is_rejected(client, session, change):
+    trace, earned, spent = session
+    altered = dataclasses.replace(InputTrace.from_bytes(trace), **change).to_bytes()
+    response = client.put(
+        "/sessions/session-1", json=final_update(altered, earned, spent)
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,129 @@
+from datetime import datetime
+
+import pytest
+
+from backend.db.models import Session
+from backend.server.schemas import SessionCreate, SessionUpdate
+from backend.server.wire_format import (
+    MAX_STR_BYTES,
+    SESSION_MEDIA_TYPE,
+    WireFormatError,
+    decode_payload,
+    encode_session,
+    encode_session_update,
+    encode_sessions,
+)
+
+SESSION = Session(
+    player_name="alice",
+    session_id="session-1",
+    timestamp=datetime(2025, 9, 1, 12, 30, 15, 250),
+    earned=40.0,
+    spent=3.0,
+    net_income=37.0,
+    game_seed=1234,
+)
+BINARY = {"Content-Type": SESSION_MEDIA_TYPE, "Accept": SESSION_MEDIA_TYPE}
+
+
+def test_session_round_trips():
+    assert decode_payload(encode_session(SESSION)) == SESSION
+
+
+def test_session_without_timestamp_or_seed_round_trips():
+    session = Session(player_name="bob", session_id="session-2")
+    assert decode_payload(encode_session(session)) == session
+
+
+def test_session_list_round_trips():
+    sessions = [SESSION, SESSION.model_copy(update={"session_id": "session-2"})]
+    assert decode_payload(encode_sessions(sessions)) == sessions
+
+
+def test_session_update_keeps_only_the_fields_set():
+    update = SessionUpdate(earned=12.5, player_name="carol", input_trace=b"\x03\x00")
+    decoded = decode_payload(encode_session_update(update))
+
+    assert decoded == update
+    assert decoded.model_fields_set == {"earned", "player_name", "input_trace"}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [encode_session(SESSION), encode_sessions([SESSION, SESSION])],
+    ids=["session", "session list"],
+)
+def test_truncated_payload_is_rejected(payload):
+    for length in range(len(payload)):
+        with pytest.raises(WireFormatError):
+            decode_payload(payload[:length])
+
+
+def test_truncated_string_is_rejected():
+    # Cut inside session_id, after its length prefix
+    with pytest.raises(WireFormatError, match="past the end"):
+        decode_payload(encode_session(SESSION)[:-3])
+
+
+def test_truncated_input_trace_is_rejected():
+    payload = encode_session_update(SessionUpdate(input_trace=b"trace"))
+    with pytest.raises(WireFormatError, match="past the end"):
+        decode_payload(payload[:-1])
+
+
+def test_trailing_bytes_are_rejected():
+    with pytest.raises(WireFormatError, match="unexpected bytes"):
+        decode_payload(encode_session(SESSION) + b"\x00")
+
+
+def test_unsupported_version_is_rejected():
+    payload = encode_session(SESSION)
+    with pytest.raises(WireFormatError, match="version"):
+        decode_payload(b"\x01" + payload[1:])
+
+
+def test_invalid_utf8_is_rejected():
+    payload = encode_session(SESSION.model_copy(update={"session_id": "x"}))
+    with pytest.raises(WireFormatError):
+        decode_payload(payload[:-1] + b"\xff")
+
+
+def test_string_longer_than_its_length_prefix_is_not_encoded():
+    session = SESSION.model_copy(update={"player_name": "a" * (MAX_STR_BYTES + 1)})
+    with pytest.raises(WireFormatError, match="longer than"):
+        encode_session(session)
+
+
+def test_binary_create_round_trips_through_the_api(client):
+    body = encode_session(SessionCreate(player_name="alice", session_id="session-1"))
+    response = client.post("/sessions/", content=body, headers=BINARY)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == SESSION_MEDIA_TYPE
+    created = decode_payload(response.content)
+    assert created.session_id == "session-1"
+    assert created.game_seed is not None
+
+
+def test_truncated_binary_body_gets_400(client):
+    body = encode_session(SessionCreate(player_name="alice", session_id="session-1"))
+    response = client.post("/sessions/", content=body[:-2], headers=BINARY)
+
+    assert response.status_code == 400
+    assert client.get("/sessions/session-1").status_code == 404
+
+
+def test_binary_body_with_trailing_bytes_gets_400(client):
+    client.post("/sessions/", json={"player_name": "alice", "session_id": "session-1"})
+    body = encode_session_update(SessionUpdate(earned=99.0)) + b"\x00\x00"
+    response = client.put("/sessions/session-1", content=body, headers=BINARY)
+
+    assert response.status_code == 400
+    assert client.get("/sessions/session-1").json()["earned"] == 0.0
+
+
+def test_binary_body_of_the_wrong_kind_gets_400(client):
+    body = encode_session_update(SessionUpdate(player_name="alice"))
+    response = client.post("/sessions/", content=body, headers=BINARY)
+
+    assert response.status_code == 400